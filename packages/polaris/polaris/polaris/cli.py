@@ -11,6 +11,7 @@ from pydantic import ValidationError
 import polaris
 
 from .config import load_config
+from .core.client import http
 from .modules.schema import validate_agent
 
 logger = logging.getLogger(__name__)
@@ -166,7 +167,10 @@ async def main_async():
 
         logger.info("Starting agent '%s' with inputs: %s", args.agent, inputs)
         config = load_config().to_dict()
-        reply = await polaris.run(config, inputs, args.agent, agents)
+        try:
+            reply = await polaris.run(config, inputs, args.agent, agents)
+        finally:
+            await http.close()
         logger.info("Agent execution completed")
         print(json.dumps(reply.get("last"), indent=2))
 
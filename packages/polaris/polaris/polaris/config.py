@@ -3,9 +3,10 @@
 Loads configuration from environment variables with validation.
 """
 
+import json
 import logging
 import os
-from typing import Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -19,6 +20,23 @@ class PolarisConfig(BaseModel):
     ai_base_url: str = Field(default="http://localhost:11434/v1/", description="Base URL for AI API")
     ai_model: Optional[str] = Field(default=None, description="AI model to use")
     ai_rate_limit: int = Field(default=30, ge=1, description="Rate limit for LLM requests (per minute)")
+    ai_cache: Optional[Literal["memory", "sqlite"]] = Field(
+        default=None, description="Response cache backend for repeated LLM requests (None disables)"
+    )
+    ai_cache_path: Optional[str] = Field(default=None, description="SQLite file for the sqlite response cache")
+    ai_cache_ttl: float = Field(default=86400.0, gt=0, description="Seconds a cached LLM reply is reused")
+    ai_cache_size: int = Field(default=1024, ge=1, description="Maximum number of cached LLM replies")
+    api_cache: Optional[Literal["memory", "sqlite"]] = Field(
+        default=None, description="Cache backend for API reads shared between runs (None disables)"
+    )
+    api_cache_path: Optional[str] = Field(default=None, description="SQLite file for the sqlite API cache")
+    api_cache_ttl: float = Field(default=300.0, ge=0, description="Seconds results of ops without a rule are reused")
+    api_cache_size: int = Field(default=1024, ge=1, description="Maximum number of cached API results")
+    api_cache_rules: Optional[dict[str, dict[str, Any]]] = Field(
+        default=None, description="Cache rules by op name pattern (None for the defaults)"
+    )
+    http_pool_size: int = Field(default=100, ge=0, description="Maximum pooled HTTP connections (0 for no limit)")
+    http_keepalive_timeout: float = Field(default=30.0, gt=0, description="Seconds idle HTTP connections are kept open")
     galaxy_root: str = Field(default="http://localhost:8080/", description="Galaxy server URL")
     galaxy_key: Optional[str] = Field(default=None, description="Galaxy API key")
 
@@ -30,6 +48,15 @@ class PolarisConfig(BaseModel):
             raise ValueError(f"URL must start with http:// or https://, got: {v}")
         return v.rstrip("/") + "/"
 
+    @model_validator(mode="after")
+    def validate_cache_path(self) -> "PolarisConfig":
+        """Require a file for the sqlite response and API caches."""
+        if self.ai_cache == "sqlite" and not self.ai_cache_path:
+            raise ValueError("AI_CACHE_PATH is required for the sqlite response cache")
+        if self.api_cache == "sqlite" and not self.api_cache_path:
+            raise ValueError("API_CACHE_PATH is required for the sqlite API cache")
+        return self
+
     @model_validator(mode="after")
     def validate_api_key_available(self) -> "PolarisConfig":
         """Warn if no API key is available."""
@@ -49,6 +76,17 @@ class PolarisConfig(BaseModel):
             "ai_base_url": self.ai_base_url,
             "ai_model": self.ai_model,
             "ai_rate_limit": self.ai_rate_limit,
+            "ai_cache": self.ai_cache,
+            "ai_cache_path": self.ai_cache_path,
+            "ai_cache_ttl": self.ai_cache_ttl,
+            "ai_cache_size": self.ai_cache_size,
+            "api_cache": self.api_cache,
+            "api_cache_path": self.api_cache_path,
+            "api_cache_ttl": self.api_cache_ttl,
+            "api_cache_size": self.api_cache_size,
+            "api_cache_rules": self.api_cache_rules,
+            "http_pool_size": self.http_pool_size,
+            "http_keepalive_timeout": self.http_keepalive_timeout,
             "galaxy_root": self.galaxy_root,
             "galaxy_key": self.galaxy_key,
         }
@@ -62,6 +100,17 @@ def load_config() -> PolarisConfig:
         AI_BASE_URL: Base URL for AI API (default: http://localhost:11434/v1/)
         AI_MODEL: AI model to use
         AI_RATE_LIMIT: Rate limit in requests per minute
+        AI_CACHE: Response cache backend, "memory" or "sqlite" (default: disabled)
+        AI_CACHE_PATH: SQLite file for the sqlite response cache
+        AI_CACHE_TTL: Seconds a cached reply is reused (default: 86400)
+        AI_CACHE_SIZE: Maximum number of cached replies (default: 1024)
+        API_CACHE: API read cache backend, "memory" or "sqlite" (default: disabled)
+        API_CACHE_PATH: SQLite file for the sqlite API cache
+        API_CACHE_TTL: Seconds results of ops without a rule are reused (default: 300)
+        API_CACHE_SIZE: Maximum number of cached API results (default: 1024)
+        API_CACHE_RULES: JSON object of cache rules by op name pattern
+        HTTP_POOL_SIZE: Maximum pooled HTTP connections (default: 100)
+        HTTP_KEEPALIVE_TIMEOUT: Seconds idle HTTP connections are kept open (default: 30)
         GALAXY_ROOT: Galaxy server URL (default: http://localhost:8080/)
         GALAXY_KEY: Galaxy API key
 
@@ -76,6 +125,19 @@ def load_config() -> PolarisConfig:
         ai_base_url=os.environ.get("AI_BASE_URL") or "http://localhost:11434/v1/",
         ai_model=os.environ.get("AI_MODEL"),
         ai_rate_limit=int(os.environ["AI_RATE_LIMIT"]) if os.environ.get("AI_RATE_LIMIT") else 30,
+        ai_cache=os.environ.get("AI_CACHE") or None,  # type: ignore[arg-type]
+        ai_cache_path=os.environ.get("AI_CACHE_PATH"),
+        ai_cache_ttl=float(os.environ["AI_CACHE_TTL"]) if os.environ.get("AI_CACHE_TTL") else 86400.0,
+        ai_cache_size=int(os.environ["AI_CACHE_SIZE"]) if os.environ.get("AI_CACHE_SIZE") else 1024,
+        api_cache=os.environ.get("API_CACHE") or None,  # type: ignore[arg-type]
+        api_cache_path=os.environ.get("API_CACHE_PATH"),
+        api_cache_ttl=float(os.environ["API_CACHE_TTL"]) if os.environ.get("API_CACHE_TTL") else 300.0,
+        api_cache_size=int(os.environ["API_CACHE_SIZE"]) if os.environ.get("API_CACHE_SIZE") else 1024,
+        api_cache_rules=json.loads(os.environ["API_CACHE_RULES"]) if os.environ.get("API_CACHE_RULES") else None,
+        http_pool_size=int(os.environ["HTTP_POOL_SIZE"]) if os.environ.get("HTTP_POOL_SIZE") else 100,
+        http_keepalive_timeout=(
+            float(os.environ["HTTP_KEEPALIVE_TIMEOUT"]) if os.environ.get("HTTP_KEEPALIVE_TIMEOUT") else 30.0
+        ),
         galaxy_root=os.environ.get("GALAXY_ROOT") or "http://localhost:8080/",
         galaxy_key=os.environ.get("GALAXY_KEY"),
     )
@@ -2,11 +2,14 @@
 
 Provides adaptive HTTP client that works in both browser (Pyodide) and
 server environments with built-in retry logic for transient failures.
+Concurrent identical GET requests share one request in flight.
 """
 
 import asyncio
+import copy
 import json
 import logging
+import threading
 from typing import Any, Awaitable, Callable, TypeVar
 
 from .exceptions import HttpError
@@ -18,6 +21,11 @@ RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1.0  # seconds
 
+# Connection pool configuration (server client)
+POOL_SIZE = 100  # max open connections, 0 for no limit
+KEEPALIVE_TIMEOUT = 30.0  # seconds an idle connection is kept open
+DNS_CACHE_TTL = 300  # seconds
+
 T = TypeVar("T")
 
 
@@ -83,13 +91,52 @@ async def _retry_request(
 
 
 class HttpClient:
-    """Base HTTP client interface."""
+    """Base HTTP client interface.
+
+    GET requests without a body for the same URL and headers that are sent
+    while one is in flight wait for its response (single flight) instead of
+    sending their own. Each waiting caller gets a copy of the response, or
+    the same error; `coalesced` counts these requests.
+    """
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._in_flight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
 
     async def request(
         self, method: str, url: str, headers: dict[str, str] | None = None, body: Any = None
+    ) -> Any:
+        if method.upper() != "GET" or body is not None:
+            return await self._send(method, url, headers, body)
+
+        key = (asyncio.get_running_loop(), url, tuple(sorted((headers or {}).items())))
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            return copy.deepcopy(await asyncio.shield(in_flight))
+
+        task = asyncio.ensure_future(self._send(method, url, headers, body))
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded, so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _send(
+        self, method: str, url: str, headers: dict[str, str] | None = None, body: Any = None
     ) -> Any:
         raise NotImplementedError
 
+    def configure(
+        self,
+        pool_size: int | None = None,
+        keepalive_timeout: float | None = None,
+        dns_cache_ttl: int | None = None,
+    ) -> None:
+        """Set connection pool options; a no-op for clients without a pool."""
+
+    async def close(self) -> None:
+        """Release pooled connections; a no-op for clients without a pool."""
+
 
 def is_pyodide() -> bool:
     """Check if running in Pyodide (browser) environment."""
@@ -122,10 +169,11 @@ class BrowserHttpClient(HttpClient):
         from js import fetch  # type: ignore[import-not-found]
         from pyodide.ffi import to_js  # type: ignore[import-not-found]
 
+        super().__init__()
         self._fetch = fetch
         self._to_js = to_js
 
-    async def request(
+    async def _send(
         self, method: str, url: str, headers: dict[str, str] | None = None, body: Any = None
     ) -> Any:
         headers = headers or {}
@@ -154,14 +202,98 @@ class BrowserHttpClient(HttpClient):
 
 
 class ServerHttpClient(HttpClient):
-    """HTTP client for server environment using aiohttp."""
+    """HTTP client for server environment using aiohttp.
+
+    One session (and connection pool) is kept per process and reused by
+    every request and retry, so connections and TLS sessions stay open
+    between LLM and API calls. It is created lazily on first use and
+    recreated after close() or when used from another event loop.
+    """
 
     def __init__(self) -> None:
         import aiohttp
 
+        super().__init__()
         self._aiohttp = aiohttp
-
-    async def request(
+        self._session: Any = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.pool_size = POOL_SIZE
+        self.keepalive_timeout = KEEPALIVE_TIMEOUT
+        self.dns_cache_ttl = DNS_CACHE_TTL
+
+    def configure(
+        self,
+        pool_size: int | None = None,
+        keepalive_timeout: float | None = None,
+        dns_cache_ttl: int | None = None,
+    ) -> None:
+        """Set connection pool options.
+
+        Options apply to the next session, so call this before the first
+        request or after close().
+        """
+        if pool_size is not None:
+            self.pool_size = pool_size
+        if keepalive_timeout is not None:
+            self.keepalive_timeout = keepalive_timeout
+        if dns_cache_ttl is not None:
+            self.dns_cache_ttl = dns_cache_ttl
+
+    def _get_session(self) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            self._discard_session()
+        if self._session is None or self._session.closed:
+            connector = self._aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            self._session = self._aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+        return self._session
+
+    def _discard_session(self) -> None:
+        """Release a session created on another event loop.
+
+        It cannot be awaited from this loop, so it is closed on its own loop:
+        through run_coroutine_threadsafe if that loop runs in another thread,
+        or by running it in a helper thread if it is idle. Only a closed
+        loop can no longer run anything; its connector is then marked closed
+        with BaseConnector._close(), the synchronous close of aiohttp 3.x
+        (the transports themselves are released with the loop).
+        """
+        session, loop = self._session, self._loop
+        self._session, self._loop = None, None
+        if session.closed or loop is None:
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        if not loop.is_closed():
+            thread = threading.Thread(target=loop.run_until_complete, args=(session.close(),))
+            thread.start()
+            thread.join()
+            return
+        connector = session.connector
+        session.detach()
+        close = getattr(connector, "_close", None)
+        if close is not None:
+            close()
+
+    async def close(self) -> None:
+        """Close the pooled session once no requests are in flight.
+
+        The session is shared by the whole process, so this ends requests
+        of every registry using it; call it on shutdown. The next request
+        opens a new session.
+        """
+        session, self._session, self._loop = self._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def _send(
         self, method: str, url: str, headers: dict[str, str] | None = None, body: Any = None
     ) -> Any:
         data = None
@@ -171,18 +303,18 @@ class ServerHttpClient(HttpClient):
             headers.setdefault("Content-Type", "application/json")
 
         async def do_request() -> tuple[int, str, Any | None]:
-            async with self._aiohttp.ClientSession() as session:
-                async with session.request(
-                    method=method.upper(),
-                    url=url,
-                    headers=headers,
-                    data=data,
-                ) as response:
-                    if response.status < 400:
-                        parsed = await _parse_response(response)
-                        return response.status, "", parsed
-                    text = await response.text()
-                    return response.status, text, None
+            session = self._get_session()
+            async with session.request(
+                method=method.upper(),
+                url=url,
+                headers=headers,
+                data=data,
+            ) as response:
+                if response.status < 400:
+                    parsed = await _parse_response(response)
+                    return response.status, "", parsed
+                text = await response.text()
+                return response.status, text, None
 
         return await _retry_request(do_request, url, method)
 
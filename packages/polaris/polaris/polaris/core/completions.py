@@ -12,12 +12,8 @@ TEMPERATURE = 0.3
 TOP_P = 0.8
 
 
-async def completions_post(payload):
-    api_key = payload.get("ai_api_key")
-    base_url = payload.get("ai_base_url")
-    base_url = base_url.rstrip("/") if base_url else ""
-    url = f"{base_url}/chat/completions"
-
+def completions_body(payload):
+    """Build the chat completions request body for a payload."""
     body = {
         "model": payload.get("ai_model"),
         "messages": payload["messages"],
@@ -63,6 +59,15 @@ async def completions_post(payload):
                 "type": "function",
                 "function": {"name": tool_name},
             }
+    return body
+
+
+async def completions_post(payload):
+    api_key = payload.get("ai_api_key")
+    base_url = payload.get("ai_base_url")
+    base_url = base_url.rstrip("/") if base_url else ""
+    url = f"{base_url}/chat/completions"
+    body = completions_body(payload)
 
     headers = {"Content-Type": "application/json"}
     if api_key is not None:
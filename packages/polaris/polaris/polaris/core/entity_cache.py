@@ -0,0 +1,167 @@
+"""Cross-run cache for API reads.
+
+Datasets, jobs and histories are immutable once their job finishes, yet
+every run fetches them again. EntityCache keeps API results keyed by the
+resolved request URL (and the credentials sent with it), in the same
+memory or SQLite backends as the LLM response cache, so repeated reports
+on overlapping lineages are answered without calling the server.
+
+How long a result is reused depends on its op. A rule maps an op name
+pattern (fnmatch, e.g. "galaxy.jobs.*") to a ttl in seconds, and
+optionally to field values that make a result immutable, e.g. jobs in a
+terminal state. Immutable results never expire; a ttl of 0 disables
+caching for the op. Ops without a rule use the cache's default ttl.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .response_cache import (
+    CACHE_BACKENDS,
+    DEFAULT_MAX_ENTRIES,
+    MemoryResponseCache,
+    ResponseCache,
+    SqliteResponseCache,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 5 * 60  # seconds
+
+# Galaxy states after which jobs and datasets no longer change
+JOB_TERMINAL_STATES = ["ok", "error", "failed", "deleted", "stopped", "skipped"]
+DATASET_TERMINAL_STATES = ["ok", "error", "failed_metadata", "discarded"]
+
+# Only finished jobs and datasets are cached; others change between runs
+DEFAULT_RULES: Dict[str, Dict[str, Any]] = {
+    "galaxy.jobs.show.get": {"ttl": 0, "immutable": {"state": JOB_TERMINAL_STATES}},
+    "galaxy.datasets.show.get": {"ttl": 0, "immutable": {"state": DATASET_TERMINAL_STATES}},
+}
+
+
+def entity_key(url: str, headers: Optional[Dict[str, str]] = None) -> str:
+    """Return the cache key for a GET of url with the given headers."""
+    canonical = json.dumps([url, sorted((headers or {}).items())], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class EntityCache:
+    """Per-op expiry on top of a response cache backend.
+
+    Entries are stored as {"expires": epoch seconds or None, "value": ...};
+    the backend itself must not expire them.
+    """
+
+    def __init__(
+        self,
+        backend: ResponseCache,
+        ttl: float = DEFAULT_TTL,
+        rules: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.rules = DEFAULT_RULES if rules is None else rules
+        self.hits = 0
+        self.misses = 0
+
+    def _rule(self, op_name: str) -> Dict[str, Any]:
+        if op_name in self.rules:
+            return self.rules[op_name]
+        for pattern, rule in self.rules.items():
+            if fnmatch.fnmatchcase(op_name, pattern):
+                return rule
+        return {}
+
+    def expires(self, op_name: str, value: Any) -> Tuple[bool, Optional[float]]:
+        """Return whether to cache value and when it expires (None for never)."""
+        rule = self._rule(op_name)
+        immutable = rule.get("immutable")
+        if immutable and isinstance(value, dict):
+            if all(value.get(name) in allowed for name, allowed in immutable.items()):
+                return True, None
+        ttl = rule.get("ttl", self.ttl)
+        if ttl is None:
+            return True, None
+        if ttl <= 0:
+            return False, None
+        return True, time.time() + ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.backend.get(key)
+        if entry is not None and entry["expires"] is not None and time.time() >= entry["expires"]:
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["value"]
+
+    def put(self, key: str, op_name: str, value: Any) -> None:
+        cacheable, expires = self.expires(op_name, value)
+        if cacheable:
+            self.backend.put(key, {"expires": expires, "value": value})
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+# Caches are shared by every registry in the process that uses the same settings
+_CACHES: Dict[Tuple[Any, ...], EntityCache] = {}
+
+
+def get_entity_cache(config: Dict[str, Any]) -> Optional[EntityCache]:
+    """Return the process-wide API cache for a config, or None if disabled.
+
+    Config keys:
+        api_cache: None to disable, "memory" or "sqlite"
+        api_cache_path: SQLite file (required for "sqlite")
+        api_cache_ttl: Seconds results of ops without a rule are reused
+        api_cache_size: Maximum number of cached results
+        api_cache_rules: Rules by op name pattern (default: DEFAULT_RULES)
+    """
+    backend = config.get("api_cache")
+    if not backend:
+        return None
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(f"Unknown API cache backend: {backend}")
+    path = config.get("api_cache_path")
+    if backend == "sqlite" and not path:
+        raise ValueError("The sqlite API cache requires api_cache_path.")
+    ttl = config.get("api_cache_ttl")
+    if ttl is None:
+        ttl = DEFAULT_TTL
+    max_entries = config.get("api_cache_size") or DEFAULT_MAX_ENTRIES
+    rules = config.get("api_cache_rules")
+    settings = (
+        backend,
+        path if backend == "sqlite" else None,
+        ttl,
+        max_entries,
+        json.dumps(rules, sort_keys=True),
+    )
+    cache = _CACHES.get(settings)
+    if cache is None:
+        # Entries carry their own expiry, so the backend keeps them until evicted
+        store: ResponseCache
+        if backend == "sqlite":
+            store = SqliteResponseCache(path, float("inf"), max_entries)
+        else:
+            store = MemoryResponseCache(float("inf"), max_entries)
+        cache = EntityCache(store, ttl, rules)
+        logger.info(f"API cache enabled: {backend} (ttl={ttl}s, max_entries={max_entries})")
+        _CACHES[settings] = cache
+    return cache
+
+
+__all__ = [
+    "DEFAULT_RULES",
+    "EntityCache",
+    "entity_key",
+    "get_entity_cache",
+]
@@ -8,8 +8,9 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Protocol
 
-from .completions import completions_post
+from .completions import completions_body, completions_post
 from .rate_limiter import TokenBucketRateLimiter
+from .response_cache import ResponseCache, cache_key, is_cacheable
 
 # Type aliases for clarity
 TranscriptMessage = Dict[str, Any]
@@ -100,6 +101,57 @@ class RateLimitedCompletionsProvider:
         return await self.inner.complete(transcripts, tools, parallel_tools)
 
 
+class CachingCompletionsProvider:
+    """Wrapper that answers repeated requests from a response cache.
+
+    Requests are keyed on the body the default provider would send, so
+    wrap the provider outside any rate limiting to let hits skip it.
+    """
+
+    def __init__(
+        self,
+        inner: CompletionsProvider,
+        cache: ResponseCache,
+        model: Optional[str] = None,
+        base_url: Optional[str] = None,
+    ):
+        """Initialize with an inner provider and a cache backend.
+
+        Args:
+            inner: The provider to wrap.
+            cache: Response cache backend (see core.response_cache).
+            model: Model identifier, part of the cache key.
+            base_url: Provider endpoint, part of the cache key.
+        """
+        self.inner = inner
+        self.cache = cache
+        self.model = model
+        self.base_url = base_url
+
+    async def complete(
+        self,
+        transcripts: List[TranscriptMessage],
+        tools: List[Dict[str, Any]],
+        parallel_tools: bool = False,
+    ) -> Optional[CompletionsReply]:
+        body = completions_body(
+            {
+                "ai_model": self.model,
+                "messages": sanitize_transcripts(transcripts),
+                "tools": tools,
+                "parallel_tools": parallel_tools,
+            }
+        )
+        key = cache_key(body, self.base_url)
+        reply = self.cache.get(key)
+        if reply is not None:
+            return reply
+        reply = await self.inner.complete(transcripts, tools, parallel_tools)
+        if is_cacheable(reply):
+            self.cache.put(key, reply)
+        return reply
+
+
 def sanitize_transcripts(
     transcripts: List[TranscriptMessage],
 ) -> List[CompletionsMessage]:
@@ -128,6 +180,7 @@ def sanitize_transcripts(
 
 
 __all__ = [
+    "CachingCompletionsProvider",
     "CompletionsProvider",
     "DefaultCompletionsProvider",
     "RateLimitedCompletionsProvider",
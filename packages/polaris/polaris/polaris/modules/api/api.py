@@ -13,6 +13,8 @@ class ApiOp:
     handler: Callable
     capability: Optional[str] = None
     meta: Dict[str, Any] = field(default_factory=dict)
+    # Resolves the request URL of an input; ops that have one can be cached
+    url: Optional[Callable] = None
 
 
 @dataclass
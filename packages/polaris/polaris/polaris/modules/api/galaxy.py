@@ -2,7 +2,7 @@ from polaris.core.client import http
 
 from ..exceptions import ConfigurationError, ProviderError
 from .api import API_METHODS, ApiOp, ApiProvider, ApiTarget
-from .generic import openapi_get
+from .generic import openapi_get, openapi_url
 from .openapi import OpenApiCatalog
 
 ALLOWED_METHODS = [API_METHODS.GET]
@@ -58,6 +58,7 @@ class GalaxyApi(ApiProvider):
             target="galaxy",
             handler=openapi_get,
             capability="read",
+            url=openapi_url,
             meta={
                 "path": path,
                 "operation": operation,
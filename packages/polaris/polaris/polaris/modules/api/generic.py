@@ -3,7 +3,7 @@ from urllib.parse import urlencode
 from polaris.core.client import http
 
 
-async def openapi_get(target, input, meta):
+def openapi_url(target, input, meta):
     path = meta["path"]
     query_params = []
 
@@ -26,6 +26,10 @@ async def openapi_get(target, input, meta):
     if query_params:
         sep = "&" if "?" in url else "?"
         url = f"{url}{sep}{urlencode(query_params)}"
+    return url
+
 
+async def openapi_get(target, input, meta):
+    url = openapi_url(target, input, meta)
     headers = target.get_headers()
     return await http.request("GET", url, headers=headers)
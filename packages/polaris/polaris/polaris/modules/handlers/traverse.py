@@ -1,9 +1,14 @@
 """Handler for traverse nodes - BFS graph traversal with targeted API calls."""
 
 import asyncio
+import json
 import logging
+import math
+import time
 from typing import TYPE_CHECKING, Any
 
+from polaris.core.rate_limiter import TokenBucketRateLimiter
+
 from ..constants import ErrorCode
 from ..types import Context, NodeDefinition, Result
 
@@ -15,12 +20,65 @@ logger = logging.getLogger(__name__)
 # Default limits
 DEFAULT_MAX_DEPTH = 20
 DEFAULT_MAX_PER_LEVEL = 10
-DEFAULT_DELAY = 0.5  # Delay between fetches in seconds
+DEFAULT_CONCURRENCY = 4  # Concurrent fetches per level
+DEFAULT_RATE_LIMIT = 10.0  # Fetches per second
+DEFAULT_BATCH_SIZE = 50  # IDs per batch_fetch call
 
-# Hard limit on total API calls to prevent overload
+# Default limit on total API calls to prevent overload; nodes may set
+# max_fetches, max_seconds and max_bytes instead
 MAX_FETCHES = 25
 
 
+class FetchBudget:
+    """
+    Cost envelope of a traversal: API calls, wall-clock seconds and bytes.
+
+    Limits that are None are not enforced. Bytes are the size of the
+    fetched entities encoded as JSON.
+    """
+
+    def __init__(
+        self,
+        max_fetches: int | None = MAX_FETCHES,
+        max_seconds: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.max_fetches = max_fetches
+        self.max_seconds = max_seconds
+        self.max_bytes = max_bytes
+        self.fetches = 0
+        self.bytes = 0
+        self._start = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._start
+
+    def calls_left(self) -> float:
+        if self.max_fetches is None:
+            return math.inf
+        return self.max_fetches - self.fetches
+
+    def exhausted(self) -> str | None:
+        """Name of the first limit reached, or None."""
+        if self.calls_left() <= 0:
+            return "fetch"
+        if self.max_seconds is not None and self.elapsed >= self.max_seconds:
+            return "time"
+        if self.max_bytes is not None and self.bytes >= self.max_bytes:
+            return "bytes"
+        return None
+
+    def charge(self, calls: int, results: list[dict[str, dict]]) -> None:
+        self.fetches += calls
+        for fetched_by_id in results:
+            for entity in fetched_by_id.values():
+                self.bytes += len(json.dumps(entity, default=str))
+
+    def usage(self) -> dict[str, Any]:
+        return {"fetches": self.fetches, "seconds": round(self.elapsed, 3), "bytes": self.bytes}
+
+
 class TraverseHandler:
     """
     Handler for traverse nodes - performs generic BFS graph traversal.
@@ -28,6 +86,26 @@ class TraverseHandler:
     Traverses a graph by following relations defined in the YAML configuration.
     Each entity type can define relations that point to other entity types,
     and the handler will fetch and collect all reachable entities.
+
+    The entities of each BFS level are fetched concurrently, at most
+    `concurrency` at a time and `rate_limit` per second (token bucket).
+    A `delay` in seconds is still accepted and limits the rate to one fetch
+    per delay.
+
+    Types with a `batch_fetch` spec resolve up to `max_batch` IDs of a level
+    with one call to a list endpoint, e.g. Galaxy's
+    `/api/datasets?q=id-in&qv=<ids>`. The IDs are passed in `ids_param`,
+    joined by `separator` (or as a list when it is null), next to the
+    static `input`; returned items are matched to IDs by the type's
+    id_field. IDs a batch call does not return are fetched one at a time.
+    Every API call, batched or not, counts once against max_fetches.
+
+    The traversal stops when its cost budget runs out: `max_fetches` API
+    calls (MAX_FETCHES by default), `max_seconds` of wall-clock time or
+    `max_bytes` of fetched entities. Within a level, entities of types
+    with a higher `priority` are fetched first. A stopped traversal
+    returns a `checkpoint`; passing it back as `resume` continues where
+    the traversal stopped, with a fresh budget.
     """
 
     async def execute(
@@ -102,9 +180,21 @@ class TraverseHandler:
         if max_per_level is None:
             max_per_level = DEFAULT_MAX_PER_LEVEL
 
+        concurrency = runner.resolver.resolve(node.get("concurrency"), ctx)
+        if concurrency is None:
+            concurrency = DEFAULT_CONCURRENCY
+
+        max_fetches = runner.resolver.resolve(node.get("max_fetches"), ctx)
+        if max_fetches is None:
+            max_fetches = MAX_FETCHES
+        max_seconds = runner.resolver.resolve(node.get("max_seconds"), ctx)
+        max_bytes = runner.resolver.resolve(node.get("max_bytes"), ctx)
+        resume = runner.resolver.resolve(node.get("resume"), ctx)
+
+        rate_limit = runner.resolver.resolve(node.get("rate_limit"), ctx)
         delay = runner.resolver.resolve(node.get("delay"), ctx)
-        if delay is None:
-            delay = DEFAULT_DELAY
+        if rate_limit is None:
+            rate_limit = 1 / delay if delay else DEFAULT_RATE_LIMIT
 
         # Get entity type definitions
         types = node.get("types", {})
@@ -124,7 +214,12 @@ class TraverseHandler:
                 "seed_type": seed_type,
                 "max_depth": max_depth,
                 "max_per_level": max_per_level,
-                "delay": delay,
+                "concurrency": max(1, concurrency),
+                "rate_limit": rate_limit,
+                "max_fetches": max_fetches,
+                "max_seconds": max_seconds,
+                "max_bytes": max_bytes,
+                "resume": resume,
                 "types": types,
             },
         }
@@ -136,23 +231,30 @@ class TraverseHandler:
         registry: "Registry",
         runner: Any,
     ) -> Result:
-        """Perform BFS traversal."""
+        """Perform BFS traversal within the cost budget."""
         seed = cfg["seed"]
         seed_type = cfg["seed_type"]
         max_depth = cfg["max_depth"]
         max_per_level = cfg["max_per_level"]
-        delay = cfg["delay"]
         types = cfg["types"]
-
-        # Track total API fetches to prevent overload
-        total_fetches = 0
-
-        # Track fetched IDs (to avoid fetching same ID twice)
-        fetched_ids: dict[str, set[str]] = {t: set() for t in types}
-        # Track collected dedup values (to avoid duplicates in results)
-        collected_dedup: dict[str, set[str]] = {t: set() for t in types}
-        # Collected entities per type
-        collected: dict[str, list[dict]] = {t: [] for t in types}
+        budget = FetchBudget(cfg["max_fetches"], cfg["max_seconds"], cfg["max_bytes"])
+
+        # Bounds concurrent fetches; the token bucket bounds their rate
+        semaphore = asyncio.Semaphore(cfg["concurrency"])
+        limiter = None
+        if cfg["rate_limit"]:
+            limiter = TokenBucketRateLimiter(rate=cfg["rate_limit"], capacity=cfg["concurrency"])
+
+        async def fetch(entity_type: str, entity_ids: list[str], batched: bool) -> dict[str, dict]:
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire()
+                if batched:
+                    return await self._fetch_entities(entity_type, entity_ids, types, ctx, registry)
+                fetched = await self._fetch_entity(
+                    entity_type, entity_ids[0], types, ctx, registry, runner
+                )
+                return {entity_ids[0]: fetched} if fetched else {}
 
         # Get ID field for seed type
         seed_type_config = types.get(seed_type)
@@ -165,120 +267,228 @@ class TraverseHandler:
                 },
             }
 
-        seed_id_field = seed_type_config.get("id_field", "id")
-        seed_dedup_field = seed_type_config.get("dedup_field", seed_id_field)
-        seed_id = seed.get(seed_id_field)
-        if not seed_id:
-            return {
-                "ok": False,
-                "error": {
-                    "code": ErrorCode.TRAVERSE_INVALID_CONFIG,
-                    "message": f"Seed missing id field: {seed_id_field}",
-                },
-            }
-
-        # Add seed to tracking sets and collected
-        seed_dedup_value = seed.get(seed_dedup_field) or seed_id
-        fetched_ids[seed_type].add(seed_id)
-        collected_dedup[seed_type].add(seed_dedup_value)
-        collected[seed_type].append(seed)
-
-        # Initialize frontier: list of (entity_type, entity_data) tuples
-        frontier: list[tuple[str, dict]] = [(seed_type, seed)]
-        truncated = False
+        checkpoint = cfg["resume"]
+        if checkpoint:
+            # Continue the level a previous run stopped on
+            depth = checkpoint["depth"]
+            frontier = [(t, entity) for t, entity in checkpoint["frontier"]]
+            next_frontier = [(t, entity) for t, entity in checkpoint["next_frontier"]]
+            fetched_ids = {t: set(checkpoint["fetched_ids"].get(t, [])) for t in types}
+            collected_dedup = {t: set(checkpoint["collected_dedup"].get(t, [])) for t in types}
+            collected = {t: list(checkpoint["collected"].get(t, [])) for t in types}
+            truncated = checkpoint.get("truncated", False)
+        else:
+            seed_id_field = seed_type_config.get("id_field", "id")
+            seed_dedup_field = seed_type_config.get("dedup_field", seed_id_field)
+            seed_id = seed.get(seed_id_field)
+            if not seed_id:
+                return {
+                    "ok": False,
+                    "error": {
+                        "code": ErrorCode.TRAVERSE_INVALID_CONFIG,
+                        "message": f"Seed missing id field: {seed_id_field}",
+                    },
+                }
+
+            # Track fetched IDs (to avoid fetching same ID twice)
+            fetched_ids = {t: set() for t in types}
+            # Track collected dedup values (to avoid duplicates in results)
+            collected_dedup = {t: set() for t in types}
+            # Collected entities per type
+            collected = {t: [] for t in types}
+
+            # Add seed to tracking sets and collected
+            seed_dedup_value = seed.get(seed_dedup_field) or seed_id
+            fetched_ids[seed_type].add(seed_id)
+            collected_dedup[seed_type].add(seed_dedup_value)
+            collected[seed_type].append(seed)
+
+            # Frontier: list of (entity_type, entity_data) tuples
+            depth = 0
+            frontier = [(seed_type, seed)]
+            next_frontier = []
+            truncated = False
+
+        # Entities of a level are fetched nearest-first (BFS); within a level,
+        # types with a higher priority go first.
+        def priority(ref: tuple[str, str, str]) -> int:
+            return -types[ref[0]].get("priority", 0)
+
+        stopped = None
+        while depth < max_depth and frontier:
+            # Related entities of this level not fetched yet
+            pending = sorted(self._related_refs(frontier, types, fetched_ids), key=priority)
+            # IDs a batch call did not return, to be fetched one at a time
+            unbatched: set[tuple[str, str]] = set()
+
+            # Fetch in concurrent rounds no larger than the remaining
+            # per-level and call budgets. Failed fetches leave budget for
+            # the next round, so the entities fetched are the ones a
+            # one-at-a-time traversal would fetch.
+            while pending:
+                stopped = budget.exhausted()
+                if stopped:
+                    break
+                taken, calls, pending = self._plan_calls(
+                    pending,
+                    types,
+                    max_per_level - len(next_frontier),
+                    budget.calls_left(),
+                    unbatched,
+                )
+                if not calls:
+                    truncated = True
+                    break
 
-        for depth in range(max_depth):
-            if not frontier:
-                break
+                results = await asyncio.gather(
+                    *(fetch(target_type, ids, batched) for target_type, ids, batched in calls)
+                )
+                budget.charge(len(calls), results)
+
+                found: dict[tuple[str, str], dict] = {}
+                for (target_type, _ids, _batched), fetched_by_id in zip(calls, results, strict=True):
+                    for rel_id, fetched in fetched_by_id.items():
+                        found[(target_type, rel_id)] = fetched
+
+                retry = []
+                for ref in taken:
+                    target_type, rel_id, target_dedup_field = ref
+                    fetched = found.get((target_type, rel_id))
+                    if not fetched:
+                        if types[target_type].get("batch_fetch") and (target_type, rel_id) not in unbatched:
+                            unbatched.add((target_type, rel_id))
+                            retry.append(ref)
+                        continue
+                    fetched_ids[target_type].add(rel_id)
+                    actual_dedup = fetched.get(target_dedup_field) or rel_id
 
-            # Check total fetches limit at depth level
-            if total_fetches >= MAX_FETCHES:
-                truncated = True
-                break
+                    # Only add to collected if dedup value is new
+                    if actual_dedup not in collected_dedup[target_type]:
+                        collected_dedup[target_type].add(actual_dedup)
+                        collected[target_type].append(fetched)
 
-            next_frontier: list[tuple[str, dict]] = []
-            items_added = 0
+                    # Always add to frontier to traverse relations
+                    # (even if not added to collected due to dedup)
+                    next_frontier.append((target_type, fetched))
 
-            for entity_type, entity in frontier:
-                if items_added >= max_per_level or total_fetches >= MAX_FETCHES:
-                    truncated = True
-                    break
+                pending = retry + pending
 
-                type_config = types.get(entity_type)
-                if not type_config:
-                    continue
+            if stopped:
+                break
 
-                # Process relations for this entity
-                relations = type_config.get("relations", {})
-                for rel_config in relations.values():
-                    if items_added >= max_per_level or total_fetches >= MAX_FETCHES:
-                        truncated = True
-                        break
+            frontier, next_frontier = next_frontier, []
+            depth += 1
 
-                    target_type = rel_config.get("type")
-                    if not target_type or target_type not in types:
-                        continue
+            # Check if we've reached max depth with more to explore
+            if depth == max_depth and frontier:
+                truncated = True
 
-                    # Extract related references (id + optional dedup value)
-                    extract_pattern = rel_config.get("extract")
-                    target_type_config = types.get(target_type, {})
-                    target_id_field = target_type_config.get("id_field", "id")
-                    target_dedup_field = target_type_config.get("dedup_field", target_id_field)
+        result: Result = {"ok": True, "result": collected}
+        if stopped:
+            logger.warning(f"Traversal stopped at depth {depth}: {stopped} budget exhausted")
+            result["checkpoint"] = {
+                "depth": depth,
+                "frontier": [list(item) for item in frontier],
+                "next_frontier": [list(item) for item in next_frontier],
+                "fetched_ids": {t: sorted(ids) for t, ids in fetched_ids.items()},
+                "collected_dedup": {t: sorted(values) for t, values in collected_dedup.items()},
+                "collected": collected,
+                "truncated": truncated,
+            }
+            truncated = True
+        elif truncated:
+            logger.warning("Traversal truncated: results may be incomplete")
 
-                    related_refs = self._extract_refs(
-                        entity, extract_pattern, target_id_field, target_dedup_field
-                    )
+        # Build result - one list per entity type
+        result["truncated"] = truncated
+        result["budget"] = budget.usage()
+        return result
 
-                    # Fetch each related entity
-                    for ref in related_refs:
-                        if items_added >= max_per_level or total_fetches >= MAX_FETCHES:
-                            truncated = True
-                            break
+    def _plan_calls(
+        self,
+        pending: list[tuple[str, str, str]],
+        types: dict,
+        max_items: int,
+        max_calls: float,
+        unbatched: set[tuple[str, str]],
+    ) -> tuple[list[tuple[str, str, str]], list[tuple[str, list[str], bool]], list[tuple[str, str, str]]]:
+        """
+        Group the next pending refs into API calls within the given budgets.
 
-                        rel_id = ref["id"]
+        Refs are taken in order until max_items refs are taken or another
+        call would exceed max_calls. Refs of types with a batch_fetch spec
+        share calls of up to max_batch IDs, unless they are in unbatched.
 
-                        # Skip if we've already fetched this ID (avoid redundant API calls)
-                        if rel_id in fetched_ids[target_type]:
-                            continue
+        Returns the refs taken, the calls as (type, ids, batched) tuples,
+        and the refs left.
+        """
+        taken: list[tuple[str, str, str]] = []
+        calls: list[tuple[str, list[str], bool]] = []
+        open_batches: dict[str, list[str]] = {}
 
-                        # Apply delay before fetch to reduce server load
-                        if delay > 0:
-                            await asyncio.sleep(delay)
+        for ref in pending:
+            if len(taken) >= max_items:
+                break
+            target_type, rel_id, _ = ref
+            batch_config = types[target_type].get("batch_fetch")
+            if batch_config and (target_type, rel_id) not in unbatched:
+                ids = open_batches.get(target_type)
+                if ids is None or len(ids) >= batch_config.get("max_batch", DEFAULT_BATCH_SIZE):
+                    if len(calls) >= max_calls:
+                        break
+                    ids = open_batches[target_type] = []
+                    calls.append((target_type, ids, True))
+                ids.append(rel_id)
+            else:
+                if len(calls) >= max_calls:
+                    break
+                calls.append((target_type, [rel_id], False))
+            taken.append(ref)
 
-                        # Fetch the entity
-                        fetched = await self._fetch_entity(
-                            target_type, rel_id, types, ctx, registry, runner
-                        )
-                        total_fetches += 1
-                        if fetched:
-                            fetched_ids[target_type].add(rel_id)
-                            actual_dedup = fetched.get(target_dedup_field) or rel_id
+        return taken, calls, pending[len(taken):]
 
-                            # Only add to collected if dedup value is new
-                            if actual_dedup not in collected_dedup[target_type]:
-                                collected_dedup[target_type].add(actual_dedup)
-                                collected[target_type].append(fetched)
+    def _related_refs(
+        self,
+        frontier: list[tuple[str, dict]],
+        types: dict,
+        fetched_ids: dict[str, set[str]],
+    ) -> list[tuple[str, str, str]]:
+        """
+        Collect the related entities of a BFS level that still need fetching.
 
-                            # Always add to frontier to traverse relations
-                            # (even if not added to collected due to dedup)
-                            next_frontier.append((target_type, fetched))
-                            items_added += 1
+        Returns (target_type, id, dedup_field) tuples in the order the
+        relations of the frontier entities list them, each ID once and
+        without IDs already fetched.
+        """
+        refs: list[tuple[str, str, str]] = []
+        seen: set[tuple[str, str]] = set()
 
-            frontier = next_frontier
+        for entity_type, entity in frontier:
+            type_config = types.get(entity_type)
+            if not type_config:
+                continue
 
-            # Check if we've reached max depth with more to explore
-            if depth == max_depth - 1 and frontier:
-                truncated = True
+            for rel_config in type_config.get("relations", {}).values():
+                target_type = rel_config.get("type")
+                if not target_type or target_type not in types:
+                    continue
 
-        if truncated:
-            logger.warning("Traversal truncated: results may be incomplete")
+                # Extract related references (id + optional dedup value)
+                target_type_config = types.get(target_type, {})
+                target_id_field = target_type_config.get("id_field", "id")
+                target_dedup_field = target_type_config.get("dedup_field", target_id_field)
+
+                for ref in self._extract_refs(
+                    entity, rel_config.get("extract"), target_id_field, target_dedup_field
+                ):
+                    key = (target_type, ref["id"])
+                    # Skip IDs already fetched or pending (avoid redundant API calls)
+                    if ref["id"] in fetched_ids[target_type] or key in seen:
+                        continue
+                    seen.add(key)
+                    refs.append((target_type, ref["id"], target_dedup_field))
 
-        # Build result - one list per entity type
-        return {
-            "ok": True,
-            "result": collected,
-            "truncated": truncated,
-        }
+        return refs
 
     def _extract_refs(
         self,
@@ -403,3 +613,41 @@ class TraverseHandler:
             logger.warning(f"Error fetching {entity_type} {entity_id}: {e}")
             return None
 
+    async def _fetch_entities(
+        self,
+        entity_type: str,
+        entity_ids: list[str],
+        types: dict,
+        ctx: Context,
+        registry: "Registry",
+    ) -> dict[str, dict]:
+        """Fetch several entities with one batch_fetch call, keyed by ID."""
+        type_config = types[entity_type]
+        batch_config = type_config["batch_fetch"]
+        id_field = type_config.get("id_field", "id")
+        separator = batch_config.get("separator", ",")
+
+        ids_value: Any = separator.join(entity_ids) if separator is not None else list(entity_ids)
+        api_input = {**batch_config.get("input", {}), batch_config.get("ids_param", "ids"): ids_value}
+
+        try:
+            result = await registry.call_api(
+                ctx, {"target": batch_config.get("target"), "input": api_input}
+            )
+        except Exception as e:
+            logger.warning(f"Error batch fetching {entity_type} {entity_ids}: {e}")
+            return {}
+        if not result.get("ok"):
+            logger.warning(f"Failed to batch fetch {entity_type} {entity_ids}: {result.get('error')}")
+            return {}
+
+        items = result.get("result")
+        if not isinstance(items, list):
+            logger.warning(f"Batch fetch of {entity_type} did not return a list")
+            return {}
+        wanted = set(entity_ids)
+        return {
+            item[id_field]: item
+            for item in items
+            if isinstance(item, dict) and item.get(id_field) in wanted
+        }
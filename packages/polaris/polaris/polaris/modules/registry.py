@@ -1,10 +1,13 @@
 import json
 import logging
 
-from jsonschema import Draft7Validator
+from jsonschema import Draft7Validator, validators
 
-from polaris.core.completions import completions_post, get_tool_call
+from polaris.core.client import http
+from polaris.core.completions import completions_body, completions_post, get_tool_call
+from polaris.core.entity_cache import entity_key, get_entity_cache
 from polaris.core.rate_limiter import TokenBucketRateLimiter
+from polaris.core.response_cache import cache_key, get_response_cache, is_cacheable
 from polaris.core.retry import retry_async
 
 from .agents import Agents
@@ -26,6 +29,14 @@ DEFAULT_RATE_LIMIT = 30
 # Registry
 # ----------------------------
 class Registry:
+    """Agents, API targets and operations, and LLM access for a run.
+
+    HTTP connections are pooled per process and kept open between runs.
+    Call close() (or use the registry as an async context manager) on
+    shutdown to release them. The pool is shared by every registry in the
+    process, so closing one registry closes it for all of them.
+    """
+
     def __init__(self, config):
         self.config = config
         self.capabilities = ["llm", "read"]
@@ -36,6 +47,24 @@ class Registry:
         rate_limit = config.get("ai_rate_limit", DEFAULT_RATE_LIMIT)
         self._rate_limiter = TokenBucketRateLimiter.from_requests_per_minute(rate_limit)
         logger.info("Rate limiter initialized: %d requests/minute", rate_limit)
+        # Response cache for repeated completions requests (None when disabled)
+        self._response_cache = get_response_cache(config)
+        # Cache for API reads shared between runs (None when disabled)
+        self._entity_cache = get_entity_cache(config)
+        http.configure(
+            pool_size=config.get("http_pool_size"),
+            keepalive_timeout=config.get("http_keepalive_timeout"),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the process-wide pool of HTTP connections."""
+        await http.close()
 
     async def init(self):
         self.providers = await load_providers(self.config)
@@ -54,10 +83,25 @@ class Registry:
                     raise RegistryError(f"API op '{name}' references unknown target '{op.target}'")
                 self.api_ops[name] = op
 
-    async def _completions_post(self, payload):
-        """Rate-limited wrapper for completions_post."""
+    async def _completions_post(self, payload, accept=None):
+        """Rate-limited wrapper for completions_post.
+
+        Requests identical to a cached one are answered from the response
+        cache without waiting for the rate limiter. A reply is cached only
+        if accept(reply) is true (when given), so replies the caller rejects
+        are requested again on retry instead of being replayed.
+        """
+        key = None
+        if self._response_cache is not None:
+            key = cache_key(completions_body(payload), payload.get("ai_base_url"))
+            reply = self._response_cache.get(key)
+            if reply is not None:
+                return reply
         await self._rate_limiter.acquire()
-        return await completions_post(payload)
+        reply = await completions_post(payload)
+        if key is not None and is_cacheable(reply) and (accept is None or accept(reply)):
+            self._response_cache.put(key, reply)
+        return reply
 
     # ----------------------------
     # Tool Builder
@@ -144,8 +188,17 @@ class Registry:
                 },
             }
         target = self.api_targets[op.target]
+        api_input = spec.get("input", {})
+        key = None
+        if self._entity_cache is not None and op.url is not None:
+            key = entity_key(op.url(target, api_input, op.meta), target.get_headers())
+            result = self._entity_cache.get(key)
+            if result is not None:
+                return {"ok": True, "result": result}
         try:
-            result = await op.handler(target, spec.get("input", {}), op.meta)
+            result = await op.handler(target, api_input, op.meta)
+            if key is not None:
+                self._entity_cache.put(key, spec["target"], result)
             return {"ok": True, "result": result}
         except Exception as e:
             return {
@@ -168,6 +221,16 @@ class Registry:
         messages.extend(self.sanitize(ctx["inputs"].get("transcripts")))
         tools = self.build_route_tool(ctx, spec["node"], spec.get("output_schema"))
         tool_name = tools[0]["function"]["name"]
+        validator = Draft7Validator(spec["output_schema"]) if spec.get("output_schema") else None
+
+        def accept(reply):
+            # Cache only tool calls that pass the checks below
+            try:
+                arguments = get_tool_call(tool_name, reply)
+            except ValueError:
+                return False
+            return bool(arguments) and (validator is None or validator.is_valid(arguments))
+
         reply = await self._completions_post(
             {
                 **self.config,
@@ -177,7 +240,8 @@ class Registry:
                     "type": "function",
                     "function": {"name": tool_name},
                 },
-            }
+            },
+            accept,
         )
         choice = reply.get("choices", [{}])[0]
         arguments = get_tool_call(tool_name, reply)
@@ -190,8 +254,7 @@ class Registry:
                     "message": choice.get("message"),
                 },
             )
-        if spec.get("output_schema"):
-            validator = Draft7Validator(spec["output_schema"])
+        if validator is not None:
             errors = list(validator.iter_errors(arguments))
             if errors:
                 raise PlannerError(
@@ -232,11 +295,21 @@ class Registry:
             },
         ]
 
+        def accept(reply):
+            # Cache only JSON matching the schema, which the planner shim accepts
+            content = reply["choices"][0].get("message", {}).get("content") or ""
+            try:
+                data = json.loads(content)
+            except ValueError:
+                return False
+            return validators.validator_for(schema)(schema).is_valid(data)
+
         reply = await self._completions_post(
             {
                 **self.config,
                 "messages": messages,
-            }
+            },
+            accept,
         )
 
         # Extract content from response
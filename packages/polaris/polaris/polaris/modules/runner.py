@@ -29,6 +29,16 @@ class Runner:
         self.on_progress = on_progress
         self.resolver = Resolver(self.state)
 
+    async def __aenter__(self) -> "Runner":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the registry's (process-wide) pool of HTTP connections."""
+        await self.registry.close()
+
     def emit_progress(self, node_id: str, status: str, node_type: str = "", detail: str = "") -> None:
         """Emit progress event if callback is registered."""
         if self.on_progress:
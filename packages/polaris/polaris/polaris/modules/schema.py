@@ -82,6 +82,16 @@ class FetchSpec(BaseModel):
     id_param: str = "id"
 
 
+class BatchFetchSpec(BaseModel):
+    """List endpoint that fetches several entities of a traverse type per call."""
+
+    target: str
+    ids_param: str = "ids"
+    separator: str | None = ","
+    input: dict[str, Any] = Field(default_factory=dict)
+    max_batch: int = 50
+
+
 class RelationSpec(BaseModel):
     """Relation definition for traverse types."""
 
@@ -94,6 +104,8 @@ class TraverseTypeSpec(BaseModel):
 
     id_field: str = "id"
     fetch: FetchSpec | None = None
+    batch_fetch: BatchFetchSpec | None = None
+    priority: int = 0
     relations: dict[str, RelationSpec] = Field(default_factory=dict)
 
 
@@ -149,6 +161,12 @@ class TraverseNode(BaseNode):
     types: dict[str, TraverseTypeSpec]
     max_depth: DynamicValue = None
     max_per_level: DynamicValue = None
+    concurrency: DynamicValue = None
+    rate_limit: DynamicValue = None
+    max_fetches: DynamicValue = None
+    max_seconds: DynamicValue = None
+    max_bytes: DynamicValue = None
+    resume: DynamicValue = None
 
 
 class ReasoningNode(BaseNode):
@@ -1,5 +1,7 @@
 """Tests for traverse handler."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -1212,3 +1214,304 @@ class TestMaxFetchesLimit:
 
         assert result["ok"] is True
         assert result.get("truncated") is True, "Should be truncated due to per-level limit"
+
+
+class TestConcurrentFetches:
+    """Tests for concurrent, rate-limited fetching of each BFS level."""
+
+    @pytest.fixture
+    def wide_pipeline_data(self):
+        """One job with eight input datasets."""
+        inputs = {f"in{i}": {"id": f"d{i}"} for i in range(8)}
+        datasets = {f"d{i}": {"id": f"d{i}", "creating_job": None} for i in range(8)}
+        datasets["d_out"] = {"id": "d_out", "creating_job": "j1"}
+        return {
+            "datasets": datasets,
+            "jobs": {"j1": {"id": "j1", "inputs": inputs, "outputs": {}}},
+        }
+
+    def _tracking_api(self, data):
+        call_api = create_mock_api(data)
+        state = {"in_flight": 0, "max_in_flight": 0, "calls": []}
+
+        async def tracking_call_api(ctx, spec):
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            state["calls"].append(next(iter(spec["input"].values())))
+            try:
+                await asyncio.sleep(0.01)
+                return await call_api(ctx, spec)
+            finally:
+                state["in_flight"] -= 1
+
+        return tracking_call_api, state
+
+    @pytest.mark.asyncio
+    async def test_level_fetched_concurrently_up_to_limit(
+        self, handler, mock_registry, mock_runner, wide_pipeline_data, traverse_node
+    ):
+        mock_registry.call_api, state = self._tracking_api(wide_pipeline_data)
+        traverse_node["concurrency"] = 3
+        traverse_node["rate_limit"] = 0
+        ctx = {"state": {"source_dataset": wide_pipeline_data["datasets"]["d_out"]}, "inputs": {}}
+
+        result = await handler.execute(traverse_node, ctx, mock_registry, mock_runner)
+
+        assert result["ok"] is True
+        assert state["max_in_flight"] == 3
+        # Results keep BFS order
+        assert [d["id"] for d in result["result"]["dataset"]] == ["d_out"] + [f"d{i}" for i in range(8)]
+
+    @pytest.mark.asyncio
+    async def test_failed_fetches_do_not_use_level_budget(
+        self, handler, mock_registry, mock_runner, wide_pipeline_data, traverse_node
+    ):
+        del wide_pipeline_data["datasets"]["d0"]
+        del wide_pipeline_data["datasets"]["d1"]
+        mock_registry.call_api, state = self._tracking_api(wide_pipeline_data)
+        traverse_node["max_per_level"] = 4
+        traverse_node["rate_limit"] = 0
+        ctx = {"state": {"source_dataset": wide_pipeline_data["datasets"]["d_out"]}, "inputs": {}}
+
+        result = await handler.execute(traverse_node, ctx, mock_registry, mock_runner)
+
+        # Same fetches as one at a time: d0 and d1 fail, d2-d5 fill the level
+        assert state["calls"] == ["j1", "d0", "d1", "d2", "d3", "d4", "d5"]
+        assert [d["id"] for d in result["result"]["dataset"]] == ["d_out", "d2", "d3", "d4", "d5"]
+        assert result["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_fetches(
+        self, handler, mock_registry, mock_runner, wide_pipeline_data, traverse_node
+    ):
+        mock_registry.call_api, state = self._tracking_api(wide_pipeline_data)
+        traverse_node["concurrency"] = 2
+        traverse_node["rate_limit"] = 50
+        ctx = {"state": {"source_dataset": wide_pipeline_data["datasets"]["d_out"]}, "inputs": {}}
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await handler.execute(traverse_node, ctx, mock_registry, mock_runner)
+
+        # 9 fetches with a burst of 2 need at least 7 refills at 50 per second
+        assert len(state["calls"]) == 9
+        assert loop.time() - start >= 7 / 50 * 0.9
+
+
+class TestBatchFetch:
+    """Tests for resolving a level's IDs through batch_fetch list endpoints."""
+
+    @pytest.fixture
+    def wide_pipeline_data(self):
+        """One job with six input datasets."""
+        inputs = {f"in{i}": {"id": f"d{i}"} for i in range(6)}
+        datasets = {f"d{i}": {"id": f"d{i}", "creating_job": None} for i in range(6)}
+        datasets["d_out"] = {"id": "d_out", "creating_job": "j1"}
+        return {
+            "datasets": datasets,
+            "jobs": {"j1": {"id": "j1", "inputs": inputs, "outputs": {}}},
+        }
+
+    def _batch_api(self, data, listed=None):
+        """Mock call_api with a dataset list endpoint; only `listed` IDs are listed."""
+        call_api = create_mock_api(data)
+        calls = []
+
+        async def batch_call_api(ctx, spec):
+            calls.append(spec)
+            if spec["target"] == "galaxy.datasets.get":
+                ids = spec["input"]["qv"].split(",")
+                return {
+                    "ok": True,
+                    "result": [
+                        data["datasets"][i]
+                        for i in ids
+                        if i in data["datasets"] and (listed is None or i in listed)
+                    ],
+                }
+            return await call_api(ctx, spec)
+
+        return batch_call_api, calls
+
+    @pytest.fixture
+    def batch_node(self, traverse_node):
+        traverse_node["rate_limit"] = 0
+        traverse_node["types"]["dataset"]["batch_fetch"] = {
+            "target": "galaxy.datasets.get",
+            "ids_param": "qv",
+            "input": {"q": "id-in"},
+            "max_batch": 4,
+        }
+        return traverse_node
+
+    @pytest.mark.asyncio
+    async def test_level_resolved_in_batches(
+        self, handler, mock_registry, mock_runner, wide_pipeline_data, batch_node
+    ):
+        mock_registry.call_api, calls = self._batch_api(wide_pipeline_data)
+        ctx = {"state": {"source_dataset": wide_pipeline_data["datasets"]["d_out"]}, "inputs": {}}
+
+        result = await handler.execute(batch_node, ctx, mock_registry, mock_runner)
+
+        assert result["ok"] is True
+        batch_calls = [c["input"] for c in calls if c["target"] == "galaxy.datasets.get"]
+        assert batch_calls == [
+            {"q": "id-in", "qv": "d0,d1,d2,d3"},
+            {"q": "id-in", "qv": "d4,d5"},
+        ]
+        # One job fetch plus two batch calls
+        assert len(calls) == 3
+        assert [d["id"] for d in result["result"]["dataset"]] == ["d_out"] + [f"d{i}" for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_unlisted_ids_fetched_individually(
+        self, handler, mock_registry, mock_runner, wide_pipeline_data, batch_node
+    ):
+        mock_registry.call_api, calls = self._batch_api(wide_pipeline_data, listed={"d0", "d2", "d3", "d4", "d5"})
+        ctx = {"state": {"source_dataset": wide_pipeline_data["datasets"]["d_out"]}, "inputs": {}}
+
+        result = await handler.execute(batch_node, ctx, mock_registry, mock_runner)
+
+        single_calls = [c["input"] for c in calls if c["target"] == "galaxy.datasets.show.get"]
+        assert single_calls == [{"dataset_id": "d1"}]
+        # d1 is collected after the rest of its level
+        assert [d["id"] for d in result["result"]["dataset"]] == ["d_out", "d0", "d2", "d3", "d4", "d5", "d1"]
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_level_budget(
+        self, handler, mock_registry, mock_runner, wide_pipeline_data, batch_node
+    ):
+        mock_registry.call_api, calls = self._batch_api(wide_pipeline_data)
+        batch_node["max_per_level"] = 3
+        ctx = {"state": {"source_dataset": wide_pipeline_data["datasets"]["d_out"]}, "inputs": {}}
+
+        result = await handler.execute(batch_node, ctx, mock_registry, mock_runner)
+
+        batch_calls = [c["input"]["qv"] for c in calls if c["target"] == "galaxy.datasets.get"]
+        assert batch_calls == ["d0,d1,d2"]
+        assert result["truncated"] is True
+
+    def test_plan_calls_counts_batches_against_call_budget(self, handler, batch_node):
+        types = batch_node["types"]
+        pending = [("dataset", f"d{i}", "id") for i in range(6)] + [("job", "j1", "id")]
+
+        taken, calls, rest = handler._plan_calls(pending, types, 10, 2, set())
+
+        assert calls == [("dataset", ["d0", "d1", "d2", "d3"], True), ("dataset", ["d4", "d5"], True)]
+        assert rest == [("job", "j1", "id")]
+        assert len(taken) == 6
+
+
+class TestFetchBudget:
+    """Tests for node-configured cost budgets, priorities and checkpoints."""
+
+    @pytest.fixture
+    def chain_data(self):
+        """Linear lineage d0 <- j1 <- d1 <- ... <- j6 <- d6."""
+        datasets = {"d0": {"id": "d0", "creating_job": None}}
+        jobs = {}
+        for i in range(1, 7):
+            datasets[f"d{i}"] = {"id": f"d{i}", "creating_job": f"j{i}"}
+            jobs[f"j{i}"] = {"id": f"j{i}", "inputs": {"in": {"id": f"d{i - 1}"}}, "outputs": {}}
+        return {"datasets": datasets, "jobs": jobs}
+
+    @pytest.fixture
+    def budget_node(self, traverse_node):
+        traverse_node["rate_limit"] = 0
+        traverse_node["max_depth"] = 20
+        return traverse_node
+
+    def _ctx(self, data):
+        return {"state": {"source_dataset": data["datasets"]["d6"]}, "inputs": {}}
+
+    @pytest.mark.asyncio
+    async def test_max_fetches_configurable(self, handler, mock_registry, mock_runner, chain_data, budget_node):
+        mock_registry.call_api = AsyncMock(side_effect=create_mock_api(chain_data))
+        budget_node["max_fetches"] = 5
+
+        result = await handler.execute(budget_node, self._ctx(chain_data), mock_registry, mock_runner)
+
+        assert mock_registry.call_api.call_count == 5
+        assert result["truncated"] is True
+        assert result["budget"]["fetches"] == 5
+        assert result["checkpoint"]["depth"] == 5
+
+    @pytest.mark.asyncio
+    async def test_resume_from_checkpoint_completes_traversal(
+        self, handler, mock_registry, mock_runner, chain_data, budget_node
+    ):
+        mock_registry.call_api = AsyncMock(side_effect=create_mock_api(chain_data))
+        full = await handler.execute(budget_node, self._ctx(chain_data), mock_registry, mock_runner)
+        assert full["truncated"] is False
+        assert "checkpoint" not in full
+
+        mock_registry.call_api.reset_mock()
+        budget_node["max_fetches"] = 4
+        ctx = self._ctx(chain_data)
+        result = await handler.execute(budget_node, ctx, mock_registry, mock_runner)
+        while "checkpoint" in result:
+            ctx["state"]["checkpoint"] = result["checkpoint"]
+            budget_node["resume"] = {"$ref": "state.checkpoint"}
+            result = await handler.execute(budget_node, ctx, mock_registry, mock_runner)
+
+        assert result["result"] == full["result"]
+        assert result["truncated"] is False
+        # Resuming does not fetch anything twice
+        assert mock_registry.call_api.call_count == 12
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_survives_json(self, handler, mock_registry, mock_runner, chain_data, budget_node):
+        import json
+
+        mock_registry.call_api = AsyncMock(side_effect=create_mock_api(chain_data))
+        budget_node["max_fetches"] = 3
+        ctx = self._ctx(chain_data)
+        result = await handler.execute(budget_node, ctx, mock_registry, mock_runner)
+
+        ctx["state"]["checkpoint"] = json.loads(json.dumps(result["checkpoint"]))
+        budget_node["resume"] = {"$ref": "state.checkpoint"}
+        budget_node["max_fetches"] = 100
+        result = await handler.execute(budget_node, ctx, mock_registry, mock_runner)
+
+        assert [d["id"] for d in result["result"]["dataset"]] == [f"d{i}" for i in range(6, -1, -1)]
+
+    @pytest.mark.asyncio
+    async def test_time_and_byte_budgets(self, handler, mock_registry, mock_runner, chain_data, budget_node):
+        mock_registry.call_api = AsyncMock(side_effect=create_mock_api(chain_data))
+        budget_node["max_seconds"] = 0
+        result = await handler.execute(budget_node, self._ctx(chain_data), mock_registry, mock_runner)
+        assert mock_registry.call_api.call_count == 0
+        assert result["truncated"] is True
+        assert "checkpoint" in result
+
+        del budget_node["max_seconds"]
+        budget_node["max_bytes"] = 1
+        result = await handler.execute(budget_node, self._ctx(chain_data), mock_registry, mock_runner)
+        assert result["budget"]["fetches"] == 1
+        assert result["budget"]["bytes"] > 1
+
+    @pytest.mark.asyncio
+    async def test_priority_orders_level(self, handler, mock_registry, mock_runner, budget_node):
+        data = {
+            "datasets": {
+                "d_out": {"id": "d_out", "creating_job": "j1"},
+                "d_in": {"id": "d_in", "creating_job": None},
+            },
+            "jobs": {
+                "j1": {"id": "j1", "inputs": {"in": {"id": "d_in"}}, "outputs": {"out": {"id": "d_out"}}},
+            },
+        }
+        # A dataset relation to a job and a dataset on the same level
+        data["datasets"]["d_out"]["inputs"] = {"sibling": {"id": "d_in"}}
+        budget_node["types"]["dataset"]["relations"]["inputs"] = {"type": "dataset", "extract": "inputs.*.id"}
+        budget_node["max_per_level"] = 1
+        mock_registry.call_api = AsyncMock(side_effect=create_mock_api(data))
+        ctx = {"state": {"source_dataset": data["datasets"]["d_out"]}, "inputs": {}}
+
+        result = await handler.execute(budget_node, ctx, mock_registry, mock_runner)
+        assert result["result"]["job"][0]["id"] == "j1"
+
+        budget_node["types"]["dataset"]["priority"] = 1
+        result = await handler.execute(budget_node, ctx, mock_registry, mock_runner)
+        assert [d["id"] for d in result["result"]["dataset"]][:2] == ["d_out", "d_in"]
+        assert result["result"]["job"] == []
@@ -0,0 +1,125 @@
+"""Tests for the HTTP client: single-flight coalescing and session handling."""
+
+import asyncio
+
+import pytest
+
+from polaris.core.client import HttpClient
+from polaris.core.exceptions import HttpError
+
+
+class FakeClient(HttpClient):
+    """Client whose requests take a moment and are recorded."""
+
+    def __init__(self, fail=False):
+        super().__init__()
+        self.sent = []
+        self.fail = fail
+
+    async def _send(self, method, url, headers=None, body=None):
+        self.sent.append((method, url))
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise HttpError("HTTP 404: missing", status_code=404)
+        return {"url": url, "items": [1, 2]}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request():
+    client = FakeClient()
+
+    results = await asyncio.gather(*(client.request("GET", "http://galaxy/api/jobs/j1") for _ in range(5)))
+
+    assert client.sent == [("GET", "http://galaxy/api/jobs/j1")]
+    assert client.coalesced == 4
+    assert all(r == {"url": "http://galaxy/api/jobs/j1", "items": [1, 2]} for r in results)
+    # Every caller gets its own copy
+    results[0]["items"].append(3)
+    assert results[1]["items"] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_distinct_or_sequential_requests_are_sent():
+    client = FakeClient()
+
+    await asyncio.gather(
+        client.request("GET", "http://galaxy/api/jobs/j1"),
+        client.request("GET", "http://galaxy/api/jobs/j2"),
+        client.request("GET", "http://galaxy/api/jobs/j1", headers={"x-api-key": "other"}),
+        client.request("POST", "http://galaxy/api/jobs/j1", body={}),
+    )
+    await client.request("GET", "http://galaxy/api/jobs/j1")
+
+    assert len(client.sent) == 5
+    assert client.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller():
+    client = FakeClient(fail=True)
+
+    results = await asyncio.gather(
+        *(client.request("GET", "http://galaxy/api/jobs/j1") for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert len(client.sent) == 1
+    assert all(isinstance(r, HttpError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request():
+    client = FakeClient()
+
+    first = asyncio.ensure_future(client.request("GET", "http://galaxy/api/jobs/j1"))
+    second = asyncio.ensure_future(client.request("GET", "http://galaxy/api/jobs/j1"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second)["url"] == "http://galaxy/api/jobs/j1"
+    assert len(client.sent) == 1
+
+
+def test_session_of_previous_loop_is_released():
+    from polaris.core.client import ServerHttpClient
+
+    client = ServerHttpClient()
+
+    async def open_session():
+        return client._get_session()
+
+    stale = asyncio.run(open_session())
+
+    async def reopen():
+        session = client._get_session()
+        await client.close()
+        return session
+
+    fresh = asyncio.run(reopen())
+    assert stale.closed
+    assert fresh is not stale
+
+
+def test_session_of_idle_loop_is_closed_on_it():
+    from polaris.core.client import ServerHttpClient
+
+    client = ServerHttpClient()
+    idle = asyncio.new_event_loop()
+
+    async def open_session():
+        return client._get_session()
+
+    try:
+        stale = idle.run_until_complete(open_session())
+
+        async def reopen():
+            session = client._get_session()
+            await client.close()
+            return session
+
+        fresh = asyncio.run(reopen())
+        assert stale.closed
+        assert stale.connector is None or stale.connector.closed
+        assert fresh is not stale
+    finally:
+        idle.close()
@@ -48,6 +48,25 @@ class TestPolarisConfig:
         with pytest.raises(ValidationError):
             PolarisConfig(ai_rate_limit=-1)
 
+    def test_response_cache_settings(self):
+        """Test response cache backend validation."""
+        assert PolarisConfig().ai_cache is None
+        with pytest.raises(ValidationError):
+            PolarisConfig(ai_cache="redis")
+        with pytest.raises(ValidationError):
+            PolarisConfig(ai_cache="sqlite")
+        config = PolarisConfig(ai_cache="sqlite", ai_cache_path="/tmp/cache.sqlite")
+        assert config.to_dict()["ai_cache_path"] == "/tmp/cache.sqlite"
+
+    def test_api_cache_settings(self):
+        """Test API cache backend validation."""
+        assert PolarisConfig().api_cache is None
+        with pytest.raises(ValidationError):
+            PolarisConfig(api_cache="sqlite")
+        rules = {"galaxy.histories.*": {"ttl": 60}}
+        config = PolarisConfig(api_cache="memory", api_cache_rules=rules)
+        assert config.to_dict()["api_cache_rules"] == rules
+
     def test_valid_rate_limit(self):
         """Test valid rate limit."""
         config = PolarisConfig(ai_rate_limit=30)
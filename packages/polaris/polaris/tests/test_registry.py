@@ -41,3 +41,205 @@ async def test_registry_plan_requires_tool_call(monkeypatch):
     result = await registry.plan(ctx, spec)
 
     assert result["next"] == "foo"
+
+
+@pytest.mark.asyncio
+async def test_registry_context_manager_closes_http_session(monkeypatch):
+    from polaris.core.client import http
+
+    closed = []
+
+    async def fake_close():
+        closed.append(True)
+
+    monkeypatch.setattr(http, "close", fake_close)
+
+    async with Registry({"ai_base_url": "x"}) as registry:
+        assert isinstance(registry, Registry)
+        assert not closed
+
+    assert closed == [True]
+
+
+def test_registry_configures_http_pool(monkeypatch):
+    from polaris.core.client import http
+
+    calls = []
+    monkeypatch.setattr(http, "configure", lambda **kwargs: calls.append(kwargs))
+
+    Registry({"ai_base_url": "x", "http_pool_size": 8, "http_keepalive_timeout": 5.0})
+
+    assert calls == [{"pool_size": 8, "keepalive_timeout": 5.0}]
+
+
+@pytest.mark.asyncio
+async def test_registry_serves_repeated_completions_from_cache(monkeypatch):
+    calls = []
+
+    async def fake_completions_post(payload):
+        calls.append(payload)
+        return {"choices": [{"message": {"content": "done"}}]}
+
+    monkeypatch.setattr("polaris.modules.registry.completions_post", fake_completions_post)
+
+    registry = Registry({"ai_base_url": "x", "ai_cache": "memory", "ai_cache_size": 3})
+    registry._response_cache.clear()
+
+    assert await registry.reason("Summarize", {"a": 1}) == "done"
+    assert await registry.reason("Summarize", {"a": 1}) == "done"
+    assert await registry.reason("Summarize", {"a": 2}) == "done"
+
+    assert len(calls) == 2
+    assert registry._response_cache.hits == 1
+
+
+class _CountingProvider:
+    """Provider with one cacheable GET op that counts handler calls."""
+
+    def __init__(self, results):
+        from polaris.modules.api.api import ApiOp, ApiTarget
+
+        self.results = results
+        self.calls = []
+
+        async def handler(target, input, meta):
+            self.calls.append(input)
+            return self.results[input["job_id"]]
+
+        self._target = ApiTarget(name="galaxy", base_url="http://galaxy/")
+        self._op = ApiOp(
+            target="galaxy",
+            handler=handler,
+            capability="read",
+            meta={"method": "get"},
+            url=lambda target, input, meta: target.build_url(f"/api/jobs/{input['job_id']}"),
+        )
+
+    def resolve_op(self, name):
+        return self._op if name.startswith("galaxy.jobs") else None
+
+
+def _registry_with(provider, **config):
+    registry = Registry({"ai_base_url": "x", **config})
+    registry.providers = [provider]
+    registry.api_targets["galaxy"] = provider._target
+    return registry
+
+
+@pytest.mark.asyncio
+async def test_registry_caches_api_reads_by_rule():
+    provider = _CountingProvider({"j1": {"id": "j1", "state": "ok"}, "j2": {"id": "j2", "state": "running"}})
+    registry = _registry_with(provider, api_cache="memory", api_cache_size=8)
+    registry._entity_cache.clear()
+
+    spec = {"target": "galaxy.jobs.show.get", "input": {"job_id": "j1"}}
+    assert (await registry.call_api({}, spec))["result"]["state"] == "ok"
+    assert (await registry.call_api({}, spec))["result"]["state"] == "ok"
+    assert len(provider.calls) == 1
+
+    # Running jobs are not cached
+    spec = {"target": "galaxy.jobs.show.get", "input": {"job_id": "j2"}}
+    await registry.call_api({}, spec)
+    await registry.call_api({}, spec)
+    assert len(provider.calls) == 3
+    assert registry._entity_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_registry_api_cache_persists_in_sqlite(tmp_path):
+    from polaris.core.entity_cache import EntityCache
+
+    path = str(tmp_path / "api.sqlite")
+    results = {"j1": {"id": "j1", "state": "ok"}}
+    first = _registry_with(_CountingProvider(results), api_cache="sqlite", api_cache_path=path)
+    spec = {"target": "galaxy.jobs.show.get", "input": {"job_id": "j1"}}
+    await first.call_api({}, spec)
+
+    # A second process opens the same file
+    from polaris.core.response_cache import SqliteResponseCache
+
+    provider = _CountingProvider(results)
+    second = _registry_with(provider)
+    second._entity_cache = EntityCache(SqliteResponseCache(path, float("inf")))
+    assert (await second.call_api({}, spec))["result"] == results["j1"]
+    assert provider.calls == []
+
+
+def test_entity_cache_rules():
+    from polaris.core.entity_cache import EntityCache
+    from polaris.core.response_cache import MemoryResponseCache
+
+    cache = EntityCache(MemoryResponseCache(float("inf")), ttl=60, rules={"galaxy.histories.*": {"ttl": 0}})
+    assert cache.expires("galaxy.histories.show.get", {"id": "h1"}) == (False, None)
+    cacheable, expires = cache.expires("galaxy.jobs.show.get", {"state": "ok"})
+    assert cacheable and expires is not None
+
+
+def test_entity_cache_default_rules_skip_unfinished_entities():
+    from polaris.core.entity_cache import EntityCache
+    from polaris.core.response_cache import MemoryResponseCache
+
+    cache = EntityCache(MemoryResponseCache(float("inf")))
+    assert cache.expires("galaxy.jobs.show.get", {"state": "running"}) == (False, None)
+    assert cache.expires("galaxy.datasets.show.get", {"state": "queued"}) == (False, None)
+    assert cache.expires("galaxy.jobs.show.get", {"state": "ok"}) == (True, None)
+    assert cache.expires("galaxy.datasets.show.get", {"state": "ok"}) == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_registry_response_cache_is_keyed_by_endpoint(monkeypatch):
+    calls = []
+
+    async def fake_completions_post(payload):
+        calls.append(payload["ai_base_url"])
+        return {"choices": [{"message": {"content": "done"}}]}
+
+    monkeypatch.setattr("polaris.modules.registry.completions_post", fake_completions_post)
+
+    first = Registry({"ai_base_url": "http://a/v1/", "ai_cache": "memory", "ai_cache_size": 4})
+    second = Registry({"ai_base_url": "http://b/v1/", "ai_cache": "memory", "ai_cache_size": 4})
+    first._response_cache.clear()
+    assert first._response_cache is second._response_cache
+
+    await first.reason("Summarize", {"a": 1})
+    await second.reason("Summarize", {"a": 1})
+
+    assert calls == ["http://a/v1/", "http://b/v1/"]
+
+
+@pytest.mark.asyncio
+async def test_registry_caches_only_replies_callers_accept(monkeypatch):
+    from polaris.modules.exceptions import PlannerError
+
+    replies = []
+
+    async def fake_completions_post(payload):
+        return replies.pop(0)
+
+    def content(text):
+        return {"choices": [{"message": {"content": text}}]}
+
+    monkeypatch.setattr("polaris.modules.registry.completions_post", fake_completions_post)
+    registry = Registry({"ai_base_url": "x", "ai_cache": "memory", "ai_cache_size": 8})
+    registry._response_cache.clear()
+
+    # A route missing a required field violates the output schema
+    call = {"function": {"name": "route", "arguments": '{"next": "foo"}'}}
+    route = {"choices": [{"message": {"tool_calls": [call]}}]}
+    ctx = {"graph": {"nodes": {"foo": {}}}, "inputs": {"transcripts": []}, "state": {}}
+    spec = {"node": {}, "output_schema": {"type": "object", "required": ["next", "id"]}}
+    replies.extend([route, route])
+    for _ in range(2):
+        with pytest.raises(PlannerError):
+            await registry.plan(ctx, spec)
+    assert replies == []
+
+    # Structured output the planner shim would reject is requested again
+    schema = {"type": "object", "properties": {"route": {"enum": ["a"]}}, "required": ["route"]}
+    replies.extend([content("not json"), content('{"route": "b"}'), content('{"route": "a"}')])
+    assert await registry.reason_structured("Route", schema) == "not json"
+    assert await registry.reason_structured("Route", schema) == '{"route": "b"}'
+    assert await registry.reason_structured("Route", schema) == '{"route": "a"}'
+    assert await registry.reason_structured("Route", schema) == '{"route": "a"}'
+    assert replies == []
+    assert registry._response_cache.hits == 1
@@ -1,11 +1,15 @@
 """Tests for the HTTP client module."""
 
+import asyncio
+
 import pytest
+import pytest_asyncio
 
 from vintent.core.client import (
     INITIAL_BACKOFF,
     MAX_RETRIES,
     RETRY_STATUS_CODES,
+    ServerHttpClient,
     parse_response,
 )
 from vintent.core.exceptions import HttpError
@@ -85,3 +89,88 @@ class TestParseResponse:
 
         result = await parse_response(MockResponse())
         assert result == ""
+
+
+class TestServerHttpClient:
+    @pytest_asyncio.fixture
+    async def server(self):
+        from aiohttp import web
+
+        peers = []
+
+        async def handler(request):
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.json_response({"ok": True})
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        yield f"http://127.0.0.1:{port}/", peers
+        await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_reuses_connection_between_requests(self, server):
+        url, peers = server
+        client = ServerHttpClient()
+        try:
+            assert await client.request("GET", url) == {"ok": True}
+            assert await client.request("GET", url) == {"ok": True}
+        finally:
+            await client.close()
+        assert len(peers) == 2
+        assert peers[0] == peers[1]
+
+    @pytest.mark.asyncio
+    async def test_close_opens_new_session_on_next_request(self, server):
+        url, peers = server
+        client = ServerHttpClient()
+        client.configure(pool_size=2)
+        await client.request("GET", url)
+        session = client._session
+        assert session.connector.limit == 2
+        await client.close()
+        assert session.closed
+        await client.request("GET", url)
+        assert client._session is not session
+        await client.close()
+
+    def test_session_of_previous_loop_is_released(self):
+        client = ServerHttpClient()
+
+        async def open_session():
+            return client._get_session()
+
+        stale = asyncio.run(open_session())
+
+        async def reopen():
+            session = client._get_session()
+            await client.close()
+            return session
+
+        fresh = asyncio.run(reopen())
+        assert stale.closed
+        assert fresh is not stale
+
+    def test_session_of_idle_loop_is_closed_on_it(self):
+        client = ServerHttpClient()
+        idle = asyncio.new_event_loop()
+
+        async def open_session():
+            return client._get_session()
+
+        async def reopen():
+            session = client._get_session()
+            await client.close()
+            return session
+
+        try:
+            stale = idle.run_until_complete(open_session())
+            fresh = asyncio.run(reopen())
+            assert stale.closed
+            assert fresh is not stale
+        finally:
+            idle.close()
@@ -4,7 +4,7 @@ import json
 import logging
 import pytest
 
-from vintent.core.completions import get_tool_call, normalize_parameter
+from vintent.core.completions import EncodedTool, encode_body, get_tool_call, normalize_parameter
 
 
 class TestGetToolCall:
@@ -161,3 +161,17 @@ class TestNormalizeParameter:
 
     def test_boundary_max(self):
         assert normalize_parameter(100, 0, 100, 50) == 100
+
+
+class TestEncodeBody:
+    def test_reuses_tool_encoding(self):
+        tool = EncodedTool({"type": "function", "function": {"name": "my_tool"}})
+        body = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "tools": [tool]}
+
+        assert json.loads(encode_body(body)) == body
+        assert tool.encoded == json.dumps(tool)
+        assert tool.encoded is tool.encoded
+
+    def test_encodes_plain_tools(self):
+        body = {"model": "m", "tools": [{"type": "function"}]}
+        assert encode_body(body) == json.dumps(body)
@@ -0,0 +1,155 @@
+"""Tests for the LLM response cache."""
+
+import pytest
+
+from vintent.core.providers import CachingCompletionsProvider
+from vintent.core.response_cache import (
+    MemoryResponseCache,
+    SqliteResponseCache,
+    cache_key,
+    get_response_cache,
+    is_cacheable,
+)
+
+TOOL = {"type": "function", "function": {"name": "pick"}}
+REPLY = {"choices": [{"message": {"tool_calls": [{"function": {"name": "pick", "arguments": "{}"}}]}}]}
+
+
+class CountingProvider:
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    async def complete(self, transcripts, tools, parallel_tools=False):
+        self.calls += 1
+        return self.reply
+
+
+class TestCacheKey:
+    def test_ignores_key_order_and_other_fields(self):
+        a = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "stream": False}
+        b = {"messages": [{"content": "hi", "role": "user"}], "model": "m", "stream": True}
+        assert cache_key(a) == cache_key(b)
+
+    def test_depends_on_model_and_sampling_parameters(self):
+        body = {"model": "m", "messages": [], "temperature": 0.3, "max_tokens": 100, "top_p": 1.0}
+        assert cache_key(body) != cache_key({**body, "model": "n"})
+        assert cache_key(body) != cache_key({**body, "temperature": 0.5})
+        assert cache_key(body) != cache_key({**body, "max_tokens": 10})
+        assert cache_key(body) != cache_key({**body, "top_p": 0.5})
+
+    def test_depends_on_endpoint(self):
+        body = {"model": "m", "messages": []}
+        assert cache_key(body, "http://a/v1/") == cache_key(body, "http://a/v1/")
+        assert cache_key(body, "http://a/v1/") != cache_key(body, "http://b/v1/")
+
+
+class TestIsCacheable:
+    def test_requires_tool_calls_or_content(self):
+        assert is_cacheable(REPLY)
+        assert is_cacheable({"choices": [{"message": {"content": "text"}}]})
+        assert not is_cacheable({"choices": [{"message": {"content": " "}}]})
+        assert not is_cacheable({"choices": []})
+        assert not is_cacheable(None)
+
+    def test_rejects_tool_calls_with_malformed_arguments(self):
+        def reply(arguments):
+            return {"choices": [{"message": {"tool_calls": [{"function": {"name": "pick", "arguments": arguments}}]}}]}
+
+        assert is_cacheable(reply('{"x": 1}'))
+        assert is_cacheable(reply(""))
+        assert not is_cacheable(reply('{"x": '))
+        assert not is_cacheable(reply("[1]"))
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    def make(**kwargs):
+        if request.param == "memory":
+            return MemoryResponseCache(**kwargs)
+        return SqliteResponseCache(str(tmp_path / "cache.sqlite"), **kwargs)
+
+    return make
+
+
+class TestBackends:
+    def test_get_returns_copy_and_counts(self, make_cache):
+        cache = make_cache()
+        assert cache.get("k") is None
+        cache.put("k", REPLY)
+        hit = cache.get("k")
+        assert hit == REPLY and hit is not REPLY
+        hit["choices"].clear()
+        assert cache.get("k") == REPLY
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_evicts_least_recently_used(self, make_cache):
+        cache = make_cache(max_entries=2)
+        cache.put("a", REPLY)
+        cache.put("b", REPLY)
+        cache.get("a")
+        cache.put("c", REPLY)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == REPLY
+
+    def test_expires_after_ttl(self, make_cache):
+        cache = make_cache(ttl=-1)
+        cache.put("k", REPLY)
+        assert cache.get("k") is None
+
+    def test_sqlite_persists_between_instances(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        SqliteResponseCache(path).put("k", REPLY)
+        assert SqliteResponseCache(path).get("k") == REPLY
+
+
+class TestGetResponseCache:
+    def test_disabled_by_default(self):
+        assert get_response_cache({}) is None
+
+    def test_shared_per_settings(self):
+        cache = get_response_cache({"ai_cache": "memory", "ai_cache_size": 7})
+        assert cache is get_response_cache({"ai_cache": "memory", "ai_cache_size": 7})
+        assert cache.max_entries == 7
+
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            get_response_cache({"ai_cache": "redis"})
+        with pytest.raises(ValueError):
+            get_response_cache({"ai_cache": "sqlite"})
+
+
+class TestCachingCompletionsProvider:
+    @pytest.mark.asyncio
+    async def test_repeated_request_is_served_from_cache(self):
+        inner = CountingProvider(REPLY)
+        provider = CachingCompletionsProvider(inner, MemoryResponseCache(), model="m")
+        transcripts = [{"role": "user", "content": "plot it", "id": 1}]
+
+        assert await provider.complete(transcripts, [TOOL]) == REPLY
+        assert await provider.complete([{"role": "user", "content": "plot it", "id": 2}], [TOOL]) == REPLY
+        assert inner.calls == 1
+        assert (provider.cache.hits, provider.cache.misses) == (1, 1)
+
+        await provider.complete(transcripts, [TOOL], parallel_tools=True)
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_endpoints_do_not_share_replies(self):
+        inner = CountingProvider(REPLY)
+        cache = MemoryResponseCache()
+        first = CachingCompletionsProvider(inner, cache, model="m", base_url="http://a/v1/")
+        second = CachingCompletionsProvider(inner, cache, model="m", base_url="http://b/v1/")
+
+        await first.complete([], [TOOL])
+        await second.complete([], [TOOL])
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_replies_are_not_cached(self):
+        inner = CountingProvider(None)
+        provider = CachingCompletionsProvider(inner, MemoryResponseCache())
+        await provider.complete([], [TOOL])
+        await provider.complete([], [TOOL])
+        assert inner.calls == 2
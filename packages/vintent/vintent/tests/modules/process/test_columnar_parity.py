@@ -0,0 +1,116 @@
+"""Vectorized analyze paths must return exactly what the row-wise code returns."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from vintent.modules.exceptions import ProcessError
+from vintent.modules.process import columnar, run_process
+from vintent.modules.process.columnar import VECTORIZE_MIN_ROWS, as_columnar
+from vintent.modules.registry import PROCESSES
+from vintent.modules.table import ColumnTable, as_rows
+
+
+def _make_rows(n, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        x = rng.choice([None, 0.0, -0.0, 1.5, float("inf"), rng.uniform(-100, 100), rng.gauss(0, 1e6)])
+        rows.append(
+            {
+                "g": rng.choice(["a", "b", "c", None]),
+                "h": rng.choice([1.0, 2.0, None]),
+                "x": x,
+                "y": rng.choice([None, rng.uniform(0, 10)]),
+                "d": datetime(2024, 1, 1) + timedelta(days=rng.randrange(30)),
+            }
+        )
+    return rows
+
+
+CASES = [
+    ("group_aggregate", {"group_by": "g", "op": "count"}),
+    ("group_aggregate", {"group_by": "g", "op": "mean", "metric": "x"}),
+    ("group_aggregate", {"group_by": "h", "op": "sum", "metric": "y"}),
+    ("group_aggregate", {"group_by": "g", "op": "min", "metric": "x"}),
+    ("group_aggregate", {"group_by": "g", "op": "max", "metric": "x"}),
+    ("group_aggregate", {"group_by": "g", "op": "max", "metric": "missing"}),
+    ("group_aggregate", {"group_by": ["g", "h"], "op": "count"}),
+    ("group_aggregate", {"group_by": ["h", "g"], "op": "mean", "metric": "y"}),
+    ("group_summary_statistics", {"group_by": "g", "fields": ["x", "y"]}),
+    ("time_aggregate", {"date_field": "d", "period": "week", "metric": "y", "op": "mean"}),
+    ("density_estimate", {"field": "y", "group_by": "g", "points": 5}),
+    ("quantiles", {"field": "x"}),
+    ("quantiles", {"field": "y", "quantiles": [0.1, 0.5, 0.99], "group_by": "g"}),
+    ("ecdf", {"field": "x"}),
+    ("ecdf", {"field": "y", "group_by": "h"}),
+    ("cumulative_sum", {"field": "x"}),
+    ("cumulative_sum", {"field": "y", "sort_by": "d"}),
+    ("cumulative_sum", {"field": "y", "sort_by": "x"}),
+    ("percent_change", {"field": "x"}),
+    ("percent_change", {"field": "y", "sort_by": "y"}),
+    ("normalize_minmax", {"field": "x"}),
+    ("normalize_minmax", {"field": "y"}),
+    ("standardize_columns", {"columns": ["x", "y", "x"]}),
+    ("standardize_columns", {"columns": ["y"], "with_mean": False}),
+    ("compute_bins", {"field": "y", "bins": 7}),
+    ("compute_bins", {"field": "x"}),
+    ("outlier_filter", {"field": "y"}),
+    ("outlier_filter", {"field": "x", "method": "zscore", "threshold": 1}),
+]
+
+
+@pytest.mark.parametrize("process_id,params", CASES)
+@pytest.mark.parametrize("n", [0, 1, 5, 300])
+def test_table_input_matches_rows(process_id, params, n):
+    process = PROCESSES.ANALYZE[process_id]
+    rows = _make_rows(n)
+    expected = _outcome(process, rows, params)
+    actual = _outcome(process, ColumnTable.from_rows(rows), params)
+    # repr compares NaN results and -0.0 exactly, unlike ==
+    assert repr(actual) == repr(expected)
+
+
+def _outcome(process, values, params):
+    try:
+        return as_rows(run_process(process, values, params))
+    except ProcessError as e:
+        return str(e)
+
+
+# Processes that convert large row inputs with as_columnar(convert_rows=True)
+ROW_CONVERTING_CASES = [
+    ("ecdf", {"field": "x"}),
+    ("ecdf", {"field": "y", "group_by": "h"}),
+    ("compute_bins", {"field": "y", "bins": 7}),
+]
+
+
+@pytest.mark.parametrize("process_id,params", ROW_CONVERTING_CASES)
+def test_large_row_input_matches_rows(process_id, params, monkeypatch):
+    process = PROCESSES.ANALYZE[process_id]
+    rows = _make_rows(VECTORIZE_MIN_ROWS)
+    # The vectorized path is taken at the threshold and skipped above it
+    assert as_columnar(rows, numeric=[params["field"]]) is not None
+    actual = process["run"](rows, params)
+    monkeypatch.setattr(columnar, "VECTORIZE_MIN_ROWS", len(rows) + 1)
+    expected = process["run"](rows, params)
+    assert as_columnar(rows, numeric=[params["field"]]) is None
+    assert isinstance(expected, list)
+    assert as_rows(actual) == expected
+
+
+def test_vectorized_paths_are_taken():
+    table = ColumnTable.from_rows(_make_rows(50))
+    out = run_process(PROCESSES.ANALYZE["cumulative_sum"], table, {"field": "y"})
+    assert isinstance(out, ColumnTable)
+    out = run_process(PROCESSES.ANALYZE["ecdf"], table, {"field": "y"})
+    assert isinstance(out, ColumnTable)
+
+
+def test_falls_back_for_non_float_columns():
+    rows = [{"x": 1}, {"x": "bad"}, {"x": 3.0}]
+    assert as_columnar(ColumnTable.from_rows(rows), numeric=["x"]) is None
+    out = run_process(PROCESSES.ANALYZE["cumulative_sum"], ColumnTable.from_rows(rows), {"field": "x"})
+    assert [r["x_cumsum"] for r in out] == [1.0, 1.0, 4.0]
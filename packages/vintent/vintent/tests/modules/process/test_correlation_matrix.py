@@ -58,3 +58,29 @@ def test_run_ignores_non_numeric_values():
 
 def test_log_constant_message():
     assert log({}) == "Computed correlation matrix."
+
+def test_run_pairs_rows_with_missing_values_by_row():
+    rows = [
+        {"a": 2, "b": 4, "c": 2},
+        {"a": 1, "b": 2, "c": None},
+        {"a": None, "b": 100, "c": 1},
+        {"a": 3, "b": 6, "c": 3},
+    ]
+    out = run(rows, {})
+    value = {(o["x"], o["y"]): o["value"] for o in out}
+    assert value[("a", "b")] == pytest.approx(1.0)
+    assert value[("b", "a")] == pytest.approx(1.0)
+    assert value[("a", "c")] == pytest.approx(1.0)
+
+def test_run_matches_numpy_on_wide_table():
+    np = pytest.importorskip("numpy")
+    from vintent.modules.table import ColumnTable
+
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(500, 120))
+    rows = [{f"f{j}": v for j, v in enumerate(r)} for r in data.tolist()]
+    out = run(rows, {})
+    assert len(out) == 120 * 120
+    expected = np.corrcoef(data, rowvar=False).ravel()
+    assert [o["value"] for o in out] == pytest.approx(expected.tolist())
+    assert run(ColumnTable.from_rows(rows), {}) == out
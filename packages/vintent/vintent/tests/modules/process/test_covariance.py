@@ -33,3 +33,30 @@ def test_run_raises_on_insufficient_valid_rows():
     with pytest.raises(Exception) as exc:
         run(rows, params)
     assert "covariance_invalid_shape" in str(exc.value)
+
+def test_run_uses_pairwise_complete_rows():
+    rows = [
+        {"a": 1, "b": 2, "c": None},
+        {"a": 2, "b": 4, "c": 10},
+        {"a": 3, "b": 6, "c": 20},
+        {"a": None, "b": 8, "c": 30},
+    ]
+    out = run(rows, {"columns": ["a", "b", "c"]})
+    value = {(o["x"], o["y"]): o["value"] for o in out}
+    assert value[("a", "a")] == pytest.approx(1.0)
+    assert value[("a", "b")] == pytest.approx(2.0)
+    assert value[("b", "b")] == pytest.approx(20 / 3)
+    assert value[("a", "c")] == pytest.approx(5.0)
+    assert value[("c", "c")] == pytest.approx(100.0)
+
+def test_run_reports_undefined_pairs_as_none():
+    rows = [
+        {"a": 1, "b": None},
+        {"a": 2, "b": 5},
+        {"a": 3, "b": None},
+    ]
+    out = run(rows, {"columns": ["a", "b"]})
+    value = {(o["x"], o["y"]): o["value"] for o in out}
+    assert value[("a", "a")] == pytest.approx(1.0)
+    assert value[("a", "b")] is None
+    assert value[("b", "b")] is None
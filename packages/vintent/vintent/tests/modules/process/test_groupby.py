@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from vintent.modules.process.groupby import GroupBy, finite_values
+from vintent.modules.table import ColumnTable
+
+ROWS = [
+    {"a": "x", "b": 1, "v": 2.0},
+    {"a": "y", "b": 1, "v": None},
+    {"a": "x", "b": 2, "v": 4.0},
+    {"a": "x", "b": 1, "v": 6.0},
+    {"a": "y", "b": 1.0, "v": float("nan")},
+]
+
+
+def test_groups_single_field_in_first_seen_order():
+    groups = GroupBy.from_values(ROWS, "a")
+    assert groups.keys == ["x", "y"]
+    assert groups.codes.tolist() == [0, 1, 0, 0, 1]
+    assert groups.sizes() == [3, 2]
+
+
+def test_groups_multiple_fields_as_tuples():
+    groups = GroupBy.from_values(ROWS, ["a", "b"])
+    # 1 and 1.0 share a group, as dict keys do
+    assert groups.keys == [("x", 1), ("y", 1), ("x", 2)]
+    assert groups.sizes() == [2, 2, 1]
+
+
+def test_excluded_rows_do_not_create_groups():
+    values, finite = finite_values(ROWS, "v")
+    groups = GroupBy.from_values(ROWS, "a", include=finite)
+    assert groups.keys == ["x"]
+    assert groups.split(values, finite) == [[2.0, 4.0, 6.0]]
+
+
+def test_aggregate_computes_several_ops_per_group():
+    values, finite = finite_values(ROWS, "v")
+    groups = GroupBy.from_values(ROWS, ["a", "b"])
+    stats = groups.aggregate(values, finite, ["count", "sum", "mean", "median", "std"], quantiles=[0.5])
+    assert stats[0] == {"count": 2, "sum": 8.0, "mean": 4.0, "median": 4.0, "std": 2.0, "quantiles": [4.0]}
+    assert stats[1] is None
+    assert stats[2]["sum"] == 4.0
+
+
+def test_aggregate_rejects_unknown_ops():
+    with pytest.raises(ValueError):
+        GroupBy.from_values(ROWS, "a").aggregate([1] * len(ROWS), ops=["mode"])
+
+
+def test_split_sorts_within_groups():
+    groups = GroupBy.from_columns([["a", "b", "a", "a"]])
+    values = np.array([3.0, 1.0, -1.0, 2.0])
+    assert groups.split(values, sort=True) == [[-1.0, 2.0, 3.0], [1.0]]
+    assert groups.split(values.tolist(), sort=True) == [[-1.0, 2.0, 3.0], [1.0]]
+
+
+def test_regroup_merges_groups_by_derived_key():
+    groups = GroupBy.from_columns([["2024-01-03", "2024-02-01", "bad", "2024-01-09"]])
+    merged = groups.regroup(["2024-01", "2024-02", None, "2024-01"], [True, True, False, True])
+    assert merged.keys == ["2024-01", "2024-02"]
+    assert merged.codes.tolist() == [0, 1, -1, 0]
+
+
+def test_table_and_rows_agree():
+    rows = [{"a": i % 3, "v": float(i) if i % 4 else None} for i in range(50)]
+    table = ColumnTable.from_rows(rows)
+    for values in (rows, table):
+        v, finite = finite_values(values, "v")
+        groups = GroupBy.from_values(values, "a")
+        assert groups.keys == [0, 1, 2]
+        assert groups.aggregate(v, finite, ["sum", "max"]) == GroupBy.from_values(rows, "a").aggregate(
+            *finite_values(rows, "v"), ["sum", "max"]
+        )
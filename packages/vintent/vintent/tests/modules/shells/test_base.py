@@ -0,0 +1,57 @@
+import itertools
+
+import pytest
+
+from vintent.modules.registry import SHELLS, ShellIndex
+from vintent.modules.shells.base import FIELD_TYPES, BaseShell, requirement_vectors, type_histogram
+
+
+def _profile(fields):
+    return {"fields": fields}
+
+
+def _typed_profile(nominal, quantitative, temporal):
+    types = ["nominal"] * nominal + ["quantitative"] * quantitative + ["temporal"] * temporal
+    return _profile({f"f{i}": {"type": t} for i, t in enumerate(types)})
+
+
+class TestRequirementVectors:
+    def test_counts_types_per_signature(self):
+        vectors = requirement_vectors([["nominal", "nominal", "quantitative"], ["any"]])
+        nominal, quantitative, any_ = (FIELD_TYPES.index(t) for t in ("nominal", "quantitative", "any"))
+        assert vectors.shape == (2, len(FIELD_TYPES))
+        assert vectors[0, nominal] == 2
+        assert vectors[0, quantitative] == 1
+        assert vectors[1, any_] == 1
+
+    def test_no_signatures_match_everything(self):
+        assert not requirement_vectors(None).any()
+
+    def test_unknown_type_raises(self):
+        with pytest.raises(ValueError):
+            requirement_vectors([["geo"]])
+
+    def test_histogram_counts_missing_type_as_nominal(self):
+        counts = type_histogram(_profile({"a": {}, "b": {"type": "quantitative"}}))
+        assert counts[FIELD_TYPES.index("nominal")] == 1
+        assert counts[FIELD_TYPES.index("any")] == 2
+
+
+class TestShellIndex:
+    def test_matches_is_applicable(self):
+        index = ShellIndex(SHELLS)
+        for counts in itertools.product(range(4), range(4), range(2)):
+            profile = _typed_profile(*counts)
+            expected = [shell_id for shell_id, shell in SHELLS.items() if shell.is_applicable(profile)]
+            assert index.applicable(profile) == expected
+
+    def test_asks_shells_overriding_is_applicable(self):
+        class NeverShell(BaseShell):
+            def is_applicable(self, profile):
+                return False
+
+        class OpenShell(BaseShell):
+            pass
+
+        index = ShellIndex({"never": NeverShell(), "open": OpenShell()})
+        assert index.applicable(_profile({})) == ["open"]
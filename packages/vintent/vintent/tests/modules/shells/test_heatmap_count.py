@@ -0,0 +1,24 @@
+from vintent.modules.process import run_process
+from vintent.modules.registry import PROCESSES
+from vintent.modules.shells.heatmap_count import HeatmapCountShell
+
+
+def test_counts_each_combination_of_both_fields():
+    shell = HeatmapCountShell()
+    params = {"x": "color", "y": "size"}
+    rows = [
+        {"color": "red", "size": "S"},
+        {"color": "red", "size": "L"},
+        {"color": "blue", "size": "S"},
+        {"color": "red", "size": "S"},
+    ]
+    (process,) = shell.processes({"fields": {}}, params)
+    values = run_process(PROCESSES.ANALYZE[process["id"]], rows, process["params"])
+    assert values == [
+        {"color": "red", "size": "S", "count": 2},
+        {"color": "red", "size": "L", "count": 1},
+        {"color": "blue", "size": "S", "count": 1},
+    ]
+    spec = shell.compile(params, values, "vega-lite")
+    assert spec["data"]["values"] == values
+    assert "transform" not in spec
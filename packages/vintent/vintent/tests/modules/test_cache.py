@@ -0,0 +1,43 @@
+from vintent.modules.cache import DatasetCache, dataset_key
+from vintent.modules.profiler import profile_rows
+from vintent.modules.table import ColumnTable
+
+
+def _entry(n):
+    table = ColumnTable.from_rows([{"x": float(i)} for i in range(n)])
+    return table, profile_rows(table)
+
+
+def test_dataset_key_missing_file():
+    assert dataset_key("/nonexistent/path/file.csv") is None
+
+
+def test_lru_eviction_by_memory_budget():
+    table, profile = _entry(100)
+    cache = DatasetCache(max_bytes=table.nbytes * 2)
+    cache.put(("a", 1, 1), table, profile)
+    cache.put(("b", 1, 1), table, profile)
+    assert cache.get(("a", 1, 1)) is not None
+    cache.put(("c", 1, 1), table, profile)
+    assert cache.get(("b", 1, 1)) is None
+    assert cache.get(("a", 1, 1)) is not None
+    assert cache.total_bytes == table.nbytes * 2
+
+
+def test_oversized_and_stale_entries():
+    table, profile = _entry(100)
+    cache = DatasetCache(max_bytes=table.nbytes - 1)
+    cache.put(("a", 1, 1), table, profile)
+    assert len(cache) == 0
+    cache = DatasetCache()
+    cache.put(("a", 1, 1), table, profile)
+    cache.put(("a", 2, 2), table, profile)
+    assert len(cache) == 1
+    assert cache.get(("a", 1, 1)) is None
+
+
+def test_table_nbytes_counts_objects():
+    numeric = ColumnTable.from_rows([{"x": 1.0}] * 10)
+    assert numeric.nbytes == 10 * 8 + 10
+    text = ColumnTable.from_rows([{"x": "a" * 100}] * 10)
+    assert text.nbytes > 10 * 100
@@ -0,0 +1,72 @@
+import math
+from datetime import datetime
+
+import pytest
+
+from vintent.modules.channel import ALIGNMENT, MAGIC, decode_rows, detach_data, encode_rows, encode_table
+from vintent.modules.table import ColumnTable
+
+
+def test_roundtrip_preserves_values_and_nulls():
+    rows = [
+        {"x": 1.5, "name": "a", "flag": True, "when": datetime(2024, 1, 2, 3, 4)},
+        {"x": None, "name": None, "flag": 1, "when": None},
+        {"x": 3, "name": "a", "flag": False},
+    ]
+    out = decode_rows(encode_rows(rows))
+    assert out == [
+        {"x": 1.5, "name": "a", "flag": True, "when": "2024-01-02T03:04:00"},
+        {"x": None, "name": None, "flag": 1, "when": None},
+        {"x": 3.0, "name": "a", "flag": False, "when": None},
+    ]
+    assert out[1]["flag"] is not True
+
+
+def test_nan_becomes_null():
+    assert decode_rows(encode_rows([{"x": math.nan}, {"x": 2.0}])) == [{"x": None}, {"x": 2.0}]
+
+
+def test_column_buffers_are_aligned():
+    import json
+    import struct
+
+    buffer = encode_rows([{"a": 1.0, "b": "x"}] * 3)
+    (length,) = struct.unpack_from("<I", buffer, len(MAGIC))
+    header = json.loads(buffer[len(MAGIC) + 4 : len(MAGIC) + 4 + length])
+    assert buffer.startswith(MAGIC)
+    assert header["row_count"] == 3
+    assert all(c["offset"] % ALIGNMENT == 0 for c in header["columns"])
+
+
+def test_empty_rows():
+    assert decode_rows(encode_rows([])) == []
+    assert decode_rows(encode_rows([{}, {}])) == [{}, {}]
+
+
+def test_encode_table_matches_encode_rows():
+    table = ColumnTable.from_columns(
+        {
+            "n": [1, None, 3],
+            "x": [1.5, math.inf, None],
+            "name": ["a", None, "a"],
+            "flag": [True, 1, None],
+            "when": [datetime(2024, 1, 2), None, datetime(2024, 1, 3)],
+            "empty": [None, None, None],
+        }
+    ).sanitized()
+    assert encode_table(table) == encode_rows(table.to_rows())
+    assert encode_table(table.with_column("x", table.data["x"], table.mask["x"])) == encode_rows(table.to_rows())
+    assert decode_rows(encode_table(ColumnTable.from_rows([]))) == []
+
+
+def test_rejects_foreign_buffer():
+    with pytest.raises(ValueError):
+        decode_rows(b"not a buffer")
+
+
+def test_detach_data_replaces_inline_values():
+    spec = {"data": {"values": [{"x": 1}]}, "mark": "point"}
+    assert detach_data(spec, "table") == [{"x": 1}]
+    assert spec["data"] == {"name": "table"}
+    assert detach_data({"data": {"url": "a.csv"}}) is None
+    assert detach_data({"layer": []}) is None
@@ -1,5 +1,6 @@
 """Tests for the pipeline module."""
 
+import asyncio
 import json
 import os
 import tempfile
@@ -21,6 +22,8 @@ from vintent.modules.pipeline import (
     Phase,
     Pipeline,
     PipelineContext,
+    ReducePhase,
+    RoutePhase,
     ValidatePhase,
     create_default_pipeline,
     create_pipeline,
@@ -32,6 +35,7 @@ from vintent.modules.pipeline import (
     ExtractPhase,
     ParseIntentPhase,
 )
+from vintent.modules.cache import DatasetCache
 from vintent.modules.profiler import profile_rows
 from vintent.modules.schemas import CompletionsReply
 
@@ -194,6 +198,27 @@ class TestPipelineContext:
         assert ctx.errors[0]["message"] == "Test error"
         assert "Error: Test error" in ctx.logs
 
+    def test_apply_process_derives_profile_lazily(self, sample_transcripts, monkeypatch):
+        from vintent.modules import pipeline as pipeline_module
+        from vintent.modules.registry import PROCESSES
+
+        calls = []
+        monkeypatch.setattr(
+            pipeline_module, "derive_profile", lambda *args: calls.append(args) or profile_rows(args[2])
+        )
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.values = [{"x": 1.0}, {"x": 2.0}, {"x": 3.0}]
+        ctx.profile = profile_rows(ctx.values)
+        ctx.apply_process(PROCESSES.EXTRACT["range_filter"], {"field": "x", "min": 2})
+        assert calls == []
+        assert ctx.profile["row_count"] == 2
+        assert ctx.profile["row_count"] == 2
+        assert len(calls) == 1
+        assert calls[0][1] == "rows_subset"
+        ctx.apply_process(PROCESSES.ANALYZE["cumulative_sum"], {"field": "x"})
+        assert "x_cumsum" in ctx.profile["fields"]
+        assert calls[1][1] == "columns_added"
+
     def test_to_result_returns_correct_structure(self, sample_transcripts):
         ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
         ctx.logs.append("Log message")
@@ -238,6 +263,58 @@ class TestLoadDataPhase:
         finally:
             os.unlink(temp_path)
 
+    @pytest.mark.asyncio
+    async def test_reuses_cached_dataset_until_file_changes(self, sample_csv_content, sample_transcripts):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(sample_csv_content)
+            temp_path = f.name
+
+        try:
+            cache = DatasetCache()
+            phase = LoadDataPhase(cache=cache)
+            provider = MockCompletionsProvider()
+
+            first = PipelineContext(transcripts=sample_transcripts, file_name=temp_path)
+            await phase.run(first, provider)
+            second = PipelineContext(transcripts=sample_transcripts, file_name=temp_path)
+            await phase.run(second, provider)
+            assert second.values is first.values
+            assert second.profile is first.profile
+            assert (cache.hits, cache.misses) == (1, 1)
+
+            with open(temp_path, "a") as f:
+                f.write("\nDana,41,70.0")
+            third = PipelineContext(transcripts=sample_transcripts, file_name=temp_path)
+            await phase.run(third, provider)
+            assert third.profile["row_count"] == 4
+            assert len(cache) == 1
+        finally:
+            os.unlink(temp_path)
+
+    @pytest.mark.asyncio
+    async def test_loads_from_snapshot_without_parsing(
+        self, sample_csv_content, sample_transcripts, tmp_path, monkeypatch
+    ):
+        from vintent.modules import pipeline as pipeline_module
+
+        data_path = tmp_path / "data.csv"
+        data_path.write_text(sample_csv_content)
+        snapshot_dir = str(tmp_path / "snapshots")
+        provider = MockCompletionsProvider()
+
+        first = PipelineContext(transcripts=sample_transcripts, file_name=str(data_path))
+        await LoadDataPhase(cache=None, snapshot_dir=snapshot_dir).run(first, provider)
+        assert len(os.listdir(snapshot_dir)) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("dataset was parsed")
+
+        monkeypatch.setattr(pipeline_module, "table_from_stream", fail)
+        second = PipelineContext(transcripts=sample_transcripts, file_name=str(data_path))
+        await LoadDataPhase(cache=DatasetCache(), snapshot_dir=snapshot_dir).run(second, provider)
+        assert second.values.to_rows() == first.values.to_rows()
+        assert second.profile == first.profile
+
     @pytest.mark.asyncio
     async def test_file_not_found_adds_error(self, sample_transcripts):
         ctx = PipelineContext(
@@ -698,12 +775,149 @@ class TestCompilePhase:
         assert data_values[2]["y"] is None
         assert data_values[3]["y"] == 10.0
 
+    @pytest.mark.asyncio
+    async def test_binary_channel_moves_values_to_datasets(self, sample_transcripts, sample_values):
+        from vintent.modules.channel import DATASET_NAME, decode_rows
+        from vintent.modules.registry import SHELLS
+
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.values = sample_values
+        ctx.profile = profile_rows(sample_values)
+        ctx.shell = SHELLS.get("scatter")
+        ctx.shell_id = "scatter"
+        ctx.params = {"x": "age", "y": "score"}
+
+        await CompilePhase("binary").run(ctx, MockCompletionsProvider())
+
+        assert ctx.spec["data"] == {"name": DATASET_NAME}
+        rows = decode_rows(ctx.datasets[DATASET_NAME])
+        assert [r["age"] for r in rows] == [v["age"] for v in sample_values]
+        assert ctx.to_result()["datasets"] is ctx.datasets
+
+    @pytest.mark.asyncio
+    async def test_binary_channel_encodes_tables_without_rows(self, sample_transcripts, sample_values, monkeypatch):
+        from vintent.modules.channel import DATASET_NAME, decode_rows, encode_rows
+        from vintent.modules.registry import SHELLS
+        from vintent.modules.table import ColumnTable
+
+        table = ColumnTable.from_rows(sample_values)
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.values = table
+        ctx.profile = profile_rows(sample_values)
+        ctx.shell = SHELLS.get("scatter")
+        ctx.shell_id = "scatter"
+        ctx.params = {"x": "age", "y": "score"}
+        inline = ctx.shell.compile(ctx.params, sample_values, "vega-lite")
+        built = []
+        to_rows = ColumnTable.to_rows
+        monkeypatch.setattr(ColumnTable, "to_rows", lambda self: built.append(len(self)) or to_rows(self))
+
+        await CompilePhase("binary").run(ctx, MockCompletionsProvider())
+
+        assert max(built) <= 1
+        assert ctx.spec == {**inline, "data": {"name": DATASET_NAME}}
+        assert decode_rows(ctx.datasets[DATASET_NAME]) == decode_rows(encode_rows(sample_values))
+
+    @pytest.mark.asyncio
+    async def test_binary_channel_detaches_derived_rows(self, sample_transcripts):
+        from vintent.modules.channel import DATASET_NAME, decode_rows
+        from vintent.modules.registry import SHELLS
+        from vintent.modules.table import ColumnTable
+
+        values = [{"g": "a", "count": 3}, {"g": "b", "count": 1}]
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.values = ColumnTable.from_rows(values)
+        ctx.shell = SHELLS.get("treemap")
+        ctx.shell_id = "treemap"
+        ctx.params = {"category": "g"}
+
+        await CompilePhase("binary").run(ctx, MockCompletionsProvider())
+
+        assert ctx.spec["data"] == {"name": DATASET_NAME}
+        assert {"x", "y"} <= set(decode_rows(ctx.datasets[DATASET_NAME])[0])
+
+    @pytest.mark.asyncio
+    async def test_inline_channel_has_no_datasets(self, sample_transcripts, sample_values):
+        from vintent.modules.registry import SHELLS
+
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.values = sample_values
+        ctx.profile = profile_rows(sample_values)
+        ctx.shell = SHELLS.get("scatter")
+        ctx.params = {"x": "age", "y": "score"}
+
+        await CompilePhase().run(ctx, MockCompletionsProvider())
+
+        assert "values" in ctx.spec["data"]
+        assert "datasets" not in ctx.to_result()
+
+    @pytest.mark.asyncio
+    async def test_sanitizes_table_without_touching_clean_rows(self, sample_transcripts):
+        from vintent.modules.registry import SHELLS
+        from vintent.modules.table import ColumnTable
+
+        rows = [{"x": 1, "y": float("inf")}, {"x": 2, "y": 10.0}]
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.values = ColumnTable.from_rows(rows)
+        ctx.profile = profile_rows([{"x": 1, "y": 10}, {"x": 2, "y": 20}])
+        ctx.shell = SHELLS.get("scatter")
+        ctx.params = {"x": "x", "y": "y"}
+
+        await CompilePhase().run(ctx, MockCompletionsProvider())
+
+        assert ctx.spec["data"]["values"] == [{"x": 1, "y": None}, {"x": 2, "y": 10.0}]
+        assert ctx.values.column("y")[0] == float("inf")
+
     @pytest.mark.asyncio
     async def test_phase_name(self):
         phase = CompilePhase()
         assert phase.name == "compile"
 
 
+# =============================================================================
+# ReducePhase Tests
+# =============================================================================
+
+
+class TestReducePhase:
+    @pytest.mark.asyncio
+    async def test_keeps_values_within_budget(self, sample_transcripts, sample_values):
+        from vintent.modules.registry import SHELLS
+
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.values = sample_values
+        ctx.shell = SHELLS.get("scatter")
+        ctx.params = {"x": "age", "y": "score"}
+
+        await ReducePhase(point_budget=len(sample_values)).run(ctx, MockCompletionsProvider())
+
+        assert ctx.reduction is None
+        assert ctx.logs == []
+
+    @pytest.mark.asyncio
+    async def test_bins_large_scatter_before_compile(self, sample_transcripts):
+        from vintent.modules.registry import SHELLS
+
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.values = [{"x": i % 37, "y": (i * 7) % 101} for i in range(2000)]
+        ctx.shell = SHELLS.get("scatter")
+        ctx.params = {"x": "x", "y": "y"}
+
+        await ReducePhase(point_budget=100).run(ctx, MockCompletionsProvider())
+        await CompilePhase().run(ctx, MockCompletionsProvider())
+
+        assert ctx.reduction.strategy == "bin_2d"
+        assert ctx.logs == [ctx.reduction.log()]
+        values = ctx.spec["data"]["values"]
+        assert len(values) <= 100
+        assert sum(v["count"] for v in values) == 2000
+        assert ctx.spec["encoding"]["size"]["field"] == "count"
+
+    @pytest.mark.asyncio
+    async def test_phase_name(self):
+        assert ReducePhase().name == "reduce"
+
+
 # =============================================================================
 # Pipeline Tests
 # =============================================================================
@@ -821,17 +1035,369 @@ class TestPipeline:
         assert result is ctx
 
 
+class RoutingCompletionsProvider(CompletionsProvider):
+    """Mock provider that answers by tool name and yields to the event loop."""
+
+    def __init__(self, responses: Dict[str, Optional[Dict]], delays: Optional[Dict[str, float]] = None):
+        self.responses = responses
+        self.delays = delays or {}
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def complete(self, transcripts, tools, parallel_tools=False):
+        name = tools[0]["function"]["name"]
+        self.calls.append(name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(name, 0.01))
+        finally:
+            self.in_flight -= 1
+        return self.responses.get(name)
+
+
+class TestParallelPipeline:
+    def test_groups_independent_decision_phases(self):
+        groups = create_sequential_pipeline(parallel=True).schedule()
+        assert [[p.name for p in g] for g in groups][:3] == [
+            ["load_data"],
+            ["parse_intent", "extract", "choose_shell"],
+            ["fill_params"],
+        ]
+        assert all(len(g) == 1 for g in create_sequential_pipeline().schedule())
+
+    async def _run(self, sample_transcripts, sample_profile, goal):
+        provider = RoutingCompletionsProvider(
+            {
+                "parse_intent": make_tool_response("parse_intent", {"shell_fields": ["age"], "goal": goal}),
+                "choose_shell": make_tool_response("choose_shell", {"shellId": "scatter"}),
+            }
+        )
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.profile = sample_profile
+        phases = [ParseIntentPhase(), ExtractPhase(), ChooseShellPhase()]
+        await Pipeline(phases, parallel=True).run(ctx, provider)
+        return ctx, provider
+
+    @pytest.mark.asyncio
+    async def test_keeps_speculative_shell_matching_goal(self, sample_transcripts, sample_profile):
+        ctx, provider = await self._run(sample_transcripts, sample_profile, "relationship")
+
+        assert provider.max_in_flight == 3
+        assert provider.calls.count("choose_shell") == 1
+        assert ctx.parsed_intent["goal"] == "relationship"
+        assert ctx.shell_id == "scatter"
+        assert ctx.logs == ["Visualizing Scatter Plot."]
+
+    @pytest.mark.asyncio
+    async def test_reruns_shell_choice_when_goal_rules_it_out(self, sample_transcripts, sample_profile):
+        ctx, provider = await self._run(sample_transcripts, sample_profile, "ranking")
+
+        assert provider.calls.count("choose_shell") == 2
+        assert ctx.shell_id == "scatter"
+        assert ctx.logs == ["Visualizing Scatter Plot."]
+
+    @pytest.mark.asyncio
+    async def test_discards_later_results_after_stop(self, sample_transcripts, sample_profile):
+        class StoppingPhase(Phase):
+            reads = ()
+
+            @property
+            def name(self) -> str:
+                return "stopping"
+
+            async def run(self, ctx, provider):
+                ctx.stop("Stopped early")
+
+        provider = RoutingCompletionsProvider(
+            {"choose_shell": make_tool_response("choose_shell", {"shellId": "scatter"})}
+        )
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.profile = sample_profile
+        await Pipeline([StoppingPhase(), ChooseShellPhase()], parallel=True).run(ctx, provider)
+
+        assert ctx.shell is None
+        assert ctx.logs == ["Stopped early"]
+
+
+class TestSpeculativeFill:
+    def _provider(self, delays=None):
+        return RoutingCompletionsProvider(
+            {
+                "choose_shell": make_tool_response("choose_shell", {"shellId": "scatter"}),
+                "fill_shell_params": make_tool_response("fill_shell_params", {"x": "age", "y": "score"}),
+            },
+            delays,
+        )
+
+    def _ctx(self, sample_transcripts, sample_profile, goal):
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.profile = sample_profile
+        ctx.parsed_intent = {"goal": goal}
+        return ctx
+
+    def test_candidates_match_parsed_goal(self, sample_profile):
+        from vintent.modules.registry import SHELLS
+        from vintent.modules.tools import candidate_shells
+
+        candidates = candidate_shells(sample_profile, {"goal": "relationship"}, 3)
+        assert len(candidates) == 3
+        assert all("relationship" in SHELLS[c].goals for c in candidates)
+        assert candidate_shells(sample_profile, None, 3) == []
+        assert candidate_shells(sample_profile, {"goal": "relationship"}, 0) == []
+
+    @pytest.mark.asyncio
+    async def test_uses_params_filled_for_chosen_shell(self, sample_transcripts, sample_profile):
+        from vintent.modules.tools import candidate_shells
+
+        provider = self._provider()
+        ctx = self._ctx(sample_transcripts, sample_profile, "relationship")
+        count = len(candidate_shells(sample_profile, ctx.parsed_intent, 100))
+
+        await Pipeline([ChooseShellPhase(fill_candidates=count), FillParamsPhase()]).run(ctx, provider)
+
+        assert provider.max_in_flight == count + 1
+        assert provider.calls.count("fill_shell_params") == count
+        assert ctx.shell_id == "scatter"
+        assert ctx.params == {"x": "age", "y": "score"}
+
+    @pytest.mark.asyncio
+    async def test_cancels_requests_for_other_shells(self, sample_transcripts, sample_profile):
+        provider = self._provider({"fill_shell_params": 0.2})
+        ctx = self._ctx(sample_transcripts, sample_profile, "ranking")
+
+        await ChooseShellPhase(fill_candidates=2).run(ctx, provider)
+
+        assert provider.calls.count("fill_shell_params") == 2
+        assert provider.in_flight == 0
+        assert ctx.prefilled == {}
+
+        await FillParamsPhase().run(ctx, provider)
+        assert provider.calls.count("fill_shell_params") == 3
+        assert ctx.params == {"x": "age", "y": "score"}
+
+    @pytest.mark.asyncio
+    async def test_no_speculation_without_goal(self, sample_transcripts, sample_profile):
+        provider = self._provider()
+        ctx = self._ctx(sample_transcripts, sample_profile, None)
+
+        await ChooseShellPhase(fill_candidates=3).run(ctx, provider)
+
+        assert provider.calls == ["choose_shell"]
+
+    @pytest.mark.asyncio
+    async def test_drops_params_filled_before_extraction(self, sample_transcripts, sample_values):
+        from vintent.modules.profiler import profile_rows
+        from vintent.modules.tools import candidate_shells
+
+        class FillProvider(RoutingCompletionsProvider):
+            # Speculative fills pick a field extraction removes, later fills one it keeps
+            async def complete(self, transcripts, tools, parallel_tools=False):
+                reply = await super().complete(transcripts, tools, parallel_tools)
+                if tools[0]["function"]["name"] != "fill_shell_params":
+                    return reply
+                field = "age" if self.calls.count("fill_shell_params") <= count else "score"
+                return make_tool_response("fill_shell_params", {"field": field})
+
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.values = sample_values
+        ctx.profile = profile_rows(sample_values)
+        ctx.parsed_intent = {"goal": "distribution"}
+        count = len(candidate_shells(ctx.profile, ctx.parsed_intent, 100))
+        provider = FillProvider(
+            {
+                "choose_process_none": make_tool_response(
+                    "choose_process_project_columns", {"columns": ["name", "score"]}
+                ),
+                "choose_shell": make_tool_response("choose_shell", {"shellId": "histogram"}),
+            }
+        )
+        phases = [ExtractPhase(), ChooseShellPhase(fill_candidates=count), FillParamsPhase()]
+
+        await Pipeline(phases, parallel=True).run(ctx, provider)
+
+        assert provider.calls.count("fill_shell_params") == count + 1
+        assert ctx.errors == []
+        assert ctx.shell_id == "histogram"
+        assert ctx.params == {"field": "score"}
+
+    @pytest.mark.asyncio
+    async def test_no_speculation_in_parallel_pipeline(self, sample_transcripts, sample_profile):
+        provider = self._provider()
+        provider.responses["parse_intent"] = make_tool_response(
+            "parse_intent", {"shell_fields": ["age", "score"], "goal": "relationship"}
+        )
+        ctx = PipelineContext(transcripts=sample_transcripts, file_name="test.csv")
+        ctx.profile = sample_profile
+        phases = [ParseIntentPhase(), ExtractPhase(), ChooseShellPhase(fill_candidates=3), FillParamsPhase()]
+
+        await Pipeline(phases, parallel=True).run(ctx, provider)
+
+        assert provider.calls.count("fill_shell_params") == 1
+        assert ctx.shell_id == "scatter"
+        assert ctx.params == {"x": "age", "y": "score"}
+
+
+class TestToolMemoization:
+    def test_tools_are_reused_for_same_fingerprint(self, sample_profile):
+        from vintent.modules.profiler import profile_rows
+        from vintent.modules.registry import PROCESSES, SHELLS
+        from vintent.modules.tools import (
+            build_choose_process_tools,
+            build_choose_shell_tool,
+            build_fill_shell_params_tool,
+            build_parse_intent_tool,
+        )
+
+        # Same names, types and values, different statistics
+        same = profile_rows(
+            [
+                {"name": "Alice", "age": 40, "score": 1.0},
+                {"name": "Bob", "age": 45, "score": 2.0},
+                {"name": "Charlie", "age": 50, "score": 3.0},
+            ]
+        )
+        intent = {"goal": "relationship", "shell_fields": ["age"], "extract_fields": []}
+
+        assert build_choose_shell_tool(sample_profile, intent) is build_choose_shell_tool(same, intent)
+        assert build_parse_intent_tool(sample_profile) is build_parse_intent_tool(same)
+        assert build_fill_shell_params_tool(SHELLS["scatter"], sample_profile, intent) is (
+            build_fill_shell_params_tool(SHELLS["scatter"], same, intent)
+        )
+        first = build_choose_process_tools(PROCESSES.EXTRACT, sample_profile)
+        second = build_choose_process_tools(PROCESSES.EXTRACT, same)
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_tools_change_with_fingerprint(self, sample_profile):
+        from vintent.modules.profiler import profile_rows
+        from vintent.modules.tools import build_choose_shell_tool, build_parse_intent_tool
+
+        other = profile_rows([{"name": "Dana", "age": 30, "score": 85.5}])
+
+        assert build_parse_intent_tool(sample_profile) is not build_parse_intent_tool(other)
+        assert build_choose_shell_tool(sample_profile, {"goal": "trend"}) is not (
+            build_choose_shell_tool(sample_profile, {"goal": "relationship"})
+        )
+
+
+class TestRoutePhase:
+    def _ctx(self, message, profile):
+        ctx = PipelineContext(transcripts=[{"role": "user", "content": message}], file_name="test.csv")
+        ctx.profile = profile
+        return ctx
+
+    @pytest.mark.asyncio
+    async def test_routes_request_naming_shell_and_fields(self, sample_profile):
+        ctx = self._ctx("Show me a scatter plot of age vs score", sample_profile)
+
+        await RoutePhase().run(ctx, MockCompletionsProvider())
+
+        assert ctx.routed
+        assert ctx.shell_id == "scatter"
+        assert ctx.params == {"x": "age", "y": "score"}
+        assert ctx.logs == ["Visualizing Scatter Plot."]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Show me the data",  # no shell keyword
+            "Histogram of age and score",  # more fields than the shell requires
+            "Scatter plot of age vs score where age is above 26",  # needs extraction
+            "Scatter plot of the top 2 ages vs score",  # numbers
+            "Histogram of score with a density curve",  # several shells
+        ],
+    )
+    async def test_leaves_other_requests_to_llm(self, sample_profile, message):
+        ctx = self._ctx(message, sample_profile)
+
+        await RoutePhase().run(ctx, MockCompletionsProvider())
+
+        assert not ctx.routed
+        assert ctx.shell is None
+        assert ctx.params == {}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Histogram of age in Berlin",  # value of a field
+            "Histogram of age for female patients",
+            "Histogram of age in ME",  # value that is also a filler word
+            "Histogram of age, no outliers",  # qualifier outside the vocabulary
+            "Histogram of age with log scale",
+        ],
+    )
+    async def test_leaves_qualified_requests_to_llm(self, message):
+        from vintent.modules.profiler import profile_rows
+
+        profile = profile_rows(
+            [
+                {"age": 30, "city": "Berlin", "sex": "female", "state": "ME"},
+                {"age": 41, "city": "Paris", "sex": "male", "state": "NY"},
+            ]
+        )
+        ctx = self._ctx(message, profile)
+
+        await RoutePhase().run(ctx, MockCompletionsProvider())
+
+        assert not ctx.routed
+        assert ctx.shell is None
+
+    @pytest.mark.asyncio
+    async def test_routed_request_makes_no_llm_calls(self, sample_csv_content, sample_transcripts):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(sample_csv_content)
+            temp_path = f.name
+
+        try:
+            for combine in (False, True):
+                provider = MockCompletionsProvider()
+                ctx = PipelineContext(transcripts=sample_transcripts, file_name=temp_path)
+
+                await create_pipeline(combine, fast_path=True).run(ctx, provider)
+
+                assert provider.call_count == 0
+                assert ctx.errors == []
+                assert ctx.spec["encoding"]["x"]["field"] == "age"
+        finally:
+            os.unlink(temp_path)
+
+    @pytest.mark.asyncio
+    async def test_unrouted_request_uses_llm_phases(self, sample_csv_content):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(sample_csv_content)
+            temp_path = f.name
+
+        try:
+            provider = MockCompletionsProvider()
+            ctx = PipelineContext(
+                transcripts=[{"role": "user", "content": "How do age and score relate?"}],
+                file_name=temp_path,
+            )
+
+            await create_sequential_pipeline(fast_path=True).run(ctx, provider)
+
+            assert not ctx.routed
+            assert provider.call_count == 3  # parse_intent, extract, choose_shell
+        finally:
+            os.unlink(temp_path)
+
+
 class TestCreateDefaultPipeline:
     def test_creates_optimized_pipeline_with_combined_phase(self):
         pipeline = create_default_pipeline()
 
-        assert len(pipeline.phases) == 6
+        assert len(pipeline.phases) == 7
         assert isinstance(pipeline.phases[0], LoadDataPhase)
         assert isinstance(pipeline.phases[1], CombinedDecisionPhase)
         assert isinstance(pipeline.phases[2], FillParamsPhase)
         assert isinstance(pipeline.phases[3], AnalyzePhase)
         assert isinstance(pipeline.phases[4], ValidatePhase)
-        assert isinstance(pipeline.phases[5], CompilePhase)
+        assert isinstance(pipeline.phases[5], ReducePhase)
+        assert isinstance(pipeline.phases[6], CompilePhase)
 
     def test_phase_names_are_unique(self):
         pipeline = create_default_pipeline()
@@ -845,7 +1411,7 @@ class TestCreateSequentialPipeline:
     def test_creates_sequential_pipeline_with_separate_phases(self):
         pipeline = create_sequential_pipeline()
 
-        assert len(pipeline.phases) == 8
+        assert len(pipeline.phases) == 9
         assert isinstance(pipeline.phases[0], LoadDataPhase)
         assert isinstance(pipeline.phases[1], ParseIntentPhase)
         assert isinstance(pipeline.phases[2], ExtractPhase)
@@ -853,7 +1419,8 @@ class TestCreateSequentialPipeline:
         assert isinstance(pipeline.phases[4], FillParamsPhase)
         assert isinstance(pipeline.phases[5], AnalyzePhase)
         assert isinstance(pipeline.phases[6], ValidatePhase)
-        assert isinstance(pipeline.phases[7], CompilePhase)
+        assert isinstance(pipeline.phases[7], ReducePhase)
+        assert isinstance(pipeline.phases[8], CompilePhase)
 
     def test_phase_names_are_unique(self):
         pipeline = create_sequential_pipeline()
@@ -866,19 +1433,19 @@ class TestCreatePipeline:
 
     def test_combined_mode_returns_default_pipeline(self):
         pipeline = create_pipeline(combine=True)
-        assert len(pipeline.phases) == 6
+        assert len(pipeline.phases) == 7
         assert isinstance(pipeline.phases[1], CombinedDecisionPhase)
 
     def test_sequential_mode_returns_sequential_pipeline(self):
         pipeline = create_pipeline(combine=False)
-        assert len(pipeline.phases) == 8
+        assert len(pipeline.phases) == 9
         assert isinstance(pipeline.phases[1], ParseIntentPhase)
         assert isinstance(pipeline.phases[2], ExtractPhase)
         assert isinstance(pipeline.phases[3], ChooseShellPhase)
 
     def test_default_mode_is_sequential(self):
         pipeline = create_pipeline()
-        assert len(pipeline.phases) == 8
+        assert len(pipeline.phases) == 9
         assert isinstance(pipeline.phases[1], ParseIntentPhase)
 
 
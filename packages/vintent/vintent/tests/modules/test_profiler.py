@@ -1,14 +1,32 @@
+import io
+import os
+import subprocess
+import sys
 import pytest
 from datetime import datetime
 from vintent.modules.profiler import (
+    cast_column,
+    cast_value,
+    derive_profile,
+    profile_batches,
     profile_csv,
+    profile_rows,
     profile_tabular,
     detect_delimiter,
+    iter_tabular_batches,
+    read_header_region,
     rows_from_tab,
     rows_from_tabular,
     skip_comment_lines,
+    sniff_column_type,
+    StreamingProfiler,
+    table_from_stream,
     MAX_ENUM_VALUES,
 )
+from vintent.modules.process import process_effect, process_writes, run_process
+from vintent.modules.registry import PROCESSES
+from vintent.modules.sketch import HyperLogLog, hash_values
+from vintent.modules.table import ColumnTable
 
 def test_basic_profile_counts():
     csv_text="a,b,c\n1,x,2024-01-01\n2,y,2024-01-02\n3,x,2024-01-03\n"
@@ -187,3 +205,189 @@ def test_profile_tabular_with_comments():
     profile = profile_tabular(tab_text)
     assert profile["row_count"] == 2
     assert set(profile["fields"].keys()) == {"col:1", "col:2", "col:3"}
+
+
+# Streaming loader tests
+
+def test_iter_tabular_batches_splits_rows():
+    text = "a,b\n1,x\n2,y\n3,z\n"
+    batches = list(iter_tabular_batches(io.StringIO(text), batch_size=2))
+    assert [len(b) for b in batches] == [2, 1]
+    assert all(b.field_names == ["a", "b"] for b in batches)
+
+
+def test_table_from_stream_matches_rows_across_batches():
+    text = "# comment\na,b\n1,x\n\n2,\nfoo,z\n"
+    table = table_from_stream(io.StringIO(text), batch_size=1)
+    rows = rows_from_tabular(text)
+    assert table.to_rows() == rows
+    assert table.kinds["a"] == "nominal"
+    assert profile_rows(table) == profile_rows(rows)
+
+
+def test_table_from_stream_header_only():
+    table = table_from_stream(io.StringIO("a,b\n"))
+    assert len(table) == 0
+    assert table.field_names == ["a", "b"]
+
+
+def test_read_header_region_consumes_only_comments():
+    lines = iter(["# c1\n", "// c2\n", "1\t2\n", "3\t4\n"])
+    first, delimiter = read_header_region(lines)
+    assert first == "1\t2\n"
+    assert delimiter == "\t"
+    assert next(lines) == "3\t4\n"
+
+
+# Column type sniffing tests
+
+def test_sniff_column_type():
+    assert sniff_column_type(["1", "2.5", "-3e2"]) == "quantitative"
+    assert sniff_column_type(["2024-01-01", "2024-01-02T10:00:00Z"]) == "temporal"
+    assert sniff_column_type(["gene1", "gene2"]) == "nominal"
+    assert sniff_column_type([]) == "nominal"
+
+
+def test_cast_column_matches_cast_value():
+    cells = ["1", "", "2.5", None, "inf", "x", "2024-01-01", "20240101"]
+    expected = [None if not c else cast_value(c) for c in cells]
+    assert cast_column(cells) == expected
+    assert cast_column(cells)[4] is None
+
+
+def test_cast_column_falls_back_on_mismatch():
+    cells = ["1", "2", "3", "n/a"]
+    assert cast_column(cells) == [1.0, 2.0, 3.0, "n/a"]
+    cells = ["2024-01-01", "2024-01-02", "2024", "later"]
+    assert cast_column(cells) == [datetime(2024, 1, 1), datetime(2024, 1, 2), 2024.0, "later"]
+
+
+def test_cast_value_skips_parsing_for_plain_text():
+    assert cast_value("BRCA1") == "BRCA1"
+    assert cast_value(" 1_000 ") == 1000.0
+    assert cast_value("NaN") is None
+
+
+# Streaming profiler tests
+
+def test_profile_batches_matches_single_table():
+    text = "a,b\n" + "".join(f"{i},g{i % 7}\n" for i in range(250))
+    batches = list(iter_tabular_batches(io.StringIO(text), batch_size=40))
+    assert profile_batches(batches) == profile_rows(table_from_stream(io.StringIO(text)))
+
+
+def test_profile_mixed_batches_become_nominal():
+    batches = list(iter_tabular_batches(io.StringIO("a\n1\n2\nx\n"), batch_size=2))
+    field = profile_batches(batches)["fields"]["a"]
+    assert field["type"] == "nominal"
+    assert field["values"] == [1.0, 2.0, "x"]
+    assert field["min"] is None
+
+
+def test_profiler_switches_to_sketch_above_exact_limit():
+    rows = [{"id": f"s{i}", "v": float(i)} for i in range(5000)]
+    profiler = StreamingProfiler(exact_limit=1000)
+    profiler.add_rows(rows)
+    assert not profiler.fields["id"].exact
+    fields = profiler.result()["fields"]
+    assert abs(fields["id"]["cardinality"] - 5000) < 250
+    assert fields["id"]["values"] is None
+    assert fields["id"]["values_truncated"] is True
+    assert fields["v"]["min"] == 0.0
+    assert fields["v"]["max"] == 4999.0
+
+
+def test_hyperloglog_estimate():
+    sketch = HyperLogLog()
+    sketch.add([f"id{i}" for i in range(100000)])
+    sketch.add([f"id{i}" for i in range(50000)])
+    assert abs(sketch.count() - 100000) < 3000
+    assert HyperLogLog().count() == 0
+
+
+def test_profiler_counts_exactly_by_hash_past_enum_limit():
+    rows = [{"id": i % 2000, "g": f"g{i % 3}"} for i in range(6000)]
+    profiler = StreamingProfiler()
+    profiler.add_rows(rows)
+    field = profiler.fields["id"]
+    assert field.exact
+    assert field.values is None
+    assert profiler.fields["g"].values == {"g0": None, "g1": None, "g2": None}
+    assert profiler.result()["fields"]["id"]["cardinality"] == 2000
+
+
+def test_hash_values_treats_equal_numbers_alike():
+    a = hash_values([1, 2.5, float("nan"), "", "1"])
+    b = hash_values([1.0, 2.5, float("nan")])
+    assert a[0] == b[0] and a[1] == b[1] and a[2] == b[2]
+    assert len(set(a.tolist())) == 5
+
+
+def test_hash_values_is_stable_across_processes():
+    code = (
+        "from datetime import datetime; from vintent.modules.sketch import hash_values; "
+        "print(hash_values(['a', 'ü', 1, 1.5, datetime(2024, 1, 1), (1, 2)]).tolist())"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code], env={**os.environ, "PYTHONHASHSEED": seed}, capture_output=True, text=True
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1 and outputs != {""}
+
+
+# Incremental profile derivation tests
+
+DERIVE_ROWS = [
+    {"g": "a", "x": 3.0, "d": datetime(2024, 1, 3)},
+    {"g": "b", "x": None, "d": datetime(2024, 1, 1)},
+    {"g": "a", "x": 1.0, "d": datetime(2024, 1, 2)},
+    {"g": "c", "x": 2.0, "d": None},
+]
+
+
+@pytest.mark.parametrize(
+    "process_id,params",
+    [
+        ("range_filter", {"field": "x", "min": 1.5}),
+        ("range_filter", {"field": "missing", "min": 1.5}),
+        ("categorical_filter", {"field": "g", "values": ["a"]}),
+        ("deduplicate", {"subset": ["g"], "keep": "last"}),
+        ("project_columns", {"columns": ["x", "g"]}),
+        ("drop_missing", {"columns": ["x"]}),
+        ("rolling_average", {"field": "x", "window": 2}),
+        ("rolling_average", {"field": "x", "window": 2, "sort_by": "d"}),
+        ("cumulative_sum", {"field": "x"}),
+        ("percent_change", {"field": "x"}),
+        ("extract_date_parts", {"field": "d", "parts": ["year", "weekday"]}),
+    ],
+)
+def test_derive_profile_matches_full_profile(process_id, params):
+    process = PROCESSES.EXTRACT.get(process_id) or PROCESSES.ANALYZE.get(process_id)
+    effect = process_effect(process, params)
+    assert effect != "new_table" or "sort_by" in params
+    written = process_writes(process, params)
+    out = run_process(process, DERIVE_ROWS, params)
+    assert derive_profile(profile_rows(DERIVE_ROWS), effect, out, written) == profile_rows(out)
+    assert derive_profile(profile_rows(DERIVE_ROWS), effect, ColumnTable.from_rows(out), written) == profile_rows(out)
+
+
+def test_derive_profile_reuses_unchanged_fields():
+    profile = profile_rows(DERIVE_ROWS)
+    assert derive_profile(profile, "rows_subset", list(DERIVE_ROWS)) is profile
+    added = derive_profile(profile, "columns_added", [dict(r, y=1.0) for r in DERIVE_ROWS], ["y"])
+    assert added["fields"]["g"] is profile["fields"]["g"]
+    assert list(added["fields"]) == ["g", "x", "d", "y"]
+
+
+def test_derive_profile_reprofiles_overwritten_columns():
+    rows = [{"x": float(i), "x_cumsum": -5.0} for i in range(5)]
+    process = PROCESSES.ANALYZE["cumulative_sum"]
+    params = {"field": "x"}
+    out = run_process(process, rows, params)
+    derived = derive_profile(profile_rows(rows), "columns_added", out, process_writes(process, params))
+    assert derived == profile_rows(out)
+    assert derived["fields"]["x_cumsum"]["max"] == 10.0
+    # Undeclared columns are not trusted
+    assert derive_profile(profile_rows(rows), "columns_added", out) == profile_rows(out)
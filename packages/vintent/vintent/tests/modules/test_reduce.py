@@ -0,0 +1,66 @@
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from vintent.modules.reduce import bin_2d, box_summary, downsample_lines, lttb_indices, stratified_sample
+from vintent.modules.table import ColumnTable
+
+
+def _rows(n=1000):
+    return [
+        {"x": float(i), "y": math.sin(i / 10), "g": "ab"[i % 2], "t": datetime(2024, 1, 1) + timedelta(hours=i)}
+        for i in range(n)
+    ]
+
+
+def test_bin_2d_counts_every_point_within_budget():
+    rows = _rows() + [{"x": None, "y": 1.0, "g": "a"}]
+    out = bin_2d(rows, "x", "y", 100)
+    assert len(out) <= 100
+    assert sum(r["count"] for r in out) == 1000
+    assert all(r["x_start"] <= r["x"] <= r["x_end"] for r in out)
+
+
+def test_bin_2d_splits_cells_by_color():
+    out = bin_2d(_rows(), "x", "y", 50, color="g")
+    assert {r["g"] for r in out} == {"a", "b"}
+    assert sum(r["count"] for r in out if r["g"] == "a") == 500
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[500] = 10.0
+    idx = lttb_indices(x, y, 20)
+    assert len(idx) == 20
+    assert idx[0] == 0 and idx[-1] == 999
+    assert 500 in idx.tolist()
+    assert lttb_indices(x, y, 2000).tolist() == list(range(1000))
+
+
+def test_downsample_lines_per_series_on_table():
+    rows = _rows()
+    for values in (rows, ColumnTable.from_rows(rows)):
+        out = downsample_lines(values, "t", "y", 100, series="g")
+        assert len(out) == 100
+        for g in "ab":
+            times = [r["t"] for r in out if r["g"] == g]
+            assert times == sorted(times)
+
+
+def test_stratified_sample_keeps_group_shares():
+    rows = [{"g": "a" if i < 900 else "b", "v": i} for i in range(1000)]
+    out = stratified_sample(rows, "g", 100)
+    assert sum(r["g"] == "a" for r in out) == 90
+    assert sum(r["g"] == "b" for r in out) == 10
+    assert [r["v"] for r in out] == sorted(r["v"] for r in out)
+    assert out == stratified_sample(rows, "g", 100)
+
+
+def test_box_summary_matches_tukey_whiskers():
+    rows = [{"g": "a", "v": float(v)} for v in [1, 2, 3, 4, 5, 6, 7, 8, 100]]
+    (row,) = box_summary(rows, "g", "v")
+    assert row["q1"] == 3.0 and row["median"] == 5.0 and row["q3"] == 7.0
+    assert row["lower"] == 1.0 and row["upper"] == 8.0
+    assert row["count"] == 9
@@ -0,0 +1,74 @@
+import json
+import os
+import struct
+from datetime import datetime, timezone
+
+from vintent.modules.profiler import profile_rows, table_from_tabular
+from vintent.modules.snapshot import MAGIC, read_snapshot, snapshot_path, write_snapshot
+from vintent.modules.table import ColumnTable
+
+
+def test_round_trip(tmp_path):
+    rows = [
+        {"q": 1.5, "i": 1, "n": "x", "t": datetime(2024, 1, 1), "m": "y"},
+        {"q": None, "i": 2, "n": None, "t": datetime(2024, 1, 2, tzinfo=timezone.utc), "m": 3.0},
+        {"q": 2.5, "i": 3, "n": "x", "t": None, "m": None},
+    ]
+    table = ColumnTable.from_rows(rows)
+    profile = profile_rows(table)
+    path = str(tmp_path / "data.vcol")
+    write_snapshot(path, table, profile)
+    loaded, loaded_profile = read_snapshot(path)
+    assert loaded.to_rows() == rows
+    assert loaded.kinds == table.kinds
+    assert loaded_profile == profile
+    assert not loaded.data["q"].flags.owndata
+    assert loaded.data["n"].tolist() == ["x", None, "x"]
+
+
+def test_empty_and_header_only_tables(tmp_path):
+    path = str(tmp_path / "empty.vcol")
+    table = table_from_tabular("a,b\n")
+    write_snapshot(path, table, profile_rows(table))
+    loaded, profile = read_snapshot(path)
+    assert loaded.field_names == ["a", "b"]
+    assert len(loaded) == 0
+    assert profile == {"fields": {}, "row_count": 0}
+
+
+def test_unreadable_snapshots_are_misses(tmp_path):
+    assert read_snapshot(str(tmp_path / "missing.vcol")) is None
+    bad = tmp_path / "bad.vcol"
+    bad.write_bytes(b"not a snapshot")
+    assert read_snapshot(str(bad)) is None
+
+
+def test_truncated_and_corrupt_snapshots_are_misses(tmp_path):
+    path = tmp_path / "data.vcol"
+    table = table_from_tabular("city,n\nberlin,1\nparis,2\n")
+    write_snapshot(str(path), table, profile_rows(table))
+    data = path.read_bytes()
+
+    header_only = tmp_path / "magic.vcol"
+    header_only.write_bytes(MAGIC)
+    assert read_snapshot(str(header_only)) is None
+
+    truncated = tmp_path / "truncated.vcol"
+    truncated.write_bytes(data[: len(data) // 2])
+    assert read_snapshot(str(truncated)) is None
+
+    # Dictionary codes past the end of the dictionary
+    (length,) = struct.unpack_from("<Q", data, len(MAGIC))
+    header = json.loads(data[len(MAGIC) + 8 : len(MAGIC) + 8 + length])
+    offset = next(c["offset"] for c in header["columns"] if c["encoding"] == "dictionary")
+    corrupt = bytearray(data)
+    struct.pack_into("<i", corrupt, offset, 999)
+    (tmp_path / "corrupt.vcol").write_bytes(bytes(corrupt))
+    assert read_snapshot(str(tmp_path / "corrupt.vcol")) is None
+
+
+def test_snapshot_path_depends_on_key(tmp_path):
+    first = snapshot_path(str(tmp_path), ("/data/a.csv", 10, 1))
+    assert first == snapshot_path(str(tmp_path), ("/data/a.csv", 10, 1))
+    assert first != snapshot_path(str(tmp_path), ("/data/a.csv", 10, 2))
+    assert os.path.dirname(first) == str(tmp_path)
@@ -0,0 +1,129 @@
+import weakref
+from datetime import datetime
+
+from vintent.modules.process import run_process
+from vintent.modules.process.extract.range_filter import PROCESS as range_filter
+from vintent.modules.profiler import profile_rows, rows_from_tabular, table_from_tabular
+from vintent.modules.table import ColumnTable, TableBuilder, as_rows, as_table
+
+
+def test_from_rows_round_trip():
+    rows = [
+        {"a": 1.0, "b": "x", "c": 3},
+        {"a": None, "b": "y", "c": 4},
+    ]
+    table = ColumnTable.from_rows(rows)
+    assert len(table) == 2
+    assert table.field_names == ["a", "b", "c"]
+    assert table.to_rows() == rows
+
+
+def test_column_kinds():
+    table = ColumnTable.from_rows(
+        [
+            {"q": 1.5, "i": 1, "n": "x", "t": datetime(2024, 1, 1)},
+            {"q": 2.5, "i": 2, "n": 3.0, "t": datetime(2024, 1, 2)},
+        ]
+    )
+    assert table.kinds == {"q": "quantitative", "i": "quantitative", "n": "nominal", "t": "temporal"}
+    assert table.data["q"].dtype.kind == "f"
+    assert table.data["i"].dtype.kind == "i"
+    assert table.data["n"].dtype == object
+
+
+def test_absent_keys_become_nulls():
+    table = ColumnTable.from_rows([{"a": 1.0}, {"b": "x"}])
+    assert table.to_rows() == [{"a": 1.0, "b": None}, {"a": None, "b": "x"}]
+    assert table.valid("a").tolist() == [1.0]
+
+
+def test_take_and_with_column():
+    table = ColumnTable.from_rows([{"a": 1.0}, {"a": 2.0}, {"a": 3.0}])
+    subset = table.take(table.data["a"] > 1.5)
+    assert subset.column("a") == [2.0, 3.0]
+    extended = subset.with_column("b", ["x", None])
+    assert extended.to_rows() == [{"a": 2.0, "b": "x"}, {"a": 3.0, "b": None}]
+    assert table.field_names == ["a"]
+
+
+def test_sanitized_masks_non_finite_values():
+    table = ColumnTable.from_rows(
+        [{"x": 1.0, "s": "a", "n": 1}, {"x": float("inf"), "s": float("nan"), "n": 2}, {"x": None, "s": None, "n": 3}]
+    )
+    assert table.has_nonfinite("x") and table.has_nonfinite("s")
+    assert not table.has_nonfinite("n")
+    clean = table.sanitized()
+    assert clean.to_rows() == [
+        {"x": 1.0, "s": "a", "n": 1},
+        {"x": None, "s": None, "n": 2},
+        {"x": None, "s": None, "n": 3},
+    ]
+    assert clean.sanitized() is clean
+    assert table.column("x")[1] == float("inf")
+
+
+def test_clean_flags_carry_over():
+    table = ColumnTable.from_rows([{"x": 1.0}, {"x": 2.0}])
+    assert table.sanitized() is table
+    assert table.take([1])._nonfinite == {"x": False}
+    added = table.with_column("y", [float("-inf"), 1.0])
+    assert added._nonfinite == {"x": False}
+    assert added.has_nonfinite("y")
+
+
+def test_as_rows_and_as_table():
+    rows = [{"a": 1.0}]
+    assert as_rows(rows) is rows
+    table = as_table(rows)
+    assert as_table(table) is table
+    assert as_rows(table) == rows
+
+
+def test_table_from_tabular_matches_rows_csv():
+    text = "a,b,c\n1,x,2024-01-01\n\n2,,2024-01-02\n3,x,\n"
+    table = table_from_tabular(text)
+    rows = rows_from_tabular(text)
+    assert table.to_rows() == rows
+    assert profile_rows(table) == profile_rows(rows)
+
+
+def test_table_from_tabular_matches_rows_tab():
+    text = "# comment\n1\tgene1\t0.5\n2\tgene2\n3\tgene1\t1.5\n"
+    table = table_from_tabular(text)
+    assert table.field_names == ["col:1", "col:2", "col:3"]
+    assert table.column("col:3") == [0.5, None, 1.5]
+    assert profile_rows(table) == profile_rows(rows_from_tabular(text))
+
+
+def test_table_builder_matches_concat():
+    parts = [
+        ColumnTable.from_rows([{"n": 1, "s": "x", "m": 1, "e": None}, {"n": 2, "s": None, "m": None, "e": None}]),
+        ColumnTable.from_rows([{"n": 3, "s": "y", "m": 2.5, "e": None}]),
+        ColumnTable.from_rows([{"n": None, "s": "z", "m": "w", "e": 4}] * 3),
+        ColumnTable.from_rows([{"n": 5, "s": "x", "m": None, "e": 5}]),
+    ]
+    builder = TableBuilder()
+    for part in parts:
+        builder.append(part)
+    table = builder.build()
+    expected = ColumnTable.concat(parts)
+    assert table.to_rows() == expected.to_rows()
+    assert table.kinds == expected.kinds
+    assert all(table.data[name].dtype == expected.data[name].dtype for name in table.field_names)
+    assert all(len(table.data[name]) == len(table.mask[name]) == 7 for name in table.field_names)
+
+
+def test_table_builder_does_not_keep_parts():
+    builder = TableBuilder()
+    part = ColumnTable.from_rows([{"a": 1}])
+    ref = weakref.ref(part)
+    builder.append(part)
+    del part
+    assert ref() is None
+    assert TableBuilder().build().field_names == []
+
+
+def test_run_process_materializes_rows_for_rowwise_processes():
+    table = ColumnTable.from_rows([{"a": 1.0}, {"a": 5.0}])
+    out = run_process(range_filter, table, {"field": "a", "min": 2})
+    assert out == [{"a": 5.0}]
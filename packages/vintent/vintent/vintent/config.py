@@ -19,9 +19,29 @@ env = {
     "AI_BASE_URL": os.environ.get("AI_BASE_URL") or "http://localhost:11434/v1",
     "AI_MODEL": os.environ.get("AI_MODEL"),
     "AI_RATE_LIMIT": os.environ.get("AI_RATE_LIMIT"),
+    # Response cache for repeated LLM requests: unset (off), "memory" or "sqlite"
+    "AI_CACHE": os.environ.get("AI_CACHE"),
+    "AI_CACHE_PATH": os.environ.get("AI_CACHE_PATH"),
+    "AI_CACHE_TTL": os.environ.get("AI_CACHE_TTL"),
+    "AI_CACHE_SIZE": os.environ.get("AI_CACHE_SIZE"),
     # Combined pipeline (fast, 3 LLM calls) or sequential pipeline (reliable, 4 LLM calls)
     # Use sequential (False) for local/smaller models that struggle with parallel tool calling
     "AI_PIPELINE_COMBINE": _parse_bool(os.environ.get("AI_PIPELINE_COMBINE"), default=False),
+    # Run independent phases of the sequential pipeline concurrently (more parallel LLM requests)
+    "AI_PIPELINE_PARALLEL": _parse_bool(os.environ.get("AI_PIPELINE_PARALLEL"), default=False),
+    # Number of likely shells whose parameters are requested while the shell is chosen (0 disables)
+    "AI_FILL_CANDIDATES": os.environ.get("AI_FILL_CANDIDATES"),
+    # Route requests naming one shell and its fields without LLM calls
+    "AI_FAST_PATH": _parse_bool(os.environ.get("AI_FAST_PATH"), default=False),
+    # Deliver spec data inline ("inline") or as columnar buffers next to the spec ("binary")
+    "DATA_CHANNEL": os.environ.get("DATA_CHANNEL"),
+    # Directory for columnar dataset snapshots shared between worker processes
+    "DATASET_SNAPSHOT_DIR": os.environ.get("DATASET_SNAPSHOT_DIR"),
+    # Maximum number of values embedded in a Vega-Lite spec before they are reduced (0 disables)
+    "POINT_BUDGET": os.environ.get("POINT_BUDGET"),
+    # Maximum number of pooled HTTP connections and seconds idle connections are kept open
+    "HTTP_POOL_SIZE": os.environ.get("HTTP_POOL_SIZE"),
+    "HTTP_KEEPALIVE_TIMEOUT": os.environ.get("HTTP_KEEPALIVE_TIMEOUT"),
     "GALAXY_KEY": os.environ.get("GALAXY_KEY"),
     "GALAXY_ROOT": os.environ.get("GALAXY_ROOT") or "http://localhost:8080/",
 }
@@ -34,7 +54,19 @@ config = {
     "ai_base_url": env["AI_BASE_URL"],
     "ai_model": env["AI_MODEL"],
     "ai_rate_limit": int(env["AI_RATE_LIMIT"]) if env["AI_RATE_LIMIT"] else None,
+    "ai_cache": env["AI_CACHE"],
+    "ai_cache_path": env["AI_CACHE_PATH"],
+    "ai_cache_ttl": float(env["AI_CACHE_TTL"]) if env["AI_CACHE_TTL"] else None,
+    "ai_cache_size": int(env["AI_CACHE_SIZE"]) if env["AI_CACHE_SIZE"] else None,
     "ai_pipeline_combine": env["AI_PIPELINE_COMBINE"],
+    "ai_pipeline_parallel": env["AI_PIPELINE_PARALLEL"],
+    "ai_fill_candidates": int(env["AI_FILL_CANDIDATES"]) if env["AI_FILL_CANDIDATES"] else 0,
+    "ai_fast_path": env["AI_FAST_PATH"],
+    "data_channel": env["DATA_CHANNEL"] or "inline",
+    "dataset_snapshot_dir": env["DATASET_SNAPSHOT_DIR"],
+    "point_budget": int(env["POINT_BUDGET"]) if env["POINT_BUDGET"] else None,
+    "http_pool_size": int(env["HTTP_POOL_SIZE"]) if env["HTTP_POOL_SIZE"] else None,
+    "http_keepalive_timeout": float(env["HTTP_KEEPALIVE_TIMEOUT"]) if env["HTTP_KEEPALIVE_TIMEOUT"] else None,
     "galaxy_root": env["GALAXY_ROOT"],
     "galaxy_key": env["GALAXY_KEY"],
 }
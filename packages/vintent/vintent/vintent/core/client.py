@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+import threading
 
 from .exceptions import HttpError
 
@@ -11,11 +12,22 @@ RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1.0  # seconds
 
+# Connection pool configuration (server client)
+POOL_SIZE = 100  # max open connections, 0 for no limit
+KEEPALIVE_TIMEOUT = 30.0  # seconds an idle connection is kept open
+DNS_CACHE_TTL = 300  # seconds
+
 
 class HttpClient:
     async def request(self, method, url, headers=None, body=None):
         raise NotImplementedError
 
+    def configure(self, pool_size=None, keepalive_timeout=None, dns_cache_ttl=None):
+        pass
+
+    async def close(self):
+        pass
+
 
 def is_pyodide():
     try:
@@ -55,7 +67,8 @@ class BrowserHttpClient(HttpClient):
             "headers": headers,
         }
         if body is not None:
-            options["body"] = json.dumps(body)
+            # body may be JSON encoded already (see completions.encode_body)
+            options["body"] = body if isinstance(body, str) else json.dumps(body)
             headers.setdefault("Content-Type", "application/json")
 
         last_error = None
@@ -95,47 +108,114 @@ class BrowserHttpClient(HttpClient):
 
 
 class ServerHttpClient(HttpClient):
+    # One session (and connection pool) is kept per process and reused by
+    # every request and retry, so connections and TLS sessions stay open
+    # between LLM and API calls. It is created lazily on first use and
+    # recreated after close() or when used from another event loop.
     def __init__(self):
         import aiohttp
 
         self._aiohttp = aiohttp
+        self._session = None
+        self._loop = None
+        self.pool_size = POOL_SIZE
+        self.keepalive_timeout = KEEPALIVE_TIMEOUT
+        self.dns_cache_ttl = DNS_CACHE_TTL
+
+    def configure(self, pool_size=None, keepalive_timeout=None, dns_cache_ttl=None):
+        # applies to the next session, i.e. call before the first request or after close()
+        if pool_size is not None:
+            self.pool_size = pool_size
+        if keepalive_timeout is not None:
+            self.keepalive_timeout = keepalive_timeout
+        if dns_cache_ttl is not None:
+            self.dns_cache_ttl = dns_cache_ttl
+
+    def _get_session(self):
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            self._discard_session()
+        if self._session is None or self._session.closed:
+            connector = self._aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            self._session = self._aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+        return self._session
+
+    def _discard_session(self):
+        # a session of another event loop can't be awaited from this one, so close it
+        # on its own loop: from that loop's thread if it runs, or in a helper thread
+        # if it is idle
+        session, loop = self._session, self._loop
+        self._session, self._loop = None, None
+        if session.closed or loop is None:
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        if not loop.is_closed():
+            thread = threading.Thread(target=loop.run_until_complete, args=(session.close(),))
+            thread.start()
+            thread.join()
+            return
+        # a closed loop runs nothing anymore: mark the connector closed with
+        # BaseConnector._close(), the synchronous close of aiohttp 3.x (the
+        # transports are released with the loop)
+        connector = session.connector
+        session.detach()
+        close = getattr(connector, "_close", None)
+        if close is not None:
+            close()
+
+    async def close(self):
+        # process-wide: closes the session every runner in the process shares, so
+        # call it on shutdown, once no requests are in flight; the next request
+        # opens a new session
+        session, self._session, self._loop = self._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
 
     async def request(self, method, url, headers=None, body=None):
         data = None
         if body is not None:
-            data = json.dumps(body)
+            # body may be JSON encoded already (see completions.encode_body)
+            data = body if isinstance(body, str) else json.dumps(body)
             headers = headers or {}
             headers.setdefault("Content-Type", "application/json")
 
         last_error = None
         for attempt in range(MAX_RETRIES):
-            async with self._aiohttp.ClientSession() as session:
-                async with session.request(
-                    method=method.upper(),
-                    url=url,
-                    headers=headers,
-                    data=data,
-                ) as response:
-                    if response.status < 400:
-                        return await parse_response(response)
-
-                    status = response.status
-                    text = await response.text()
-
-                    if status not in RETRY_STATUS_CODES:
-                        # Don't retry client errors (except 429)
-                        raise HttpError(
-                            f"HTTP {status}: {text}",
-                            status_code=status,
-                            details={"url": url, "method": method},
-                        )
-
-                    last_error = HttpError(
+            session = self._get_session()
+            async with session.request(
+                method=method.upper(),
+                url=url,
+                headers=headers,
+                data=data,
+            ) as response:
+                if response.status < 400:
+                    return await parse_response(response)
+
+                status = response.status
+                text = await response.text()
+
+                if status not in RETRY_STATUS_CODES:
+                    # Don't retry client errors (except 429)
+                    raise HttpError(
                         f"HTTP {status}: {text}",
                         status_code=status,
                         details={"url": url, "method": method},
                     )
 
+                last_error = HttpError(
+                    f"HTTP {status}: {text}",
+                    status_code=status,
+                    details={"url": url, "method": method},
+                )
+
             if attempt < MAX_RETRIES - 1:
                 backoff = INITIAL_BACKOFF * (2**attempt)
                 logger.warning(f"HTTP {status}, retrying in {backoff}s " f"(attempt {attempt + 1}/{MAX_RETRIES})")
@@ -12,12 +12,39 @@ TEMPERATURE = 0.3
 TOP_P = 0.8
 
 
-async def completions_post(payload):
-    api_key = payload.get("ai_api_key")
-    base_url = payload.get("ai_base_url")
-    base_url = base_url.rstrip("/") if base_url else ""
-    url = f"{base_url}/chat/completions"
+class EncodedTool(dict):
+    """A tool definition that keeps its JSON encoding.
+
+    Memoized tool definitions are sent with many requests, so their
+    encoding is computed once and reused by encode_body(). Instances are
+    shared and must not be modified.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._encoded = None
+
+    @property
+    def encoded(self):
+        if self._encoded is None:
+            self._encoded = json.dumps(self)
+        return self._encoded
 
+
+def encode_body(body):
+    """JSON-encode a request body, reusing the encoding of EncodedTool tools."""
+    tools = body.get("tools")
+    if not tools or not all(isinstance(tool, EncodedTool) for tool in tools):
+        return json.dumps(body)
+    rest = json.dumps({k: v for k, v in body.items() if k != "tools"})
+    encoded_tools = ", ".join(tool.encoded for tool in tools)
+    return f'{rest[:-1]}{", " if len(rest) > 2 else ""}"tools": [{encoded_tools}]}}'
+
+
+def completions_body(payload):
+    """Build the chat completions request body for a payload."""
     body = {
         "model": payload.get("ai_model"),
         "messages": payload["messages"],
@@ -63,6 +90,15 @@ async def completions_post(payload):
                 "type": "function",
                 "function": {"name": tool_name},
             }
+    return body
+
+
+async def completions_post(payload):
+    api_key = payload.get("ai_api_key")
+    base_url = payload.get("ai_base_url")
+    base_url = base_url.rstrip("/") if base_url else ""
+    url = f"{base_url}/chat/completions"
+    body = completions_body(payload)
 
     headers = {"Content-Type": "application/json"}
     if api_key is not None:
@@ -73,7 +109,7 @@ async def completions_post(payload):
         method="POST",
         url=url,
         headers=headers,
-        body=body,
+        body=encode_body(body),
     )
 
 
@@ -128,4 +164,4 @@ def normalize_parameter(value, min_val, max_val, fallback):
     return value
 
 
-__all__ = ["completions_post", "get_tool_call"]
+__all__ = ["EncodedTool", "completions_post", "encode_body", "get_tool_call"]
@@ -0,0 +1,233 @@
+"""Exact-match cache for LLM completion replies.
+
+Replays, UI retries and repeated questions on the same dataset send
+byte-identical requests. Requests are keyed by a SHA-256 hash of the
+canonical JSON of the endpoint and the fields that determine the reply
+(model, messages, tools, tool_choice and the sampling parameters), so
+such requests are answered without calling the provider.
+
+Two backends are available: MemoryResponseCache keeps replies in the
+process, SqliteResponseCache in a file shared between processes and
+restarts. Both expire entries after a TTL and evict the least recently
+used entries beyond max_entries. Replies are stored as JSON text, so
+every hit returns a fresh copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_BACKENDS = ("memory", "sqlite")
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+DEFAULT_MAX_ENTRIES = 1024
+
+# Request body fields that determine the reply
+KEY_FIELDS = ("model", "messages", "tools", "tool_choice", "temperature", "max_tokens", "top_p")
+
+Reply = Dict[str, Any]
+
+
+def cache_key(body: Dict[str, Any], endpoint: Optional[str] = None) -> str:
+    """Return the cache key for a completions request body sent to endpoint.
+
+    The endpoint (the provider's base URL) keeps deployments that share a
+    cache file and a model name from answering each other's requests.
+    """
+    canonical = json.dumps(
+        {"endpoint": endpoint, **{name: body.get(name) for name in KEY_FIELDS}},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def is_cacheable(reply: Any) -> bool:
+    """Only replies with usable tool calls or text content are worth replaying.
+
+    Tool calls whose arguments are not a JSON object are rejected by the
+    caller, which retries; a cached copy would fail the same way.
+    """
+    if not isinstance(reply, dict):
+        return False
+    choices = reply.get("choices")
+    if not choices or not isinstance(choices, list):
+        return False
+    message = choices[0].get("message") or {}
+    tool_calls = message.get("tool_calls")
+    if tool_calls:
+        return all(_has_object_arguments(call) for call in tool_calls)
+    content = message.get("content")
+    return isinstance(content, str) and bool(content.strip())
+
+
+def _has_object_arguments(call: Any) -> bool:
+    args = (call.get("function") or {}).get("arguments") if isinstance(call, dict) else None
+    if not isinstance(args, str) or not args:
+        return True
+    try:
+        return isinstance(json.loads(args), dict)
+    except ValueError:
+        return False
+
+
+class ResponseCache(Protocol):
+    """Backend interface; hits and misses count get() results."""
+
+    hits: int
+    misses: int
+
+    def get(self, key: str) -> Optional[Reply]: ...
+
+    def put(self, key: str, reply: Reply) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryResponseCache:
+    """In-process LRU cache with a TTL."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Reply]:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return json.loads(entry[1])
+
+    def put(self, key: str, reply: Reply) -> None:
+        self._entries[key] = (time.monotonic(), json.dumps(reply))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SqliteResponseCache:
+    """LRU cache with a TTL in an SQLite file."""
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        import sqlite3
+
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, reply TEXT NOT NULL, created REAL NOT NULL, used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_used ON responses (used)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Reply]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT reply, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and now - row[1] > self.ttl:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, reply: Reply) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, reply, created, used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(reply), now, now),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+# Caches are shared by every runner in the process that uses the same settings
+_CACHES: Dict[Tuple[Any, ...], ResponseCache] = {}
+
+
+def get_response_cache(config: Dict[str, Any]) -> Optional[ResponseCache]:
+    """Return the process-wide response cache for a config, or None if disabled.
+
+    Config keys:
+        ai_cache: None to disable, "memory" or "sqlite"
+        ai_cache_path: SQLite file (required for "sqlite")
+        ai_cache_ttl: Seconds a reply is reused
+        ai_cache_size: Maximum number of cached replies
+    """
+    backend = config.get("ai_cache")
+    if not backend:
+        return None
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(f"Unknown response cache backend: {backend}")
+    path = config.get("ai_cache_path")
+    if backend == "sqlite" and not path:
+        raise ValueError("The sqlite response cache requires ai_cache_path.")
+    ttl = config.get("ai_cache_ttl") or DEFAULT_TTL
+    max_entries = config.get("ai_cache_size") or DEFAULT_MAX_ENTRIES
+    settings = (backend, path if backend == "sqlite" else None, ttl, max_entries)
+    cache = _CACHES.get(settings)
+    if cache is None:
+        if backend == "sqlite":
+            cache = SqliteResponseCache(path, ttl, max_entries)
+        else:
+            cache = MemoryResponseCache(ttl, max_entries)
+        logger.info(f"Response cache enabled: {backend} (ttl={ttl}s, max_entries={max_entries})")
+        _CACHES[settings] = cache
+    return cache
+
+
+__all__ = [
+    "CACHE_BACKENDS",
+    "MemoryResponseCache",
+    "ResponseCache",
+    "SqliteResponseCache",
+    "cache_key",
+    "get_response_cache",
+    "is_cacheable",
+]
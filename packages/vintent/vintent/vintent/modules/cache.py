@@ -0,0 +1,96 @@
+"""Process-wide cache of parsed datasets and their profiles.
+
+Users typically ask several questions about the same dataset, so the
+parsed ColumnTable and its DatasetProfile are kept in memory between runs.
+Entries are keyed by the file's resolved path, size and modification time,
+so a rewritten file is parsed again. Least recently used entries are
+evicted once the cache exceeds its memory budget.
+
+Cached tables and profiles are shared between runs and must be treated as
+read-only; pipeline processes already return new values instead of
+mutating their input.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from .schemas import DatasetProfile
+from .table import ColumnTable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+DatasetKey = Tuple[str, int, int]
+
+
+@dataclass
+class CachedDataset:
+    table: ColumnTable
+    profile: DatasetProfile
+    nbytes: int
+
+
+def dataset_key(file_name: str) -> Optional[DatasetKey]:
+    """Return the cache key for a file, or None if it cannot be stat'ed."""
+    try:
+        path = os.path.realpath(file_name)
+        st = os.stat(path)
+    except OSError:
+        return None
+    return path, st.st_size, st.st_mtime_ns
+
+
+class DatasetCache:
+    """LRU cache of parsed datasets bounded by an approximate memory budget."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[DatasetKey, CachedDataset] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: DatasetKey) -> Optional[CachedDataset]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: DatasetKey, table: ColumnTable, profile: DatasetProfile) -> None:
+        nbytes = table.nbytes
+        if nbytes > self.max_bytes:
+            logger.debug(f"Dataset {key[0]} ({nbytes} bytes) exceeds the cache budget, not cached")
+            return
+        self.discard(key)
+        # Older versions of the same file can never be hit again
+        for stale in [k for k in self._entries if k[0] == key[0]]:
+            self.discard(stale)
+        self._entries[key] = CachedDataset(table, profile, nbytes)
+        self.total_bytes += nbytes
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted.nbytes
+
+    def discard(self, key: DatasetKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.nbytes
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total_bytes = 0
+
+
+DATASET_CACHE = DatasetCache()
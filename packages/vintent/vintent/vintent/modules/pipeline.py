@@ -6,32 +6,41 @@ the visualization generation process into discrete, testable phases.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from vintent.core.completions import get_tool_call
 from vintent.core.exceptions import AppError
 from vintent.modules.exceptions import DataError
 from vintent.core.providers import (
+    CachingCompletionsProvider,
     CompletionsProvider,
     DefaultCompletionsProvider,
     RateLimitedCompletionsProvider,
 )
 from vintent.modules.shells.base import ShellError
 
-from .process import run_process
-from .profiler import DatasetProfile, profile_rows, rows_from_tabular
+from .cache import DATASET_CACHE, DatasetCache, dataset_key
+from .channel import DATASET_NAME, detach_data, encode_rows, encode_table
+from .process import Process, ValuesType, process_effect, process_writes, run_process
+from .profiler import DatasetProfile, derive_profile, profile_rows, table_from_stream
+from .reduce import DEFAULT_POINT_BUDGET, Reduction
 from .registry import PROCESSES, SHELLS
+from .router import route_request
 from .schemas import TranscriptMessageType
+from .snapshot import read_snapshot, snapshot_path, write_snapshot
+from .table import is_table
 from .tools import (
     NO_PROCESS_ID,
     build_choose_process_tools,
     build_choose_shell_tool,
     build_fill_shell_params_tool,
     build_parse_intent_tool,
+    candidate_shells,
     get_chosen_process,
 )
 
@@ -53,9 +62,8 @@ class PipelineContext:
     transcripts: List[TranscriptMessageType]
     file_name: str
 
-    # Data state (mutated by phases)
-    values: List[Dict[str, Any]] = field(default_factory=list)
-    profile: Optional[DatasetProfile] = None
+    # Data state (mutated by phases), row dicts or a ColumnTable
+    values: ValuesType = field(default_factory=list)
 
     # Intent parsing state
     parsed_intent: Optional[Dict[str, Any]] = None
@@ -65,14 +73,88 @@ class PipelineContext:
     shell_id: Optional[str] = None
     params: Dict[str, Any] = field(default_factory=dict)
 
+    # Parameters filled speculatively while the shell was chosen, by shell id
+    prefilled: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
+
+    # Values reduced to the point budget for display, if they exceeded it
+    reduction: Optional[Reduction] = None
+
     # Output accumulators
     logs: List[str] = field(default_factory=list)
     spec: Optional[Any] = None
     errors: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Columnar buffers referenced by name from the spec (binary data channel)
+    datasets: Dict[str, bytes] = field(default_factory=dict)
+
     # Control flow
     should_continue: bool = True
 
+    # Shell and params were chosen by RoutePhase, so decision phases are skipped
+    routed: bool = False
+
+    # Profile of values, derived on first read after apply_process
+    _profile: Optional[DatasetProfile] = field(default=None, init=False, repr=False)
+    _pending_profile: Optional[Callable[[], DatasetProfile]] = field(default=None, init=False, repr=False)
+
+    @property
+    def profile(self) -> Optional[DatasetProfile]:
+        if self._pending_profile is not None:
+            self._profile = self._pending_profile()
+            self._pending_profile = None
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile: Optional[DatasetProfile]) -> None:
+        self._profile = profile
+        self._pending_profile = None
+
+    def apply_process(self, process: Process, params: Dict[str, Any]) -> None:
+        """Run a process on values and schedule the matching profile update.
+
+        The new profile is derived from the previous one according to the
+        process's declared effect, and only once a phase reads ctx.profile.
+        """
+        values = run_process(process, self.values, params)
+        effect = process_effect(process, params)
+        written = process_writes(process, params)
+        if self._pending_profile is None:
+            base = self._profile
+            self._pending_profile = lambda: derive_profile(base, effect, values, written)
+        elif effect != "rows_subset" or len(values) != len(self.values):
+            # The previous profile was never needed, so there is nothing to derive from
+            self._pending_profile = lambda: profile_rows(values)
+        self.values = values
+
+    def fork(self) -> "PipelineContext":
+        """Copy the context for a phase that runs concurrently with others.
+
+        Fields are shared, except that the fork gets its own logs, errors
+        and control flow, so its output can be merged in pipeline order.
+        """
+        fork = replace(self, logs=[], errors=[], prefilled=dict(self.prefilled), should_continue=True)
+        fork._profile = self._profile
+        fork._pending_profile = self._pending_profile
+        return fork
+
+    def field_state(self, name: str) -> Any:
+        """Return a field's current state, without deriving a pending profile."""
+        if name == "profile":
+            return (self._profile, self._pending_profile)
+        return getattr(self, name)
+
+    def merge(self, fork: "PipelineContext", fields: Tuple[str, ...]) -> None:
+        """Take the given fields and all output of a fork made by fork()."""
+        for name in fields:
+            if name == "profile":
+                self._profile, self._pending_profile = fork._profile, fork._pending_profile
+            else:
+                setattr(self, name, getattr(fork, name))
+        self.logs.extend(fork.logs)
+        self.errors.extend(fork.errors)
+        if not fork.should_continue:
+            self.should_continue = False
+
     def stop(self, log_message: Optional[str] = None) -> None:
         """Signal that the pipeline should stop after this phase."""
         self.should_continue = False
@@ -87,11 +169,14 @@ class PipelineContext:
 
     def to_result(self) -> Dict[str, Any]:
         """Convert context to the final result dict."""
-        return dict(
+        result = dict(
             logs=self.logs,
             spec=self.spec,
             errors=self.errors,
         )
+        if self.datasets:
+            result["datasets"] = self.datasets
+        return result
 
 
 class Phase(ABC):
@@ -100,8 +185,36 @@ class Phase(ABC):
     Each phase performs a discrete step in the visualization pipeline.
     Phases can modify the PipelineContext and signal whether the pipeline
     should continue or stop.
+
+    Phases may declare the PipelineContext fields they use, which lets a
+    parallel Pipeline run independent phases concurrently:
+        reads: Fields that must be final before the phase runs.
+        writes: Fields the phase sets.
+        speculates: Fields the phase reads but may run ahead of; its
+            result is kept only if still_valid() accepts it once the
+            fields are final, otherwise the phase runs again.
+        stale_writes: Fields among writes that are dropped instead of
+            merged when a result is kept although speculated fields
+            changed, because they depend on those fields in detail.
+    Phases with reads = None are never run concurrently.
+
+    Phases with decides = True choose the shell or its parameters with the
+    LLM and are skipped once RoutePhase has routed the request.
     """
 
+    decides: bool = False
+    reads: Optional[Tuple[str, ...]] = None
+    writes: Tuple[str, ...] = ()
+    speculates: Tuple[str, ...] = ()
+    stale_writes: Tuple[str, ...] = ()
+
+    def still_valid(self, ctx: PipelineContext, speculative: PipelineContext) -> bool:
+        """Whether a result computed from stale speculated fields can be kept.
+
+        ctx holds the final fields, speculative the fork the phase ran on.
+        """
+        return False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -122,7 +235,20 @@ class Phase(ABC):
 
 
 class LoadDataPhase(Phase):
-    """Phase 0: Load and profile the input data (CSV or tab-delimited)."""
+    """Phase 0: Load and profile the input data (CSV or tab-delimited).
+
+    Parsed datasets and their profiles are reused from the dataset cache
+    while the file is unchanged; pass cache=None to always re-read. With a
+    snapshot_dir, a columnar snapshot is written after the first parse and
+    memory-mapped by later loads in any process.
+    """
+
+    reads = ("file_name",)
+    writes = ("values", "profile")
+
+    def __init__(self, cache: Optional[DatasetCache] = DATASET_CACHE, snapshot_dir: Optional[str] = None):
+        self.cache = cache
+        self.snapshot_dir = snapshot_dir
 
     @property
     def name(self) -> str:
@@ -133,9 +259,28 @@ class LoadDataPhase(Phase):
         ctx: PipelineContext,
         provider: CompletionsProvider,
     ) -> None:
+        use_cache = self.cache is not None or self.snapshot_dir is not None
+        key = dataset_key(ctx.file_name) if use_cache else None
+        cached = self.cache.get(key) if key and self.cache is not None else None
+        if cached is not None:
+            ctx.values = cached.table
+            ctx.profile = cached.profile
+            logger.debug(f"Loaded {len(ctx.values)} rows from dataset cache")
+            return
+
+        snapshot_file = snapshot_path(self.snapshot_dir, key) if key and self.snapshot_dir else None
+        snapshot = read_snapshot(snapshot_file) if snapshot_file else None
+        if snapshot is not None:
+            ctx.values, ctx.profile = snapshot
+            if self.cache is not None:
+                self.cache.put(key, ctx.values, ctx.profile)
+            logger.debug(f"Loaded {len(ctx.values)} rows from snapshot {snapshot_file}")
+            return
+
         try:
+            # Stream the file in batches rather than reading it into one string
             with open(ctx.file_name) as f:
-                csv_text = f.read()
+                ctx.values = table_from_stream(f)
         except FileNotFoundError:
             ctx.add_error(
                 DataError(
@@ -153,11 +298,50 @@ class LoadDataPhase(Phase):
             )
             return
 
-        ctx.values = rows_from_tabular(csv_text)
         ctx.profile = profile_rows(ctx.values)
+        if key and self.cache is not None:
+            self.cache.put(key, ctx.values, ctx.profile)
+        if snapshot_file:
+            try:
+                write_snapshot(snapshot_file, ctx.values, ctx.profile)
+            except (OSError, TypeError) as e:
+                logger.warning(f"Failed to write dataset snapshot {snapshot_file}: {e}")
         logger.debug(f"Loaded {len(ctx.values)} rows, profile: {ctx.profile}")
 
 
+class RoutePhase(Phase):
+    """Phase 0b: Route unambiguous requests without the LLM.
+
+    When the last user message names exactly one shell and the fields it
+    requires (see route_request), the shell and params are set directly and
+    the LLM decision phases are skipped. Otherwise nothing changes.
+    """
+
+    @property
+    def name(self) -> str:
+        return "route"
+
+    async def run(
+        self,
+        ctx: PipelineContext,
+        provider: CompletionsProvider,
+    ) -> None:
+        if not ctx.profile:
+            return
+
+        route = route_request(ctx.transcripts, ctx.profile)
+        if not route:
+            return
+
+        shell_id, params = route
+        ctx.shell_id = shell_id
+        ctx.shell = SHELLS[shell_id]
+        ctx.params.update(params)
+        ctx.routed = True
+        ctx.logs.append(f"Visualizing {ctx.shell.name}.")
+        logger.debug(f"route: {shell_id} {params}")
+
+
 class ParseIntentPhase(Phase):
     """Phase 1: Parse user intent to distinguish visualization vs filter fields.
 
@@ -165,6 +349,10 @@ class ParseIntentPhase(Phase):
     downstream phases (especially FillParams) make better field selections.
     """
 
+    decides = True
+    reads = ("transcripts", "profile")
+    writes = ("parsed_intent",)
+
     @property
     def name(self) -> str:
         return "parse_intent"
@@ -207,6 +395,10 @@ class ParseIntentPhase(Phase):
 class ExtractPhase(Phase):
     """Phase 1: Apply user-requested extraction/filtering."""
 
+    decides = True
+    reads = ("transcripts", "profile")
+    writes = ("values", "profile")
+
     @property
     def name(self) -> str:
         return "extract"
@@ -239,15 +431,144 @@ class ExtractPhase(Phase):
             return
 
         params = chosen.get("params", {})
-        ctx.values = run_process(process, ctx.values, params)
-        ctx.profile = profile_rows(ctx.values)
+        ctx.apply_process(process, params)
 
         if "log" in process:
             ctx.logs.append(process["log"](params))
 
 
+async def fill_shell_params(
+    ctx: PipelineContext,
+    shell: BaseShell,
+    provider: CompletionsProvider,
+) -> Optional[Dict[str, Any]]:
+    """Ask the LLM to fill a shell's parameters; None if it did not."""
+    fill_tool = build_fill_shell_params_tool(shell, ctx.profile, parsed_intent=ctx.parsed_intent)
+    if not fill_tool:
+        return None
+
+    reply = await provider.complete(ctx.transcripts, [fill_tool])
+    if not reply:
+        return None
+
+    return get_tool_call("fill_shell_params", reply)
+
+
+class SpeculativeFill:
+    """fill_shell_params requests started for likely shells before one is chosen.
+
+    The shells matching the parsed goal best (see candidate_shells) get
+    their parameters requested concurrently with choose_shell. resolve()
+    keeps the chosen shell's parameters in ctx.prefilled for FillParamsPhase
+    and cancels the other requests.
+    """
+
+    def __init__(self, ctx: PipelineContext, provider: CompletionsProvider, count: int):
+        shell_ids = candidate_shells(ctx.profile, ctx.parsed_intent, count) if count and ctx.profile else []
+        self.tasks = {
+            shell_id: asyncio.ensure_future(fill_shell_params(ctx, SHELLS[shell_id], provider))
+            for shell_id in shell_ids
+        }
+        if shell_ids:
+            logger.debug(f"Speculatively filling params for: {shell_ids}")
+
+    async def resolve(self, ctx: PipelineContext) -> None:
+        chosen = self.tasks.pop(ctx.shell_id, None) if ctx.shell_id else None
+        for task in self.tasks.values():
+            task.cancel()
+        await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+        if chosen is None:
+            return
+        try:
+            ctx.prefilled[ctx.shell_id] = await chosen
+        except Exception as e:
+            # FillParamsPhase requests the parameters again
+            logger.warning(f"Speculative fill for {ctx.shell_id} failed: {e}")
+
+
+async def _select_shell(ctx: PipelineContext, provider: CompletionsProvider, fill_candidates: int = 0) -> None:
+    """Choose the shell with a forced choose_shell call and set ctx.shell."""
+    speculation = SpeculativeFill(ctx, provider, fill_candidates)
+    try:
+        await _choose_shell(ctx, provider)
+    finally:
+        await speculation.resolve(ctx)
+
+
+async def _choose_shell(ctx: PipelineContext, provider: CompletionsProvider) -> None:
+    """Make the choose_shell call and set ctx.shell, or stop with an error."""
+    # Pass parsed_intent so shell selection can prioritize goal-matching shells
+    tool = build_choose_shell_tool(ctx.profile, ctx.parsed_intent)
+    if not tool:
+        ctx.add_error(
+            ShellError(
+                "No compatible visualization shell available.",
+                details={"profile_fields": list(ctx.profile.get("fields", {}).keys())},
+            )
+        )
+        return
+    reply = await provider.complete(ctx.transcripts, [tool])
+
+    if not reply:
+        ctx.stop("No visualization could be selected.")
+        return
+
+    chosen = get_tool_call("choose_shell", reply)
+    if not chosen or not chosen.get("shellId"):
+        ctx.add_error(
+            ShellError(
+                "No compatible visualization shell available.",
+                details={"profile_fields": list(ctx.profile.get("fields", {}).keys())},
+            )
+        )
+        return
+
+    shell_id = chosen["shellId"]
+    shell = SHELLS.get(shell_id)
+    if not shell:
+        ctx.add_error(
+            ShellError(
+                f"Unknown shell selected: {shell_id}",
+                details={"shell_id": shell_id},
+            )
+        )
+        return
+
+    ctx.shell_id = shell_id
+    ctx.shell = shell
+    ctx.logs.append(f"Visualizing {shell.name}.")
+    logger.debug(f"choose_shell_tool: {shell_id}")
+
+
 class ChooseShellPhase(Phase):
-    """Phase 2: Select the appropriate visualization shell."""
+    """Phase 2: Select the appropriate visualization shell.
+
+    In a parallel pipeline the shell is chosen from the profile before
+    extraction and without the parsed intent, which only reorders shells.
+
+    With fill_candidates > 0, parameters for that many shells matching the
+    parsed goal are requested while the shell is chosen (see SpeculativeFill).
+    Parameters filled against a profile or intent that changed afterwards
+    are dropped, so FillParamsPhase requests them again; in a parallel
+    pipeline, where the intent is parsed alongside, nothing is speculated.
+    """
+
+    decides = True
+    reads = ("transcripts",)
+    writes = ("shell", "shell_id", "prefilled")
+    speculates = ("profile", "parsed_intent")
+    stale_writes = ("prefilled",)
+
+    def __init__(self, fill_candidates: int = 0):
+        self.fill_candidates = fill_candidates
+
+    def still_valid(self, ctx: PipelineContext, speculative: PipelineContext) -> bool:
+        """Keep the shell if it still fits the extracted data and the parsed goal."""
+        shell = speculative.shell
+        if shell is None or not ctx.profile or not shell.is_applicable(ctx.profile):
+            return False
+        goal = ctx.parsed_intent.get("goal") if ctx.parsed_intent else None
+        return not goal or goal in (getattr(shell, "goals", []) or [])
 
     @property
     def name(self) -> str:
@@ -262,47 +583,7 @@ class ChooseShellPhase(Phase):
             ctx.stop("No data profile available.")
             return
 
-        # Pass parsed_intent so shell selection can prioritize goal-matching shells
-        tool = build_choose_shell_tool(ctx.profile, ctx.parsed_intent)
-        if not tool:
-            ctx.add_error(
-                ShellError(
-                    "No compatible visualization shell available.",
-                    details={"profile_fields": list(ctx.profile.get("fields", {}).keys())},
-                )
-            )
-            return
-        reply = await provider.complete(ctx.transcripts, [tool])
-
-        if not reply:
-            ctx.stop("No visualization could be selected.")
-            return
-
-        chosen = get_tool_call("choose_shell", reply)
-        if not chosen or not chosen.get("shellId"):
-            ctx.add_error(
-                ShellError(
-                    "No compatible visualization shell available.",
-                    details={"profile_fields": list(ctx.profile.get("fields", {}).keys())},
-                )
-            )
-            return
-
-        shell_id = chosen["shellId"]
-        shell = SHELLS.get(shell_id)
-        if not shell:
-            ctx.add_error(
-                ShellError(
-                    f"Unknown shell selected: {shell_id}",
-                    details={"shell_id": shell_id},
-                )
-            )
-            return
-
-        ctx.shell_id = shell_id
-        ctx.shell = shell
-        ctx.logs.append(f"Visualizing {shell.name}.")
-        logger.debug(f"choose_shell_tool: {shell_id}")
+        await _select_shell(ctx, provider, self.fill_candidates)
 
 
 class CombinedDecisionPhase(Phase):
@@ -319,8 +600,16 @@ class CombinedDecisionPhase(Phase):
     - ParseIntentPhase: Extract visualization vs filter field intent
     - ExtractPhase: Apply data filtering/extraction
     - ChooseShellPhase: Select visualization type
+
+    With fill_candidates > 0, parameters for likely shells are requested
+    concurrently with Call 2 (see SpeculativeFill).
     """
 
+    decides = True
+
+    def __init__(self, fill_candidates: int = 0):
+        self.fill_candidates = fill_candidates
+
     @property
     def name(self) -> str:
         return "combined_decision"
@@ -369,59 +658,20 @@ class CombinedDecisionPhase(Phase):
                         process = PROCESSES.EXTRACT.get(process_id)
                         if process:
                             params = process_choice.get("params", {})
-                            ctx.values = run_process(process, ctx.values, params)
-                            ctx.profile = profile_rows(ctx.values)
+                            ctx.apply_process(process, params)
                             if "log" in process:
                                 ctx.logs.append(process["log"](params))
 
         # --- Call 2: Required tool (choose_shell) ---
         # This uses forced tool choice for reliability
-        # Pass parsed_intent so shell selection can prioritize goal-matching shells
-        shell_tool = build_choose_shell_tool(ctx.profile, ctx.parsed_intent)
-        if not shell_tool:
-            ctx.add_error(
-                ShellError(
-                    "No compatible visualization shell available.",
-                    details={"profile_fields": list(ctx.profile.get("fields", {}).keys())},
-                )
-            )
-            return
-        shell_reply = await provider.complete(ctx.transcripts, [shell_tool])
-
-        if not shell_reply:
-            ctx.stop("No visualization could be selected.")
-            return
-
-        shell_choice = get_tool_call("choose_shell", shell_reply)
-        if not shell_choice or not shell_choice.get("shellId"):
-            ctx.add_error(
-                ShellError(
-                    "No compatible visualization shell available.",
-                    details={"profile_fields": list(ctx.profile.get("fields", {}).keys())},
-                )
-            )
-            return
-
-        shell_id = shell_choice["shellId"]
-        shell = SHELLS.get(shell_id)
-        if not shell:
-            ctx.add_error(
-                ShellError(
-                    f"Unknown shell selected: {shell_id}",
-                    details={"shell_id": shell_id},
-                )
-            )
-            return
-
-        ctx.shell_id = shell_id
-        ctx.shell = shell
-        ctx.logs.append(f"Visualizing {shell.name}.")
-        logger.debug(f"CombinedDecisionPhase: Selected shell: {shell_id}")
+        await _select_shell(ctx, provider, self.fill_candidates)
 
 
 class FillParamsPhase(Phase):
     """Phase 3: Fill visualization parameters via LLM."""
 
+    decides = True
+
     @property
     def name(self) -> str:
         return "fill_params"
@@ -434,15 +684,10 @@ class FillParamsPhase(Phase):
         if not ctx.shell or not ctx.profile:
             return
 
-        fill_tool = build_fill_shell_params_tool(ctx.shell, ctx.profile, parsed_intent=ctx.parsed_intent)
-        if not fill_tool:
-            return
-
-        reply = await provider.complete(ctx.transcripts, [fill_tool])
-        if not reply:
-            return
-
-        filled = get_tool_call("fill_shell_params", reply)
+        if ctx.shell_id in ctx.prefilled:
+            filled = ctx.prefilled[ctx.shell_id]
+        else:
+            filled = await fill_shell_params(ctx, ctx.shell, provider)
         if filled:
             ctx.params.update(filled)
             logger.debug(f"fill_shell_params_tool: {ctx.params}")
@@ -478,13 +723,12 @@ class AnalyzePhase(Phase):
             if not process:
                 raise Exception(f"Unknown analyze process: {process_id}")
 
-            ctx.values = run_process(process, ctx.values, process_params)
-            ctx.profile = profile_rows(ctx.values)
+            ctx.apply_process(process, process_params)
 
             if "log" in process:
                 ctx.logs.append(process["log"](process_params))
 
-        logger.debug(f"analyze: {ctx.profile}")
+        logger.debug(f"analyze: {len(ctx.values)} rows")
 
 
 class ValidatePhase(Phase):
@@ -506,8 +750,48 @@ class ValidatePhase(Phase):
         ctx.shell.validate_or_raise(ctx.profile, ctx.params)
 
 
+class ReducePhase(Phase):
+    """Phase 6: Reduce large datasets to a point budget before compile.
+
+    Each shell picks its own strategy (binning, downsampling, sampling or
+    pre-aggregation); shells without one embed all values.
+    """
+
+    def __init__(self, point_budget: Optional[int] = DEFAULT_POINT_BUDGET):
+        self.point_budget = point_budget
+
+    @property
+    def name(self) -> str:
+        return "reduce"
+
+    async def run(
+        self,
+        ctx: PipelineContext,
+        provider: CompletionsProvider,
+    ) -> None:
+        if not ctx.shell or not self.point_budget or len(ctx.values) <= self.point_budget:
+            return
+
+        reduction = ctx.shell.reduce(ctx.params, ctx.values, self.point_budget)
+        if reduction is not None:
+            ctx.reduction = reduction
+            ctx.logs.append(reduction.log())
+
+
 class CompilePhase(Phase):
-    """Phase 6: Generate the final visualization spec."""
+    """Phase 7: Generate the final visualization spec.
+
+    With the "binary" data channel, values are delivered in ctx.datasets as
+    a columnar buffer and the spec refers to them by name, so large
+    datasets are never serialized as JSON. A table compiled by a shell that
+    embeds its values unchanged is encoded column by column, without row
+    dicts. Reduced values (already rows, bounded by the point budget), row
+    lists, and shells that derive new rows in compile() go through row
+    dicts and have their inline values detached from the spec.
+    """
+
+    def __init__(self, data_channel: str = "inline"):
+        self.data_channel = data_channel
 
     @property
     def name(self) -> str:
@@ -521,8 +805,23 @@ class CompilePhase(Phase):
         if not ctx.shell:
             return
 
-        spec = ctx.shell.compile(ctx.params, _sanitize_values(ctx.values), "vega-lite")
+        if ctx.reduction:
+            values = _sanitize_values(ctx.reduction.values)
+            spec = ctx.shell.compile_reduced(ctx.params, values, ctx.reduction, "vega-lite")
+        elif self.data_channel == "binary" and is_table(ctx.values) and ctx.shell.embeds_values:
+            table = ctx.values.sanitized()
+            spec = ctx.shell.compile_reference(ctx.params, table, DATASET_NAME, "vega-lite")
+            if spec:
+                ctx.datasets[DATASET_NAME] = encode_table(table)
+                ctx.spec = spec
+            return
+        else:
+            spec = ctx.shell.compile(ctx.params, _sanitize_values(ctx.values), "vega-lite")
         if spec:
+            if self.data_channel == "binary":
+                values = detach_data(spec, DATASET_NAME)
+                if values is not None:
+                    ctx.datasets[DATASET_NAME] = encode_rows(values)
             ctx.spec = spec
 
 
@@ -532,10 +831,17 @@ class Pipeline:
     The pipeline runs each phase in sequence, passing the shared context
     between them. If a phase signals to stop (via ctx.stop() or ctx.add_error()),
     the pipeline halts early.
+
+    With parallel=True, consecutive phases whose declared reads and writes
+    do not depend on each other run concurrently on forks of the context
+    (see Phase). Their results are merged in pipeline order; a phase that
+    ran ahead of fields changed by an earlier phase in its group is run
+    again unless it accepts the final fields.
     """
 
-    def __init__(self, phases: List[Phase]):
+    def __init__(self, phases: List[Phase], parallel: bool = False):
         self.phases = phases
+        self.parallel = parallel
 
     async def run(
         self,
@@ -546,54 +852,136 @@ class Pipeline:
 
         Returns the final context with results.
         """
-        for phase in self.phases:
+        for group in self.schedule():
             if not ctx.should_continue:
-                logger.debug(f"Pipeline stopped before phase: {phase.name}")
+                logger.debug(f"Pipeline stopped before phase: {group[0].name}")
                 break
 
-            logger.debug(f"Running phase: {phase.name}")
-            try:
-                await phase.run(ctx, provider)
-            except AppError as e:
-                ctx.add_error(e)
-                break
-            except Exception as e:
-                logger.exception(f"Unexpected error in phase {phase.name}: {e}")
-                ctx.errors.append(
-                    {
-                        "code": "UNEXPECTED_ERROR",
-                        "message": str(e),
-                        "details": {"phase": phase.name},
-                    }
-                )
-                ctx.logs.append("An unexpected error occurred.")
-                ctx.should_continue = False
-                break
+            if ctx.routed:
+                group = [phase for phase in group if not phase.decides]
+                if not group:
+                    continue
+
+            if len(group) == 1:
+                logger.debug(f"Running phase: {group[0].name}")
+                await _run_phase(group[0], ctx, provider)
+            else:
+                await self._run_concurrently(group, ctx, provider)
 
         return ctx
 
+    def schedule(self) -> List[List[Phase]]:
+        """Split the phases into groups that may run concurrently."""
+        groups: List[List[Phase]] = []
+        written: set = set()
+        for phase in self.phases:
+            group = groups[-1] if groups else None
+            joins = (
+                self.parallel
+                and group is not None
+                and phase.reads is not None
+                and group[0].reads is not None
+                and not written & (set(phase.reads) | set(phase.writes))
+            )
+            if joins:
+                group.append(phase)
+                written |= set(phase.writes)
+            else:
+                groups.append([phase])
+                written = set(phase.writes)
+        return groups
+
+    async def _run_concurrently(
+        self,
+        group: List[Phase],
+        ctx: PipelineContext,
+        provider: CompletionsProvider,
+    ) -> None:
+        logger.debug(f"Running phases concurrently: {[phase.name for phase in group]}")
+        speculated = {name for phase in group for name in phase.speculates}
+        before = {name: ctx.field_state(name) for name in speculated}
+        forks = [ctx.fork() for _ in group]
+        await asyncio.gather(*(_run_phase(phase, fork, provider) for phase, fork in zip(group, forks)))
+
+        for phase, fork in zip(group, forks):
+            if not ctx.should_continue:
+                logger.debug(f"Pipeline stopped before phase: {phase.name}")
+                break
+            changed = [name for name in phase.speculates if not _same_state(before[name], ctx.field_state(name))]
+            if changed and not phase.still_valid(ctx, fork):
+                logger.debug(f"Re-running phase {phase.name}, speculated fields changed: {changed}")
+                await _run_phase(phase, ctx, provider)
+            elif changed:
+                ctx.merge(fork, tuple(name for name in phase.writes if name not in phase.stale_writes))
+            else:
+                ctx.merge(fork, phase.writes)
+
+
+def _same_state(a: Any, b: Any) -> bool:
+    if isinstance(a, tuple) and isinstance(b, tuple):
+        return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+    return a is b
+
+
+async def _run_phase(phase: Phase, ctx: PipelineContext, provider: CompletionsProvider) -> None:
+    """Run one phase, turning exceptions into errors that stop the pipeline."""
+    try:
+        await phase.run(ctx, provider)
+    except AppError as e:
+        ctx.add_error(e)
+    except Exception as e:
+        logger.exception(f"Unexpected error in phase {phase.name}: {e}")
+        ctx.errors.append(
+            {
+                "code": "UNEXPECTED_ERROR",
+                "message": str(e),
+                "details": {"phase": phase.name},
+            }
+        )
+        ctx.logs.append("An unexpected error occurred.")
+        ctx.should_continue = False
 
-def create_default_pipeline() -> Pipeline:
+
+def create_default_pipeline(
+    snapshot_dir: Optional[str] = None,
+    point_budget: Optional[int] = DEFAULT_POINT_BUDGET,
+    data_channel: str = "inline",
+    fill_candidates: int = 0,
+    fast_path: bool = False,
+) -> Pipeline:
     """Create the optimized visualization pipeline (combined mode).
 
     Uses CombinedDecisionPhase to consolidate intent parsing, extraction,
     and shell selection, reducing latency with fewer LLM calls.
 
     Note: For local/smaller models, use create_sequential_pipeline() instead.
+
+    With fill_candidates > 0, parameters for that many likely shells are
+    requested concurrently with shell selection. With fast_path=True,
+    unambiguous requests are routed without LLM calls (see RoutePhase).
     """
     return Pipeline(
         [
-            LoadDataPhase(),
-            CombinedDecisionPhase(),
+            LoadDataPhase(snapshot_dir=snapshot_dir),
+            *([RoutePhase()] if fast_path else []),
+            CombinedDecisionPhase(fill_candidates),
             FillParamsPhase(),
             AnalyzePhase(),
             ValidatePhase(),
-            CompilePhase(),
+            ReducePhase(point_budget),
+            CompilePhase(data_channel),
         ]
     )
 
 
-def create_sequential_pipeline() -> Pipeline:
+def create_sequential_pipeline(
+    snapshot_dir: Optional[str] = None,
+    point_budget: Optional[int] = DEFAULT_POINT_BUDGET,
+    data_channel: str = "inline",
+    parallel: bool = False,
+    fill_candidates: int = 0,
+    fast_path: bool = False,
+) -> Pipeline:
     """Create a sequential visualization pipeline (sequential mode).
 
     Uses separate phases for intent parsing, extraction, and shell selection,
@@ -608,55 +996,97 @@ def create_sequential_pipeline() -> Pipeline:
     5. FillParams - Fill shell parameters (forced tool call)
     6. Analyze - Run shell-specific analysis
     7. Validate - Validate parameters
-    8. Compile - Generate Vega-Lite spec
+    8. Reduce - Reduce large datasets to the point budget
+    9. Compile - Generate Vega-Lite spec
+
+    With parallel=True, ParseIntent, Extract and ChooseShell run
+    concurrently; ChooseShell runs again only if extraction or the parsed
+    goal rules out the shell it chose. With fill_candidates > 0, parameters
+    for that many likely shells are requested concurrently with shell
+    selection; this needs the parsed goal, so it has no effect together
+    with parallel=True. With fast_path=True, unambiguous requests skip phases 2-5
+    (see RoutePhase).
     """
     return Pipeline(
         [
-            LoadDataPhase(),
+            LoadDataPhase(snapshot_dir=snapshot_dir),
+            *([RoutePhase()] if fast_path else []),
             ParseIntentPhase(),
             ExtractPhase(),
-            ChooseShellPhase(),
+            ChooseShellPhase(fill_candidates),
             FillParamsPhase(),
             AnalyzePhase(),
             ValidatePhase(),
-            CompilePhase(),
-        ]
+            ReducePhase(point_budget),
+            CompilePhase(data_channel),
+        ],
+        parallel=parallel,
     )
 
 
-def create_pipeline(combine: bool = False) -> Pipeline:
+def create_pipeline(
+    combine: bool = False,
+    snapshot_dir: Optional[str] = None,
+    point_budget: Optional[int] = DEFAULT_POINT_BUDGET,
+    data_channel: str = "inline",
+    parallel: bool = False,
+    fill_candidates: int = 0,
+    fast_path: bool = False,
+) -> Pipeline:
     """Create a visualization pipeline with the specified mode.
 
     Args:
         combine: If True, use combined pipeline (fast, fewer LLM calls).
                  If False, use sequential pipeline (reliable, separate forced tool calls).
                  Use False (sequential) for local/smaller models.
+        snapshot_dir: Directory for on-disk dataset snapshots shared between
+                 processes. None disables snapshots.
+        point_budget: Maximum number of values embedded in a spec before the
+                 shell reduces them. None disables reduction.
+        data_channel: "inline" embeds values in the spec, "binary" returns
+                 them as named columnar buffers next to the spec.
+        parallel: Run independent LLM phases of the sequential pipeline
+                 concurrently.
+        fill_candidates: Number of likely shells (by parsed goal) whose
+                 parameters are requested while the shell is chosen; the
+                 requests for shells that are not chosen are cancelled.
+                 Has no effect with parallel=True, where the shell is
+                 chosen before the goal is parsed.
+        fast_path: Route requests that name one shell and its fields
+                 directly, without LLM calls; others use the LLM phases.
 
     Returns:
         A configured Pipeline instance.
     """
     if combine:
-        return create_default_pipeline()
+        return create_default_pipeline(snapshot_dir, point_budget, data_channel, fill_candidates, fast_path)
     else:
-        return create_sequential_pipeline()
+        return create_sequential_pipeline(
+            snapshot_dir, point_budget, data_channel, parallel, fill_candidates, fast_path
+        )
 
 
-def _sanitize_values(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Clean row values, replacing non-finite floats with None."""
-    out = []
-    for r in rows:
-        clean = {}
-        for k, v in r.items():
-            if isinstance(v, float) and not math.isfinite(v):
-                clean[k] = None
-            else:
-                clean[k] = v
-        out.append(clean)
-    return out
+def _sanitize_values(values: ValuesType) -> List[Dict[str, Any]]:
+    """Return row dicts with non-finite floats replaced by None.
+
+    Tables mask non-finite values column-wise before rows are built. Row
+    lists are returned as is when clean; otherwise only the affected rows
+    are copied, so the caller's rows are never modified.
+    """
+    if is_table(values):
+        return values.sanitized().to_rows()
+    out = None
+    for i, r in enumerate(values):
+        if any(isinstance(v, float) and not math.isfinite(v) for v in r.values()):
+            if out is None:
+                out = list(values)
+            out[i] = {k: None if isinstance(v, float) and not math.isfinite(v) else v for k, v in r.items()}
+    return values if out is None else out
 
 
 __all__ = [
     "AnalyzePhase",
+    "CachingCompletionsProvider",
     "ChooseShellPhase",
     "CombinedDecisionPhase",
     "CompilePhase",
@@ -664,12 +1094,14 @@ __all__ = [
     "DefaultCompletionsProvider",
     "ExtractPhase",
     "FillParamsPhase",
+    "SpeculativeFill",
     "LoadDataPhase",
     "ParseIntentPhase",
     "Phase",
     "Pipeline",
     "PipelineContext",
     "RateLimitedCompletionsProvider",
+    "RoutePhase",
     "ValidatePhase",
     "create_default_pipeline",
     "create_pipeline",
@@ -1,6 +1,8 @@
-from typing import Any, Callable, Dict, List, Literal, Optional, TypedDict
+from typing import Any, Callable, Dict, List, Literal, Optional, TypedDict, Union
 
 from vintent.modules.exceptions import ProcessError
+from vintent.modules.schemas import ProfileEffect
+from vintent.modules.table import ColumnTable, as_rows
 
 # Type aliases for clarity
 DataShape = Literal["rowwise", "aggregate"]
@@ -8,6 +10,7 @@ ProcessPhase = Literal["extract", "analyze"]
 RowType = Dict[str, Any]
 RowsType = List[RowType]
 ParamsType = Dict[str, Any]
+ValuesType = Union[RowsType, ColumnTable]
 
 
 class Process(TypedDict, total=False):
@@ -23,6 +26,13 @@ class Process(TypedDict, total=False):
         phase: Whether this is an 'extract' or 'analyze' process
         requires_shape: Expected input data shape ('rowwise' or 'aggregate')
         produces_shape: Output data shape after processing
+        columnar: Whether run accepts a ColumnTable (otherwise rows are materialized first)
+        effect: How the output relates to the input, used to update the dataset
+            profile incrementally (a ProfileEffect, or a function of the params
+            returning one). Defaults to 'new_table'.
+        writes: Function of the params returning the columns a 'columns_added'
+            process writes, new or overwritten; without it the output is
+            profiled from scratch.
     """
 
     id: str
@@ -32,18 +42,43 @@ class Process(TypedDict, total=False):
     phase: ProcessPhase
     requires_shape: DataShape
     produces_shape: DataShape
+    columnar: bool
+    effect: Union[ProfileEffect, Callable[[ParamsType], ProfileEffect]]
+    writes: Callable[[ParamsType], List[str]]
 
 
-def run_process(process: Process, rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def process_effect(process: Process, params: ParamsType) -> ProfileEffect:
+    """Return the declared profile effect of running a process with params."""
+    effect = process.get("effect", "new_table")
+    if callable(effect):
+        return effect(params)
+    return effect
+
+
+def process_writes(process: Process, params: ParamsType) -> Optional[List[str]]:
+    """Return the columns a process writes, or None if it does not declare them."""
+    writes = process.get("writes")
+    return writes(params) if writes else None
+
+
+def sort_dependent_effect(params: ParamsType) -> ProfileEffect:
+    """Effect of processes that add a derived column and reorder rows by sort_by.
+
+    Sorting reorders the rows, otherwise only the derived column is new.
+    """
+    return "new_table" if params.get("sort_by") else "columns_added"
+
+
+def run_process(process: Process, rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     """Execute a data processing step.
 
     Args:
         process: The process definition to execute
-        rows: Input data rows
+        rows: Input data rows or a ColumnTable
         params: Parameters for the process
 
     Returns:
-        Transformed data rows
+        Transformed data rows, or a ColumnTable if the process is columnar
 
     Raises:
         ProcessError: If the process is missing or execution fails
@@ -53,6 +88,9 @@ def run_process(process: Process, rows: List[Dict[str, Any]], params: Dict[str,
 
     process_id = process.get("id", "unknown")
 
+    if not process.get("columnar"):
+        rows = as_rows(rows)
+
     try:
         return process["run"](rows, params)
     except KeyError as e:
@@ -1,4 +1,11 @@
-from typing import Any, Dict, List
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from vintent.modules.process import ValuesType
+from vintent.modules.process.columnar import as_columnar, float_column
+from vintent.modules.table import as_rows
 
 PROCESS_ID = "compute_bins"
 PROCESS_PHASE = "analyze"
@@ -9,16 +16,28 @@ DEFAULT_BINS = 10
 MAX_BINS = 50
 
 
-def run(rows: List[Dict[str, object]], params: Dict[str, Any]) -> List[Dict[str, object]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> List[Dict[str, object]]:
     if not rows:
         return []
     field = params.get("field")
     bins = params.get("bins", DEFAULT_BINS)
+    table = as_columnar(rows, numeric=[field]) if isinstance(bins, int) and bins > 0 else None
+    if table is not None:
+        data, present = float_column(table, field)
+        array = data[present]
+        # Non-finite values make the row path fail or misorder, leave them to it
+        if np.isfinite(array).all():
+            return _bin_values(array.tolist(), bins, array)
     values: List[float] = []
-    for row in rows:
+    for row in as_rows(rows):
         v = row.get(field)
         if isinstance(v, (int, float)):
             values.append(float(v))
+    return _bin_values(values, bins)
+
+
+def _bin_values(values: List[float], bins: int, array: Optional[np.ndarray] = None) -> List[Dict[str, object]]:
+    """Bin values into equal-width bins, counting with NumPy when array holds the same values."""
     if not values:
         return []
     min_v = min(values)
@@ -33,12 +52,16 @@ def run(rows: List[Dict[str, object]], params: Dict[str, Any]) -> List[Dict[str,
             }
         ]
     width = (max_v - min_v) / bins
-    counts = [0] * bins
-    for v in values:
-        idx = int((v - min_v) / width)
-        if idx == bins:
-            idx = bins - 1
-        counts[idx] += 1
+    if array is not None and math.isfinite(width):
+        idx = ((array - min_v) / width).astype(np.int64)
+        counts = np.bincount(np.minimum(idx, bins - 1), minlength=bins).tolist()
+    else:
+        counts = [0] * bins
+        for v in values:
+            idx = int((v - min_v) / width)
+            if idx == bins:
+                idx = bins - 1
+            counts[idx] += 1
     out: List[Dict[str, object]] = []
     for i, c in enumerate(counts):
         start = min_v + i * width
@@ -64,6 +87,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "log": log,
     "run": run,
 }
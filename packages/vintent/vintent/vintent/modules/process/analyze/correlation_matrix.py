@@ -1,5 +1,8 @@
-import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from vintent.modules.process import ValuesType
+from vintent.modules.process.matrix import matrix_rows, numeric_matrix, pairwise_correlation
+from vintent.modules.table import ColumnTable
 
 PROCESS_ID = "correlation_matrix"
 PROCESS_PHASE = "analyze"
@@ -7,61 +10,28 @@ REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "aggregate"
 
 
-def run(rows: List[Dict[str, object]], params: Dict[str, Any]) -> List[Dict[str, object]]:
+def _as_number(value: Any) -> Optional[float]:
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def run(rows: ValuesType, params: Dict[str, Any]) -> List[Dict[str, object]]:
     if not rows:
         return []
 
-    numeric_fields: List[str] = []
-    for key, value in rows[0].items():
-        if isinstance(value, (int, float)):
-            numeric_fields.append(key)
+    first = rows.take([0]).to_rows()[0] if isinstance(rows, ColumnTable) else rows[0]
+    numeric_fields = [key for key, value in first.items() if isinstance(value, (int, float))]
 
     if len(numeric_fields) < 2:
         return []
 
-    series: Dict[str, List[float]] = {}
-    for field in numeric_fields:
-        values: List[float] = []
-        for row in rows:
-            v = row.get(field)
-            if isinstance(v, (int, float)):
-                values.append(float(v))
-        if values:
-            series[field] = values
-
-    fields = list(series.keys())
+    # Each pair of fields is correlated over the rows where both are numeric
+    data, valid = numeric_matrix(rows, numeric_fields, _as_number)
+    keep = valid.any(axis=0)
+    fields = [f for f, k in zip(numeric_fields, keep.tolist()) if k]
     if len(fields) < 2:
         return []
 
-    out: List[Dict[str, object]] = []
-
-    for x in fields:
-        xs = series[x]
-        mean_x = sum(xs) / len(xs)
-        var_x = sum((v - mean_x) ** 2 for v in xs)
-
-        for y in fields:
-            ys = series[y]
-            mean_y = sum(ys) / len(ys)
-            var_y = sum((v - mean_y) ** 2 for v in ys)
-
-            cov = 0.0
-            n = min(len(xs), len(ys))
-            for i in range(n):
-                cov += (xs[i] - mean_x) * (ys[i] - mean_y)
-
-            denom = math.sqrt(var_x * var_y)
-            value = cov / denom if denom != 0 else 0.0
-
-            out.append(
-                {
-                    "x": x,
-                    "y": y,
-                    "value": value,
-                }
-            )
-
-    return out
+    return matrix_rows(fields, pairwise_correlation(data[:, keep], valid[:, keep]))
 
 
 def log(params: Dict[str, Any]) -> str:
@@ -73,6 +43,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "log": log,
     "run": run,
 }
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-import numpy as np
+from vintent.modules.process import ValuesType
+from vintent.modules.process.matrix import matrix_rows, numeric_matrix, pairwise_covariance
 
 PROCESS_ID = "covariance"
 PROCESS_PHASE = "analyze"
@@ -10,36 +11,24 @@ REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "aggregate"
 
 
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]):
-    columns = params.get("columns") or []
+def _as_number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except Exception:
+        return None
 
-    X = []
-    for r in rows:
-        try:
-            vals = [float(r[c]) for c in columns]
-        except Exception:
-            continue
-        if any(np.isnan(v) for v in vals):
-            continue
-        X.append(vals)
-
-    if len(X) < 2:
-        raise Exception("covariance_invalid_shape")
 
-    X = np.asarray(X, dtype=float)
-    cov = np.cov(X, rowvar=False)
+def run(rows: ValuesType, params: Dict[str, Any]):
+    columns = params.get("columns") or []
 
-    out: List[Dict[str, Any]] = []
-    for i, xi in enumerate(columns):
-        for j, yj in enumerate(columns):
-            out.append(
-                {
-                    "x": xi,
-                    "y": yj,
-                    "value": float(cov[i, j]),
-                }
-            )
+    # Each pair of columns uses the rows where both values are valid
+    data, valid = numeric_matrix(rows, columns, _as_number)
+    cov, n = pairwise_covariance(data, valid)
+
+    if not (n >= 2).any():
+        raise Exception("covariance_invalid_shape")
 
+    out: List[Dict[str, Any]] = matrix_rows(columns, cov)
     return out
 
 
@@ -53,6 +42,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "log": log,
     "run": run,
 }
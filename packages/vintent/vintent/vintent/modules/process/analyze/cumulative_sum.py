@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from vintent.modules.process import ValuesType, sort_dependent_effect
+from vintent.modules.process.columnar import as_columnar, finite_column, sorted_order
+from vintent.modules.table import ColumnTable, as_rows
 
 PROCESS_ID = "cumulative_sum"
 PROCESS_PHASE = "analyze"
@@ -9,7 +15,7 @@ REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "rowwise"
 
 
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     if not rows:
         return []
 
@@ -19,6 +25,13 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     if not field:
         return rows
 
+    table = as_columnar(rows, numeric=[field], convert_rows=False)
+    if table is not None:
+        out = _run_columnar(table, field, sort_by)
+        if out is not None:
+            return out
+    rows = as_rows(rows)
+
     # Sort if specified
     if sort_by:
         rows = sorted(rows, key=lambda r: (r.get(sort_by) is None, r.get(sort_by)))
@@ -41,6 +54,22 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     return result
 
 
+def _run_columnar(table: ColumnTable, field: str, sort_by: Optional[str]) -> Optional[ColumnTable]:
+    if sort_by:
+        order = sorted_order(table, sort_by)
+        if order is None:
+            return None
+        table = table.take(order)
+    values, finite = finite_column(table, field)
+    # Adding 0.0 for skipped rows carries the running total unchanged
+    cumsum = np.cumsum(np.where(finite, values, 0.0))
+    return table.with_column(f"{field}_cumsum", cumsum)
+
+
+def writes(params: Dict[str, Any]) -> List[str]:
+    return [f"{params.get('field')}_cumsum"]
+
+
 def log(params: Dict[str, Any]) -> str:
     field = params.get("field", "unknown")
     return f"Computed cumulative sum of {field}."
@@ -51,6 +80,9 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
+    "effect": sort_dependent_effect,
+    "writes": writes,
     "log": log,
     "run": run,
 }
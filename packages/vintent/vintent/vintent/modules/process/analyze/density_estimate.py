@@ -5,16 +5,15 @@ from typing import Any, Dict, List
 
 import numpy as np
 
+from vintent.modules.process import ValuesType
+from vintent.modules.process.groupby import GroupBy, finite_values
+
 PROCESS_ID = "density_estimate"
 PROCESS_PHASE = "analyze"
 REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "aggregate"
 
 
-def _is_finite(v: Any) -> bool:
-    return isinstance(v, (int, float)) and math.isfinite(v)
-
-
 def _kde_1d(x: np.ndarray, grid: np.ndarray) -> np.ndarray:
     n = len(x)
     if n < 2:
@@ -29,7 +28,7 @@ def _kde_1d(x: np.ndarray, grid: np.ndarray) -> np.ndarray:
     return np.exp(-0.5 * diff**2).sum(axis=1) / (n * bw * math.sqrt(2 * math.pi))
 
 
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> List[Dict[str, Any]]:
     group_by = params.get("group_by")
     field = params.get("field")
     points = int(params.get("points", 50))
@@ -37,22 +36,17 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     if not rows or not field:
         return []
 
-    groups: Dict[Any, List[float]] = {}
-
-    for r in rows:
-        v = r.get(field)
-        if not _is_finite(v):
-            continue
-        key = r.get(group_by) if group_by else "__all__"
-        groups.setdefault(key, []).append(float(v))
+    values, finite = finite_values(rows, field)
+    groups = GroupBy.from_values(rows, group_by or [], include=finite)
 
     out: List[Dict[str, Any]] = []
 
-    for key, values in groups.items():
-        if len(values) < 2:
+    for key, group in zip(groups.keys, groups.split(values, finite)):
+        if len(group) < 2:
             continue
 
-        x = np.asarray(values, dtype=float)
+        key = key if group_by else "__all__"
+        x = np.asarray(group, dtype=float)
         lo = x.min()
         hi = x.max()
         if not math.isfinite(lo) or not math.isfinite(hi) or lo == hi:
@@ -88,6 +82,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "run": run,
     "log": log,
 }
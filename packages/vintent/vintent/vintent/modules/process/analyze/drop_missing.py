@@ -7,6 +7,7 @@ PROCESS_ID = "drop_missing"
 PROCESS_PHASE = "analyze"
 REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "rowwise"
+PROFILE_EFFECT = "rows_subset"
 
 
 def _is_missing(v: Any) -> bool:
@@ -48,6 +49,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "effect": PROFILE_EFFECT,
     "log": log,
     "run": run,
 }
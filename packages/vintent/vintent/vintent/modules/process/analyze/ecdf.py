@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from vintent.modules.process import ValuesType
+from vintent.modules.process.columnar import as_columnar, finite_column
+from vintent.modules.process.groupby import GroupBy, finite_values
+from vintent.modules.table import ColumnTable, build_column
 
 PROCESS_ID = "ecdf"
 PROCESS_PHASE = "analyze"
@@ -9,11 +15,7 @@ REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "aggregate"
 
 
-def _is_finite(v: Any) -> bool:
-    return isinstance(v, (int, float)) and math.isfinite(v)
-
-
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     if not rows:
         return []
 
@@ -23,25 +25,22 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     if not field:
         return rows
 
-    groups: Dict[Any, List[float]] = {}
-
-    for r in rows:
-        v = r.get(field)
-        if not _is_finite(v):
-            continue
-        key = r.get(group_by) if group_by else None
-        groups.setdefault(key, []).append(float(v))
+    # Output field names must not collide for the columnar result to match
+    keys = [group_by] if group_by else []
+    distinct_names = len({field, "ecdf", *keys}) == len(keys) + 2
+    table = as_columnar(rows, numeric=[field], keys=keys) if distinct_names else None
+    if table is not None:
+        return _run_columnar(table, field, group_by)
+    values, finite = finite_values(rows, field)
+    groups = GroupBy.from_values(rows, group_by or [], include=finite)
 
     out: List[Dict[str, Any]] = []
 
-    for key, values in groups.items():
-        if not values:
-            continue
-        values.sort()
-        n = len(values)
-        for i, v in enumerate(values, start=1):
+    for key, group in zip(groups.keys, groups.split(values, finite, sort=True)):
+        n = len(group)
+        for i, v in enumerate(group, start=1):
             row: Dict[str, Any] = {
-                field: v,
+                field: float(v),
                 "ecdf": i / n,
             }
             if group_by:
@@ -51,6 +50,25 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     return out
 
 
+def _run_columnar(table: ColumnTable, field: str, group_by: Optional[str]) -> ColumnTable:
+    values, finite = finite_column(table, field)
+    groups = GroupBy.from_values(table, group_by or [], include=finite)
+    values, codes, keys = values[finite], groups.codes[finite], groups.keys
+    order = np.lexsort((values, codes))
+    codes = codes[order]
+    counts = np.bincount(codes, minlength=len(keys))
+    starts = np.cumsum(counts) - counts
+    # 1-based position within the group divided by the group size
+    rank = np.arange(1, len(values) + 1) - starts[codes]
+    data = {field: values[order], "ecdf": rank / counts[codes]}
+    mask = {field: np.zeros(len(values), dtype=bool), "ecdf": np.zeros(len(values), dtype=bool)}
+    kinds = {field: "quantitative", "ecdf": "quantitative"}
+    if group_by:
+        key_data, key_mask, kinds[group_by] = build_column(keys)
+        data[group_by], mask[group_by] = key_data[codes], key_mask[codes]
+    return ColumnTable(data, mask, kinds, len(values))
+
+
 def log(params: Dict[str, Any]) -> str:
     field = params.get("field")
     group_by = params.get("group_by")
@@ -64,6 +82,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "run": run,
     "log": log,
 }
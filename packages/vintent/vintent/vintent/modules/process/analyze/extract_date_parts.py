@@ -7,6 +7,7 @@ PROCESS_ID = "extract_date_parts"
 PROCESS_PHASE = "analyze"
 REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "rowwise"
+PROFILE_EFFECT = "columns_added"
 
 
 def _parse_date(value: Any) -> datetime | None:
@@ -60,6 +61,13 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     return result
 
 
+def writes(params: Dict[str, Any]) -> List[str]:
+    field = params.get("field")
+    if not field:
+        return []
+    return [f"{field}_{part}" for part in params.get("parts", ["year", "month", "day"])]
+
+
 def log(params: Dict[str, Any]) -> str:
     field = params.get("field", "date")
     parts = params.get("parts", ["year", "month", "day"])
@@ -72,6 +80,8 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "effect": PROFILE_EFFECT,
+    "writes": writes,
     "log": log,
     "run": run,
 }
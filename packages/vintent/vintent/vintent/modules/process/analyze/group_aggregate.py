@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence, Union
+
+from vintent.modules.process import ValuesType
+from vintent.modules.process.groupby import GroupBy, finite_values
 
 PROCESS_ID = "group_aggregate"
 PROCESS_PHASE = "analyze"
@@ -11,43 +14,35 @@ PRODUCES_SHAPE = "aggregate"
 AGG_OPS = {"mean", "sum", "min", "max", "count"}
 
 
-def _is_finite(v: Any) -> bool:
-    return isinstance(v, (int, float)) and math.isfinite(v)
+def _key_fields(group_by: Union[str, Sequence[str]], key: Any) -> Dict[str, Any]:
+    if isinstance(group_by, str):
+        return {group_by: key}
+    return dict(zip(group_by, key))
 
 
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     if not rows:
         return []
+    # group_by is a field name, or a list of field names for multi-field keys
     group_by = params.get("group_by")
     op = params.get("op")
     metric = params.get("metric")
     if not group_by or not op or op not in AGG_OPS:
         return rows
-    groups: Dict[Any, List[Dict[str, Any]]] = {}
-    for row in rows:
-        key = row.get(group_by)
-        groups.setdefault(key, []).append(row)
+    groups = GroupBy.from_values(rows, group_by)
     out: List[Dict[str, Any]] = []
-    for key, group in groups.items():
-        if op == "count":
-            out.append({group_by: key, "count": len(group)})
-        else:
-            values = [r.get(metric) for r in group if _is_finite(r.get(metric))]
-            if not values:
-                continue
-            if op == "mean":
-                agg = sum(values) / len(values)
-            elif op == "sum":
-                agg = sum(values)
-            elif op == "min":
-                agg = min(values)
-            elif op == "max":
-                agg = max(values)
-            else:
-                continue
-            if not math.isfinite(agg):
-                continue
-            out.append({group_by: key, metric: float(agg)})
+    if op == "count":
+        for key, size in zip(groups.keys, groups.sizes()):
+            out.append({**_key_fields(group_by, key), "count": size})
+        return out
+    values, finite = finite_values(rows, metric)
+    for key, stats in zip(groups.keys, groups.aggregate(values, finite, [op])):
+        if stats is None:
+            continue
+        agg = stats[op]
+        if not math.isfinite(agg):
+            continue
+        out.append({**_key_fields(group_by, key), metric: float(agg)})
     return out
 
 
@@ -55,6 +50,8 @@ def log(params: Dict[str, Any]) -> str:
     group_by = params.get("group_by")
     op = params.get("op")
     metric = params.get("metric")
+    if not isinstance(group_by, str) and group_by:
+        group_by = ", ".join(group_by)
     if op == "count":
         return f"Grouped by {group_by} and counted rows."
     return f"Grouped by {group_by} and computed {op} of {metric}."
@@ -65,6 +62,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "log": log,
     "run": run,
 }
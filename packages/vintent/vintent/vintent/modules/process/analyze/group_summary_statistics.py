@@ -1,28 +1,19 @@
 from __future__ import annotations
 
-import math
 from typing import Any, Dict, List
 
+from vintent.modules.process import ValuesType
+from vintent.modules.process.groupby import GroupBy, finite_values
+
 PROCESS_ID = "group_summary_statistics"
 PROCESS_PHASE = "analyze"
 REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "aggregate"
 
+SUMMARY_OPS = ["count", "mean", "median", "std", "min", "max"]
 
-def _is_finite(v: Any) -> bool:
-    return isinstance(v, (int, float)) and math.isfinite(v)
-
-
-def _median(vals: List[float]) -> float:
-    s = sorted(vals)
-    n = len(s)
-    m = n // 2
-    if n % 2 == 1:
-        return s[m]
-    return (s[m - 1] + s[m]) / 2.0
 
-
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     if not rows:
         return []
 
@@ -32,32 +23,27 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     if not group_by or not fields:
         return rows
 
-    groups: Dict[Any, List[Dict[str, Any]]] = {}
-    for r in rows:
-        groups.setdefault(r.get(group_by), []).append(r)
+    groups = GroupBy.from_values(rows, group_by)
+    summaries = {f: groups.aggregate(*finite_values(rows, f), SUMMARY_OPS) for f in fields}
 
     out: List[Dict[str, Any]] = []
 
-    for g, items in groups.items():
+    for i, g in enumerate(groups.keys):
         for f in fields:
-            values = [r.get(f) for r in items if _is_finite(r.get(f))]
-            if not values:
+            stats = summaries[f][i]
+            if stats is None:
                 continue
 
-            mean = sum(values) / len(values)
-            var = sum((v - mean) ** 2 for v in values) / len(values)
-            std = math.sqrt(var)
-
             out.append(
                 {
                     "group": g,
                     "field": f,
-                    "count": len(values),
-                    "mean": float(mean),
-                    "median": float(_median(values)),
-                    "std": float(std),
-                    "min": float(min(values)),
-                    "max": float(max(values)),
+                    "count": stats["count"],
+                    "mean": float(stats["mean"]),
+                    "median": float(stats["median"]),
+                    "std": float(stats["std"]),
+                    "min": float(stats["min"]),
+                    "max": float(stats["max"]),
                 }
             )
 
@@ -73,6 +59,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "log": log,
     "run": run,
 }
@@ -1,12 +1,18 @@
 from typing import Any, Dict, List
 
+import numpy as np
+
+from vintent.modules.process import ValuesType
+from vintent.modules.process.columnar import as_columnar, float_column
+from vintent.modules.table import ColumnTable, as_rows
+
 PROCESS_ID = "normalize_minmax"
 PROCESS_PHASE = "analyze"
 REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "rowwise"
 
 
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     if not rows:
         return []
 
@@ -14,6 +20,14 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     if not field:
         return rows
 
+    table = as_columnar(rows, numeric=[field], convert_rows=False)
+    if table is not None:
+        values, present = float_column(table, field)
+        # NaN breaks min/max ordering, leave it to the row path
+        if not np.isnan(values[present]).any():
+            return _run_columnar(table, field, values, present)
+    rows = as_rows(rows)
+
     values: List[float] = []
     for r in rows:
         v = r.get(field)
@@ -40,6 +54,21 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     return out
 
 
+def _run_columnar(table: ColumnTable, field: str, values: np.ndarray, present: np.ndarray) -> ColumnTable:
+    if not present.any():
+        return table
+    valid = values[present].tolist()
+    vmin = min(valid)
+    vmax = max(valid)
+    scaled = values.copy()
+    if vmax != vmin:
+        with np.errstate(invalid="ignore", over="ignore"):
+            scaled[present] = (values[present] - vmin) / (vmax - vmin)
+    else:
+        scaled[present] = 0.0
+    return table.with_column(field, scaled, ~present)
+
+
 def log(params: Dict[str, Any]) -> str:
     field = params.get("field")
     return f"Normalized column '{field}' using min-max scaling."
@@ -50,6 +79,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "log": log,
     "run": run,
 }
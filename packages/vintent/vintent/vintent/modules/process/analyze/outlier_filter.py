@@ -1,15 +1,44 @@
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+from vintent.modules.process import ValuesType
+from vintent.modules.process.columnar import as_columnar, finite_column
+from vintent.modules.table import ColumnTable, as_rows
 
 PROCESS_ID = "outlier_filter"
 PROCESS_PHASE = "analyze"
 REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "rowwise"
+PROFILE_EFFECT = "rows_subset"
+
+
+def _bounds(values: List[float], method: str, threshold: float) -> Optional[Tuple[float, float]]:
+    """Return the (lower, upper) inlier bounds, or None to keep every row."""
+    if len(values) < 4:
+        return None
+
+    if method == "iqr":
+        sorted_vals = sorted(values)
+        n = len(sorted_vals)
+        q1 = sorted_vals[n // 4]
+        q3 = sorted_vals[(3 * n) // 4]
+        iqr = q3 - q1
+        lower = q1 - threshold * iqr
+        upper = q3 + threshold * iqr
+    else:  # z-score
+        mean = sum(values) / len(values)
+        variance = sum((v - mean) ** 2 for v in values) / len(values)
+        std = math.sqrt(variance) if variance > 0 else 0
+        if std == 0:
+            return None
+        lower = mean - threshold * std
+        upper = mean + threshold * std
+    return lower, upper
 
 
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     if not rows:
         return []
 
@@ -20,6 +49,11 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     if not field:
         return rows
 
+    table = as_columnar(rows, numeric=[field], convert_rows=False)
+    if table is not None:
+        return _run_columnar(table, field, method, threshold)
+    rows = as_rows(rows)
+
     # Extract numeric values
     values = []
     for row in rows:
@@ -27,25 +61,10 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
         if isinstance(v, (int, float)) and math.isfinite(v):
             values.append(v)
 
-    if len(values) < 4:
+    bounds = _bounds(values, method, threshold)
+    if bounds is None:
         return rows
-
-    if method == "iqr":
-        sorted_vals = sorted(values)
-        n = len(sorted_vals)
-        q1 = sorted_vals[n // 4]
-        q3 = sorted_vals[(3 * n) // 4]
-        iqr = q3 - q1
-        lower = q1 - threshold * iqr
-        upper = q3 + threshold * iqr
-    else:  # z-score
-        mean = sum(values) / len(values)
-        variance = sum((v - mean) ** 2 for v in values) / len(values)
-        std = math.sqrt(variance) if variance > 0 else 0
-        if std == 0:
-            return rows
-        lower = mean - threshold * std
-        upper = mean + threshold * std
+    lower, upper = bounds
 
     result: List[Dict[str, Any]] = []
     for row in rows:
@@ -60,6 +79,16 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     return result
 
 
+def _run_columnar(table: ColumnTable, field: str, method: str, threshold: float) -> ColumnTable:
+    values, finite = finite_column(table, field)
+    bounds = _bounds(values[finite].tolist(), method, threshold)
+    if bounds is None:
+        return table
+    lower, upper = bounds
+    # Rows with non-numeric values are kept
+    return table.take(~finite | ((lower <= values) & (values <= upper)))
+
+
 def log(params: Dict[str, Any]) -> str:
     field = params.get("field", "unknown")
     method = params.get("method", "iqr")
@@ -73,6 +102,8 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
+    "effect": PROFILE_EFFECT,
     "log": log,
     "run": run,
 }
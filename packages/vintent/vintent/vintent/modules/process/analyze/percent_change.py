@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from vintent.modules.process import ValuesType, sort_dependent_effect
+from vintent.modules.process.columnar import as_columnar, finite_column, sorted_order
+from vintent.modules.table import ColumnTable, as_rows
 
 PROCESS_ID = "percent_change"
 PROCESS_PHASE = "analyze"
@@ -9,7 +15,7 @@ REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "rowwise"
 
 
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     if not rows:
         return []
 
@@ -19,6 +25,13 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     if not field:
         return rows
 
+    table = as_columnar(rows, numeric=[field], convert_rows=False)
+    if table is not None:
+        out = _run_columnar(table, field, sort_by)
+        if out is not None:
+            return out
+    rows = as_rows(rows)
+
     # Sort if specified
     if sort_by:
         rows = sorted(rows, key=lambda r: (r.get(sort_by) is None, r.get(sort_by)))
@@ -45,6 +58,30 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     return result
 
 
+def _run_columnar(table: ColumnTable, field: str, sort_by: Optional[str]) -> Optional[ColumnTable]:
+    if sort_by:
+        order = sorted_order(table, sort_by)
+        if order is None:
+            return None
+        table = table.take(order)
+    values, finite = finite_column(table, field)
+    # Each finite value is compared with the previous finite value
+    idx = np.flatnonzero(finite)
+    current = values[idx[1:]]
+    prev = values[idx[:-1]]
+    defined = prev != 0
+    pct = np.zeros(table.row_count)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        pct[idx[1:]] = ((current - prev) / np.abs(prev)) * 100
+    nulls = np.ones(table.row_count, dtype=bool)
+    nulls[idx[1:][defined]] = False
+    return table.with_column(f"{field}_pct_change", pct, nulls)
+
+
+def writes(params: Dict[str, Any]) -> List[str]:
+    return [f"{params.get('field')}_pct_change"]
+
+
 def log(params: Dict[str, Any]) -> str:
     field = params.get("field", "unknown")
     return f"Computed percent change for {field}."
@@ -55,6 +92,9 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
+    "effect": sort_dependent_effect,
+    "writes": writes,
     "log": log,
     "run": run,
 }
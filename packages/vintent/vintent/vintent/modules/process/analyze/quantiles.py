@@ -1,32 +1,17 @@
 from __future__ import annotations
 
-import math
 from typing import Any, Dict, List
 
+from vintent.modules.process import ValuesType
+from vintent.modules.process.groupby import GroupBy, finite_values, quantile
+
 PROCESS_ID = "quantiles"
 PROCESS_PHASE = "analyze"
 REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "aggregate"
 
 
-def _is_finite(v: Any) -> bool:
-    return isinstance(v, (int, float)) and math.isfinite(v)
-
-
-def _quantile(sorted_vals: List[float], q: float) -> float:
-    n = len(sorted_vals)
-    if n == 1:
-        return sorted_vals[0]
-    pos = q * (n - 1)
-    lo = int(math.floor(pos))
-    hi = int(math.ceil(pos))
-    if lo == hi:
-        return sorted_vals[lo]
-    w = pos - lo
-    return sorted_vals[lo] * (1 - w) + sorted_vals[hi] * w
-
-
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     if not rows:
         return []
 
@@ -37,41 +22,16 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     if not field:
         return rows
 
-    out: List[Dict[str, Any]] = []
+    values, finite = finite_values(rows, field)
+    groups = GroupBy.from_values(rows, group_by or [], include=finite)
 
-    if group_by:
-        groups: Dict[Any, List[float]] = {}
-        for r in rows:
-            v = r.get(field)
-            if _is_finite(v):
-                groups.setdefault(r.get(group_by), []).append(float(v))
+    out: List[Dict[str, Any]] = []
 
-        for g, vals in groups.items():
-            if not vals:
-                continue
-            vals.sort()
-            for q in qs:
-                out.append(
-                    {
-                        "group": g,
-                        "field": field,
-                        "q": q,
-                        "value": float(_quantile(vals, q)),
-                    }
-                )
-    else:
-        vals = [float(r.get(field)) for r in rows if _is_finite(r.get(field))]
-        if not vals:
-            return []
-        vals.sort()
+    for g, vals in zip(groups.keys, groups.split(values, finite, sort=True)):
         for q in qs:
-            out.append(
-                {
-                    "field": field,
-                    "q": q,
-                    "value": float(_quantile(vals, q)),
-                }
-            )
+            row: Dict[str, Any] = {"group": g} if group_by else {}
+            row.update({"field": field, "q": q, "value": float(quantile(vals, q))})
+            out.append(row)
 
     return out
 
@@ -85,6 +45,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "log": log,
     "run": run,
 }
@@ -3,6 +3,8 @@ from __future__ import annotations
 import math
 from typing import Any, Dict, List
 
+from vintent.modules.process import sort_dependent_effect
+
 PROCESS_ID = "rolling_average"
 PROCESS_PHASE = "analyze"
 REQUIRES_SHAPE = "rowwise"
@@ -45,6 +47,10 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     return result
 
 
+def writes(params: Dict[str, Any]) -> List[str]:
+    return [f"{params.get('field')}_rolling_avg"]
+
+
 def log(params: Dict[str, Any]) -> str:
     field = params.get("field", "unknown")
     window = params.get("window", 3)
@@ -56,6 +62,8 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "effect": sort_dependent_effect,
+    "writes": writes,
     "log": log,
     "run": run,
 }
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 import math
+import operator
+from itertools import repeat
 from typing import Any, Dict, List
 
+import numpy as np
+
+from vintent.modules.process import ValuesType
+from vintent.modules.process.columnar import as_columnar, finite_column
+from vintent.modules.table import ColumnTable, as_rows
+
 PROCESS_ID = "standardize_columns"
 PROCESS_PHASE = "analyze"
 REQUIRES_SHAPE = "rowwise"
@@ -13,7 +21,7 @@ def _is_finite(v: Any) -> bool:
     return isinstance(v, (int, float)) and math.isfinite(v)
 
 
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     if not rows:
         return []
 
@@ -24,6 +32,11 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     if not columns:
         return rows
 
+    table = as_columnar(rows, numeric=columns, convert_rows=False)
+    if table is not None:
+        return _run_columnar(table, columns, with_mean, with_std)
+    rows = as_rows(rows)
+
     stats: Dict[str, Dict[str, float]] = {}
 
     for c in columns:
@@ -55,6 +68,29 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     return out
 
 
+def _run_columnar(table: ColumnTable, columns: List[str], with_mean: bool, with_std: bool) -> ColumnTable:
+    for c in dict.fromkeys(columns):
+        values, finite = finite_column(table, c)
+        vals = values[finite].tolist()
+        if not vals:
+            continue
+        # Same reductions as the row path so results match bit for bit
+        mean = sum(vals) / len(vals)
+        var = sum(map(operator.pow, (values[finite] - mean).tolist(), repeat(2))) / len(vals)
+        std = math.sqrt(var) if var > 0 else 1.0
+        x = values[finite]
+        with np.errstate(over="ignore"):
+            if with_mean:
+                x = x - mean
+            if with_std:
+                x = x / std
+        keep = np.isfinite(x)
+        scaled = values.copy()
+        scaled[np.flatnonzero(finite)[keep]] = x[keep]
+        table = table.with_column(c, scaled, table.mask[c])
+    return table
+
+
 def log(params: Dict[str, Any]) -> str:
     cols = params.get("columns", [])
     return f"Standardized columns {cols}."
@@ -65,6 +101,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "log": log,
     "run": run,
 }
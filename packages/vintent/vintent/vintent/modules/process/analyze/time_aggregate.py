@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import math
 from datetime import datetime
 from typing import Any, Dict, List
 
+from vintent.modules.process import ValuesType
+from vintent.modules.process.groupby import GroupBy, finite_values
+
 PROCESS_ID = "time_aggregate"
 PROCESS_PHASE = "analyze"
 REQUIRES_SHAPE = "rowwise"
@@ -36,7 +38,7 @@ def _get_period_key(dt: datetime, period: str) -> str:
         return dt.strftime("%Y-%m-%d")
 
 
-def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+def run(rows: ValuesType, params: Dict[str, Any]) -> ValuesType:
     if not rows:
         return []
 
@@ -48,41 +50,27 @@ def run(rows: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, An
     if not date_field:
         return rows
 
-    # Group by period
-    groups: Dict[str, List[Dict[str, Any]]] = {}
-    for row in rows:
-        date_val = _parse_date(row.get(date_field))
-        if date_val is None:
-            continue
-        key = _get_period_key(date_val, period)
-        groups.setdefault(key, []).append(row)
+    # Group by period, parsing each distinct date value once
+    dates = GroupBy.from_values(rows, date_field)
+    parsed = [_parse_date(value) for value in dates.keys]
+    keys = [_get_period_key(dt, period) if dt is not None else None for dt in parsed]
+    groups = dates.regroup(keys, [dt is not None for dt in parsed])
+    ordered = sorted(range(len(groups)), key=groups.keys.__getitem__)
 
     # Aggregate
     result: List[Dict[str, Any]] = []
-    for key in sorted(groups.keys()):
-        group = groups[key]
-
-        if op == "count" or not metric:
-            result.append({"period": key, "count": len(group)})
-        else:
-            values = [
-                r.get(metric) for r in group if isinstance(r.get(metric), (int, float)) and math.isfinite(r.get(metric))
-            ]
-            if not values:
-                continue
-
-            if op == "sum":
-                agg = sum(values)
-            elif op == "mean":
-                agg = sum(values) / len(values)
-            elif op == "min":
-                agg = min(values)
-            elif op == "max":
-                agg = max(values)
-            else:
-                agg = sum(values)
-
-            result.append({"period": key, metric: agg})
+    if op == "count" or not metric:
+        sizes = groups.sizes()
+        for i in ordered:
+            result.append({"period": groups.keys[i], "count": sizes[i]})
+        return result
+
+    agg_op = op if op in ("sum", "mean", "min", "max") else "sum"
+    stats = groups.aggregate(*finite_values(rows, metric), [agg_op])
+    for i in ordered:
+        if stats[i] is None:
+            continue
+        result.append({"period": groups.keys[i], metric: stats[i][agg_op]})
 
     return result
 
@@ -103,6 +91,7 @@ PROCESS = {
     "phase": PROCESS_PHASE,
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
+    "columnar": True,
     "log": log,
     "run": run,
 }
@@ -0,0 +1,102 @@
+"""Helpers for the vectorized paths of analyze processes.
+
+A process with a vectorized path marks itself ``columnar`` and receives
+either row dicts or a ColumnTable. It calls as_columnar to decide whether
+the vectorized path applies and otherwise falls back to its row-wise code.
+
+Vectorized paths must return exactly what the row-wise code returns (as
+rows): they only operate on float64 columns, sort stably, and reduce with
+Python's own sum/min/max over lists so floating point results match.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from vintent.modules.table import ColumnTable, RowsType
+
+# Row inputs smaller than this are cheaper to process row by row
+VECTORIZE_MIN_ROWS = 5000
+
+
+def as_columnar(
+    values: Any,
+    numeric: Sequence[str] = (),
+    keys: Sequence[str] = (),
+    convert_rows: bool = True,
+) -> Optional[ColumnTable]:
+    """Return a table to run a vectorized path on, or None to use the row path.
+
+    ColumnTable inputs are used as is. Row inputs are converted (only the
+    numeric and key fields) when convert_rows is set and there are at least
+    VECTORIZE_MIN_ROWS rows. Every numeric field must be a float64 column
+    or entirely missing.
+    """
+    if isinstance(values, ColumnTable):
+        table = values
+    elif convert_rows and len(values) >= VECTORIZE_MIN_ROWS:
+        table = _project_rows(values, numeric, keys)
+        if table is None:
+            return None
+    else:
+        return None
+    if any(float_column(table, name) is None for name in numeric):
+        return None
+    return table
+
+
+def _project_rows(rows: RowsType, numeric: Sequence[str], keys: Sequence[str]) -> Optional[ColumnTable]:
+    columns = {}
+    for name in dict.fromkeys([*numeric, *keys]):
+        values = [r.get(name) for r in rows]
+        # Mixed ints and floats would be summed differently once stored as float64
+        if name in numeric and not set(map(type, values)).issubset({float, type(None)}):
+            return None
+        columns[name] = values
+    return ColumnTable.from_columns(columns, row_count=len(rows))
+
+
+def float_column(table: ColumnTable, name: Optional[str]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Return (values, present) for a float64 field, or None if it holds other values.
+
+    A field that is missing or entirely null yields an all-False present mask.
+    """
+    if name not in table.data or table.mask[name].all():
+        n = table.row_count
+        return np.zeros(n, dtype=np.float64), np.zeros(n, dtype=bool)
+    data = table.data[name]
+    if data.dtype != np.float64:
+        return None
+    return data, ~table.mask[name]
+
+
+def finite_column(table: ColumnTable, name: Optional[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (values, finite) for a field accepted by as_columnar."""
+    values, present = float_column(table, name)
+    return values, present & np.isfinite(values)
+
+
+def sorted_order(table: ColumnTable, sort_by: str) -> Optional[np.ndarray]:
+    """Row order of sorted(rows, key=lambda r: (r.get(sort_by) is None, r.get(sort_by))).
+
+    Returns None when the values cannot be ordered consistently (NaN or
+    incomparable types), leaving the row path to reproduce the behavior.
+    """
+    if sort_by not in table.data:
+        return np.arange(table.row_count)
+    data = table.data[sort_by]
+    nulls = table.mask[sort_by]
+    present = np.flatnonzero(~nulls)
+    values = data[present]
+    if data.dtype == np.float64:
+        if np.isnan(values).any():
+            return None
+    elif any(v != v for v in values.tolist()):
+        return None
+    try:
+        order = np.argsort(values, kind="stable")
+    except TypeError:
+        return None
+    return np.concatenate([present[order], np.flatnonzero(nulls)])
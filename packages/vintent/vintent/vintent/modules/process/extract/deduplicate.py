@@ -5,6 +5,7 @@ PROCESS_ID = "deduplicate"
 PROCESS_PHASE = "extract"
 REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "rowwise"
+PROFILE_EFFECT = "rows_subset"
 
 
 def schema(profile, context=None):
@@ -92,6 +93,7 @@ PROCESS = {
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
     "schema": schema,
+    "effect": PROFILE_EFFECT,
     "log": log,
     "run": run,
 }
@@ -4,6 +4,7 @@ PROCESS_ID = "project_columns"
 PROCESS_PHASE = "extract"
 REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "rowwise"
+PROFILE_EFFECT = "columns_subset"
 
 MAX_PROJECT_COLUMNS = 100
 
@@ -65,6 +66,7 @@ PROCESS = {
     "requires_shape": REQUIRES_SHAPE,
     "produces_shape": PRODUCES_SHAPE,
     "schema": schema,
+    "effect": PROFILE_EFFECT,
     "log": log,
     "run": run,
 }
@@ -4,6 +4,7 @@ PROCESS_ID = "range_filter"
 PROCESS_PHASE = "extract"
 REQUIRES_SHAPE = "rowwise"
 PRODUCES_SHAPE = "rowwise"
+PROFILE_EFFECT = "rows_subset"
 
 
 def schema(profile, context=None):
@@ -70,6 +71,7 @@ PROCESS = {
     "produces_shape": PRODUCES_SHAPE,
     "requires_shape": REQUIRES_SHAPE,
     "schema": schema,
+    "effect": PROFILE_EFFECT,
     "log": log,
     "run": run,
 }
@@ -0,0 +1,234 @@
+"""Hash-based group-by shared by the aggregating analyze processes.
+
+Key columns are factorized once with a dict into integer group codes in
+first-seen order, so keys compare like dict keys (1 and 1.0 share a
+group). Values are then split into per-group lists with one stable sort,
+keeping row order within each group, and every requested aggregation is
+computed per group from those lists.
+
+Aggregations reduce Python lists with the builtin sum/min/max/sorted, so
+they return exactly what a row-by-row loop over the same values would.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from vintent.modules.process import ValuesType
+from vintent.modules.table import ColumnTable
+
+GroupValues = Union[np.ndarray, Sequence[Any]]
+
+
+def _mean(values: List[Any]) -> float:
+    return sum(values) / len(values)
+
+
+def _var(values: List[Any]) -> float:
+    mean = _mean(values)
+    return sum((v - mean) ** 2 for v in values) / len(values)
+
+
+def median(sorted_values: Sequence[Any]) -> Any:
+    """Median of values that are already sorted."""
+    n = len(sorted_values)
+    m = n // 2
+    if n % 2 == 1:
+        return sorted_values[m]
+    return (sorted_values[m - 1] + sorted_values[m]) / 2.0
+
+
+def quantile(sorted_values: Sequence[Any], q: float) -> Any:
+    """Linearly interpolated quantile of values that are already sorted."""
+    n = len(sorted_values)
+    if n == 1:
+        return sorted_values[0]
+    pos = q * (n - 1)
+    lo = int(math.floor(pos))
+    hi = int(math.ceil(pos))
+    if lo == hi:
+        return sorted_values[lo]
+    w = pos - lo
+    return sorted_values[lo] * (1 - w) + sorted_values[hi] * w
+
+
+# Aggregations over a group's values in row order
+AGGREGATIONS: Dict[str, Callable[[List[Any]], Any]] = {
+    "count": len,
+    "sum": sum,
+    "mean": _mean,
+    "min": min,
+    "max": max,
+    "var": _var,
+    "std": lambda values: math.sqrt(_var(values)),
+}
+
+# Aggregations over a group's values in sorted order
+SORTED_AGGREGATIONS: Dict[str, Callable[[List[Any]], Any]] = {
+    "median": median,
+}
+
+
+@dataclass
+class GroupBy:
+    """Rows assigned to groups.
+
+    Attributes:
+        codes: Group index per row, -1 for rows left out of every group.
+        keys: Key per group in first-seen order; a tuple of values for
+            multi-field keys, a plain value for a single field and () when
+            grouping by no fields.
+    """
+
+    codes: np.ndarray
+    keys: List[Any]
+
+    @classmethod
+    def from_columns(cls, columns: Sequence[Sequence[Any]], include: Optional[np.ndarray] = None) -> "GroupBy":
+        """Group rows by the values of one or more key columns.
+
+        Rows where include is False are left out and do not create groups.
+        """
+        n = len(columns[0])
+        key_values: Sequence[Any] = columns[0] if len(columns) == 1 else list(zip(*columns))
+        index: Dict[Any, int] = {}
+        if include is None:
+            codes = np.fromiter((index.setdefault(k, len(index)) for k in key_values), dtype=np.intp, count=n)
+        else:
+            codes = np.fromiter(
+                (index.setdefault(k, len(index)) if ok else -1 for k, ok in zip(key_values, include.tolist())),
+                dtype=np.intp,
+                count=n,
+            )
+        return cls(codes, list(index))
+
+    @classmethod
+    def from_values(
+        cls,
+        values: ValuesType,
+        by: Union[str, Sequence[str]],
+        include: Optional[np.ndarray] = None,
+    ) -> "GroupBy":
+        """Group rows or a table by one field name or a list of field names.
+
+        An empty list puts every row in a single group with key ().
+        """
+        names = [by] if isinstance(by, str) else list(by)
+        if not names:
+            return cls.from_columns([[()] * len(values)], include)
+        return cls.from_columns([field_values(values, name) for name in names], include)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def sizes(self) -> List[int]:
+        """Number of rows per group."""
+        return np.bincount(self.codes[self.codes >= 0], minlength=len(self.keys)).tolist()
+
+    def regroup(self, keys: Sequence[Any], include: Optional[Sequence[bool]] = None) -> "GroupBy":
+        """Merge groups by assigning each current group a new key.
+
+        Useful when the key is derived from a value (e.g. a date period):
+        the derivation then runs once per distinct value instead of per row.
+        """
+        mask = None if include is None else np.asarray(include, dtype=bool)
+        merged = GroupBy.from_columns([keys], mask)
+        if not len(self.keys):
+            return GroupBy(self.codes.copy(), merged.keys)
+        codes = np.where(self.codes >= 0, merged.codes[self.codes], -1)
+        return GroupBy(codes, merged.keys)
+
+    def split(self, values: GroupValues, include: Optional[np.ndarray] = None, sort: bool = False) -> List[List[Any]]:
+        """Split per-row values into per-group lists.
+
+        Groups keep row order unless sort is set. Rows where include is
+        False are skipped; groups left without values get an empty list.
+        """
+        selected = self.codes >= 0
+        if include is not None:
+            selected &= include
+        rows = np.flatnonzero(selected)
+        codes = self.codes[rows]
+        if isinstance(values, np.ndarray):
+            if sort:
+                # Stable sort by group, then by value within the group
+                order = rows[np.lexsort((values[rows], codes))]
+            else:
+                order = rows[np.argsort(codes, kind="stable")]
+            ordered = values[order].tolist()
+        else:
+            order = rows[np.argsort(codes, kind="stable")]
+            ordered = [values[i] for i in order.tolist()]
+        bounds = np.cumsum(np.bincount(codes, minlength=len(self.keys))).tolist()
+        groups = [ordered[start:end] for start, end in zip([0] + bounds[:-1], bounds)]
+        if sort and not isinstance(values, np.ndarray):
+            for group in groups:
+                group.sort()
+        return groups
+
+    def aggregate(
+        self,
+        values: GroupValues,
+        include: Optional[np.ndarray] = None,
+        ops: Sequence[str] = ("count",),
+        quantiles: Sequence[float] = (),
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Compute several aggregations per group in one pass over the values.
+
+        Supports the ops in AGGREGATIONS and SORTED_AGGREGATIONS; requested
+        quantiles are returned as a list under "quantiles". Groups without
+        values yield None.
+        """
+        ordered_ops = [op for op in ops if op in AGGREGATIONS]
+        sorted_ops = [op for op in ops if op in SORTED_AGGREGATIONS]
+        unknown = set(ops) - set(AGGREGATIONS) - set(SORTED_AGGREGATIONS)
+        if unknown:
+            raise ValueError(f"Unknown aggregation: {sorted(unknown)}")
+        needs_sorted = bool(sorted_ops or quantiles)
+        out: List[Optional[Dict[str, Any]]] = []
+        for group in self.split(values, include):
+            if not group:
+                out.append(None)
+                continue
+            result = {op: AGGREGATIONS[op](group) for op in ordered_ops}
+            if needs_sorted:
+                group = sorted(group)
+                result.update((op, SORTED_AGGREGATIONS[op](group)) for op in sorted_ops)
+                if quantiles:
+                    result["quantiles"] = [quantile(group, q) for q in quantiles]
+            out.append(result)
+        return out
+
+
+def field_values(values: ValuesType, name: str) -> List[Any]:
+    """Return a field as Python values, as row.get(name) would see them."""
+    if isinstance(values, ColumnTable):
+        if name not in values.data:
+            return [None] * values.row_count
+        return values.column(name)
+    return [r.get(name) for r in values]
+
+
+def finite_values(values: ValuesType, name: Optional[str]) -> Tuple[GroupValues, np.ndarray]:
+    """Return (values, finite) for a numeric field.
+
+    finite marks int and float values that are finite, matching
+    isinstance(v, (int, float)) and math.isfinite(v) on row values.
+    Numeric table columns are returned as arrays so they split without
+    converting every value first.
+    """
+    if isinstance(values, ColumnTable) and name in values.data and values.data[name].dtype != object:
+        data = values.data[name]
+        present = ~values.mask[name]
+        if data.dtype == np.float64:
+            present &= np.isfinite(data)
+        return data, present
+    column = field_values(values, name) if name is not None else [None] * len(values)
+    finite = np.fromiter(
+        (isinstance(v, (int, float)) and math.isfinite(v) for v in column), dtype=bool, count=len(column)
+    )
+    return column, finite
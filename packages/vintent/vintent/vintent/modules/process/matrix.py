@@ -0,0 +1,114 @@
+"""Pairwise covariance and correlation matrices over numeric fields.
+
+Each pair of fields uses the rows where both values are present and
+finite (pairwise-complete observations). All pairs are computed with a
+few matrix products over the column-centered data, so the cost is one
+pass over the values plus BLAS work, instead of a Python loop per pair.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from vintent.modules.table import ColumnTable, RowsType
+
+Coerce = Callable[[Any], Optional[float]]
+
+
+def numeric_matrix(
+    values: Union[RowsType, ColumnTable],
+    fields: Sequence[str],
+    coerce: Coerce,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (data, valid) arrays of shape (rows, fields).
+
+    coerce maps a value to a float, or None when the value does not count
+    as numeric. Non-finite values are treated as missing.
+    """
+    n = len(values)
+    # Column-major, since the arrays are filled one field at a time
+    data = np.zeros((n, len(fields)), dtype=np.float64, order="F")
+    valid = np.zeros((n, len(fields)), dtype=bool, order="F")
+    for j, name in enumerate(fields):
+        if isinstance(values, ColumnTable):
+            if name not in values.data:
+                continue
+            arr = values.data[name]
+            if arr.dtype != object:
+                data[:, j] = arr
+                valid[:, j] = ~values.mask[name]
+                continue
+            column = values.column(name)
+        else:
+            column = [r.get(name) for r in values]
+        converted = [coerce(v) for v in column]
+        valid[:, j] = [v is not None for v in converted]
+        data[:, j] = [0.0 if v is None else v for v in converted]
+    valid &= np.isfinite(data)
+    data[~valid] = 0.0
+    return data, valid
+
+
+def pairwise_comoments(data: np.ndarray, valid: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Return (n, comoment, sq_x, sq_y) matrices for every pair of columns.
+
+    For columns i and j over their complete rows: n[i, j] counts the rows,
+    comoment[i, j] is the sum of (x_i - mean_i) * (x_j - mean_j), and
+    sq_x[i, j] / sq_y[i, j] are the sums of squared deviations of column
+    i / column j. Means are taken over the complete rows of each pair.
+    """
+    counts = valid.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, data.sum(axis=0) / counts, 0.0)
+    # Centering by the column mean first keeps the sums below well conditioned
+    centered = data - means
+    complete = bool(valid.all())
+    if not complete:
+        centered *= valid
+    products = centered.T @ centered
+
+    if complete:
+        # Every pair shares all rows and the centered sums are zero
+        squares = np.diag(products)
+        n = np.full(products.shape, float(len(data)))
+        return n, products, np.broadcast_to(squares[:, None], n.shape), np.broadcast_to(squares, n.shape)
+
+    mask = valid.astype(np.float64)
+    n = mask.T @ mask
+    sums = centered.T @ mask
+    squares = (centered * centered).T @ mask
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        comoment = products - sums * sums.T / n
+        sq_x = squares - sums * sums / n
+    comoment[n == 0] = 0.0
+    sq_x[n == 0] = 0.0
+    sq_x = np.maximum(sq_x, 0.0)
+    return n, comoment, sq_x, sq_x.T
+
+
+def pairwise_covariance(data: np.ndarray, valid: np.ndarray, ddof: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (covariance, n); entries with n <= ddof are NaN."""
+    n, comoment, _, _ = pairwise_comoments(data, valid)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = np.where(n > ddof, comoment / (n - ddof), np.nan)
+    return cov, n
+
+
+def pairwise_correlation(data: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Return Pearson correlations; pairs without variance are 0.0."""
+    _, comoment, sq_x, sq_y = pairwise_comoments(data, valid)
+    denom = np.sqrt(sq_x * sq_y)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = np.where(denom > 0, comoment / denom, 0.0)
+    return np.clip(corr, -1.0, 1.0)
+
+
+def matrix_rows(fields: Sequence[str], matrix: np.ndarray) -> List[Dict[str, Any]]:
+    """Flatten a square matrix into x/y/value rows; NaN entries become None."""
+    values = matrix.tolist()
+    return [
+        {"x": x, "y": y, "value": None if v != v else v} for x, row in zip(fields, values) for y, v in zip(fields, row)
+    ]
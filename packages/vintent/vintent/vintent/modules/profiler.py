@@ -1,12 +1,28 @@
 import csv
 import io
+import itertools
 import math
+import re
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
-from vintent.modules.schemas import DatasetProfile, FieldInfo, FieldType
+import numpy as np
+
+from vintent.modules.schemas import DatasetProfile, FieldInfo, FieldType, ProfileEffect
+from vintent.modules.sketch import HyperLogLog, hash_values
+from vintent.modules.table import ColumnTable, TableBuilder
 
 MAX_ENUM_VALUES = 100
+DEFAULT_BATCH_SIZE = 50000
+TYPE_SNIFF_SAMPLE = 100
+# Fields with more distinct values than this switch to a cardinality sketch;
+# below it each field keeps one 8-byte hash per distinct value
+EXACT_CARDINALITY_LIMIT = 4096
+PROFILE_CHUNK_SIZE = 65536
+NUMERIC_TYPES = {int, float}
+
+# Superset of the strings float() accepts; anything else is skipped without a try/except
+NUMERIC_CANDIDATE = re.compile(r"\s*[+-]?(?:[\d_.]*\d[\d_.]*(?:[eE][+-]?[\d_]+)?|inf|infinity|nan)\s*", re.IGNORECASE)
 
 
 def profile_csv(csv_text: str) -> DatasetProfile:
@@ -25,15 +41,15 @@ def skip_comment_lines(text: str) -> str:
 
     Comment lines start with '#' or '//'.
     """
-    lines = text.split('\n')
+    lines = text.split("\n")
     start_index = 0
     for i, line in enumerate(lines):
         stripped = line.strip()
-        if stripped.startswith('#') or stripped.startswith('//'):
+        if stripped.startswith("#") or stripped.startswith("//"):
             start_index = i + 1
         else:
             break
-    return '\n'.join(lines[start_index:])
+    return "\n".join(lines[start_index:])
 
 
 def detect_delimiter(text: str) -> str:
@@ -44,11 +60,11 @@ def detect_delimiter(text: str) -> str:
     """
     # Skip comment lines before detecting delimiter
     clean_text = skip_comment_lines(text)
-    first_line = clean_text.split('\n')[0] if clean_text else ''
+    first_line = clean_text.split("\n")[0] if clean_text else ""
     # If tabs present, treat as tab-delimited
-    if '\t' in first_line:
-        return '\t'
-    return ','
+    if "\t" in first_line:
+        return "\t"
+    return ","
 
 
 def rows_from_tabular(text: str) -> List[Dict[str, Any]]:
@@ -60,17 +76,101 @@ def rows_from_tabular(text: str) -> List[Dict[str, Any]]:
     """
     clean_text = skip_comment_lines(text)
     delimiter = detect_delimiter(clean_text)
-    if delimiter == '\t':
+    if delimiter == "\t":
         return rows_from_tab(clean_text)
     return rows_from_csv(clean_text)
 
 
+def table_from_tabular(text: str, batch_size: int = DEFAULT_BATCH_SIZE) -> ColumnTable:
+    """Parse tabular data straight into a ColumnTable without building row dicts.
+
+    Follows the same rules as rows_from_tabular (comment skipping, delimiter
+    detection, col:N names for tab-delimited data).
+    """
+    return table_from_stream(io.StringIO(text), batch_size=batch_size)
+
+
+def table_from_stream(stream: Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE) -> ColumnTable:
+    """Parse a line stream (e.g. an open file) into a ColumnTable batch by batch.
+
+    Each batch is copied into growing column buffers and dropped, so peak
+    memory stays near the size of the final table.
+    """
+    builder = TableBuilder()
+    for batch in iter_tabular_batches(stream, batch_size=batch_size):
+        builder.append(batch)
+    return builder.build()
+
+
+def read_header_region(lines: Iterator[str]) -> Tuple[Optional[str], str]:
+    """Consume leading comment lines and return (first data line, delimiter).
+
+    Only the lines up to the first non-comment line are read, so the rest of
+    the stream can be parsed without ever holding the whole text in memory.
+    """
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("#") or stripped.startswith("//"):
+            continue
+        return line, "\t" if "\t" in line.split("\n")[0] else ","
+    return None, ","
+
+
+def iter_tabular_batches(stream: Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[ColumnTable]:
+    """Yield ColumnTable batches of at most batch_size rows from a line stream.
+
+    Cast cells are held as Python lists only for the current batch; each
+    batch is converted to typed arrays before the next one is read.
+    """
+    lines = iter(stream)
+    first_line, delimiter = read_header_region(lines)
+    if first_line is None:
+        return
+    is_tab = delimiter == "\t"
+    reader = csv.reader(itertools.chain([first_line], lines), delimiter=delimiter)
+
+    fieldnames: List[str] = []
+    columns: List[List[Any]] = []
+    row_count = 0
+    emitted = False
+
+    for i, r in enumerate(reader):
+        if i == 0:
+            # Tab-delimited files have no header row, CSV files do
+            fieldnames = [f"col:{j+1}" for j in range(len(r))] if is_tab else r
+            columns = [[] for _ in fieldnames]
+            if not is_tab:
+                continue
+        # csv.DictReader skips blank lines, the tab parser keeps them as empty rows
+        if not r and not is_tab:
+            continue
+        for j, col in enumerate(columns):
+            col.append(r[j] if j < len(r) else None)
+        row_count += 1
+        if row_count == batch_size:
+            yield _cast_batch(fieldnames, columns, row_count)
+            columns = [[] for _ in fieldnames]
+            row_count = 0
+            emitted = True
+
+    # Always yield at least one batch so header-only inputs keep their fields
+    if row_count or not emitted:
+        yield _cast_batch(fieldnames, columns, row_count)
+
+
+def _cast_batch(fieldnames: List[str], columns: List[List[Optional[str]]], row_count: int) -> ColumnTable:
+    return ColumnTable.from_columns(
+        {name: cast_column(cells) for name, cells in zip(fieldnames, columns)},
+        row_count=row_count,
+    )
+
+
 def rows_from_tab(tab_text: str) -> List[Dict[str, Any]]:
     """Parse tab-delimited text into list of dicts with auto-generated column names.
 
     Column names are generated as col:1, col:2, etc. (1-indexed).
     """
-    reader = csv.reader(io.StringIO(tab_text), delimiter='\t')
+    reader = csv.reader(io.StringIO(tab_text), delimiter="\t")
     rows: List[Dict[str, Any]] = []
     fieldnames: List[str] = []
 
@@ -106,70 +206,306 @@ def rows_from_csv(csv_text: str) -> List[Dict[str, Any]]:
     return rows
 
 
-def profile_rows(rows: List[Dict[str, Any]]) -> DatasetProfile:
-    if not rows:
-        return {"fields": {}, "row_count": 0}
-    row_count = len(rows)
-    raw_values: Dict[str, List[Any]] = {}
-    for row in rows:
-        for k, v in row.items():
-            raw_values.setdefault(k, []).append(v)
-    fields: Dict[str, FieldInfo] = {}
-    for key, values in raw_values.items():
-        non_null = [v for v in values if v is not None]
-        missing = row_count - len(non_null)
-        inferred_type = infer_column_type(non_null)
-        unique = list(dict.fromkeys(non_null))
-        cardinality = len(unique)
+def profile_rows(rows: Union[List[Dict[str, Any]], ColumnTable]) -> DatasetProfile:
+    if isinstance(rows, ColumnTable):
+        return profile_table(rows)
+    profiler = StreamingProfiler()
+    profiler.add_rows(rows)
+    return profiler.result()
+
+
+def profile_table(table: ColumnTable) -> DatasetProfile:
+    """Profile a ColumnTable; produces the same result as profile_rows on its rows."""
+    profiler = StreamingProfiler()
+    profiler.add_table(table)
+    return profiler.result()
+
+
+def derive_profile(
+    profile: Optional[DatasetProfile],
+    effect: ProfileEffect,
+    values: Union[List[Dict[str, Any]], ColumnTable],
+    written: Optional[Iterable[str]] = None,
+) -> DatasetProfile:
+    """Profile the output of a process, reusing the input profile where its effect allows.
+
+    Effects:
+        rows_subset: some input rows were dropped, order and columns kept
+        columns_subset: some columns were dropped, rows kept
+        columns_added: the columns in written were added or overwritten, rows
+            and other columns kept; without written the output is profiled
+            from scratch
+        new_table: anything else; the output is profiled from scratch
+    """
+    if profile is None or len(values) != profile["row_count"]:
+        return profile_rows(values)
+    old_fields = profile["fields"]
+    if effect == "rows_subset":
+        # Same row count means nothing was dropped
+        return profile
+    if effect == "columns_subset":
+        names = field_names(values)
+        if all(name in old_fields for name in names):
+            return {"fields": {name: old_fields[name] for name in names}, "row_count": profile["row_count"]}
+    if effect == "columns_added" and written is not None:
+        profiler = StreamingProfiler(skip_fields=set(old_fields) - set(written))
+        if isinstance(values, ColumnTable):
+            profiler.add_table(values)
+        else:
+            profiler.add_rows(values)
+        added = profiler.result()
+        if added["row_count"]:
+            return {"fields": {**old_fields, **added["fields"]}, "row_count": added["row_count"]}
+    return profile_rows(values)
+
+
+def field_names(values: Union[List[Dict[str, Any]], ColumnTable]) -> List[str]:
+    """Return field names in first-seen order, as profile_rows would list them."""
+    if isinstance(values, ColumnTable):
+        return values.field_names
+    names: Dict[str, None] = {}
+    for row in values:
+        names.update(dict.fromkeys(row))
+    return list(names)
+
+
+def profile_batches(batches: Iterable[ColumnTable]) -> DatasetProfile:
+    """Profile a sequence of table batches in one pass without concatenating them."""
+    profiler = StreamingProfiler()
+    for batch in batches:
+        profiler.add_table(batch)
+    return profiler.result()
+
+
+class FieldAccumulator:
+    """Single-pass summary of one field's non-null values.
+
+    Up to MAX_ENUM_VALUES distinct values are kept in first-seen order for
+    enum values. Past that, distinct values are counted exactly by their
+    stable hashes until there are more than exact_limit of them; from then
+    on a HyperLogLog sketch estimates the cardinality in fixed memory.
+    """
+
+    def __init__(self, exact_limit: int = EXACT_CARDINALITY_LIMIT):
+        self.exact_limit = exact_limit
+        self.count = 0
+        self.types: Set[type] = set()
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.values: Optional[Dict[Any, None]] = {}
+        self.hashes: Optional[np.ndarray] = None
+        self.sketch: Optional[HyperLogLog] = None
+
+    def add(self, values: List[Any], types: Optional[Set[type]] = None) -> None:
+        """Add a chunk of non-null values, optionally with their known types."""
+        if not values:
+            return
+        self.count += len(values)
+        self.types.update(types if types is not None else set(map(type, values)))
+        if self.types.issubset(NUMERIC_TYPES):
+            low, high = min(values), max(values)
+            self.min = low if self.min is None else min(self.min, low)
+            self.max = high if self.max is None else max(self.max, high)
+        if self.values is not None:
+            self.values.update(dict.fromkeys(values))
+            if len(self.values) <= MAX_ENUM_VALUES:
+                return
+            # Too many for an enum: count by hash from here on
+            values = list(self.values)
+            self.values = None
+            self.hashes = np.empty(0, dtype=np.uint64)
+        if self.hashes is not None:
+            self.hashes = np.union1d(self.hashes, hash_values(values))
+            if len(self.hashes) > self.exact_limit:
+                self.sketch = HyperLogLog()
+                self.sketch.add_hashes(self.hashes)
+                self.hashes = None
+        else:
+            self.sketch.add(values)
+
+    @property
+    def exact(self) -> bool:
+        return self.sketch is None
+
+    def result(self, row_count: int) -> FieldInfo:
+        inferred_type = type_from_types(self.types)
+        if self.values is not None:
+            cardinality = len(self.values)
+        elif self.hashes is not None:
+            cardinality = len(self.hashes)
+        else:
+            cardinality = min(self.sketch.count(), self.count)
         enum_values = None
         values_truncated = False
         if inferred_type == "nominal":
-            if cardinality <= MAX_ENUM_VALUES:
-                enum_values = unique
+            if self.values is not None:
+                enum_values = list(self.values)
             else:
                 values_truncated = True
-        num_min = None
-        num_max = None
-        if inferred_type == "quantitative" and non_null:
-            floats = [float(v) for v in non_null]
-            num_min = min(floats)
-            num_max = max(floats)
-        fields[key] = {
+        quantitative = inferred_type == "quantitative" and self.count > 0
+        return {
             "type": inferred_type,
             "cardinality": cardinality,
             "unique_ratio": cardinality / row_count,
-            "missing_ratio": missing / row_count,
-            "min": num_min,
-            "max": num_max,
+            "missing_ratio": (row_count - self.count) / row_count,
+            "min": float(self.min) if quantitative else None,
+            "max": float(self.max) if quantitative else None,
             "values": enum_values,
             "values_truncated": values_truncated,
         }
-    return {"fields": fields, "row_count": row_count}
+
+
+class StreamingProfiler:
+    """Builds a DatasetProfile from rows or table batches in a single pass.
+
+    Memory is bounded by the number of fields: values are buffered per field
+    in chunks of at most PROFILE_CHUNK_SIZE before being folded into the
+    field accumulators. Fields in skip_fields are ignored.
+    """
+
+    def __init__(self, exact_limit: int = EXACT_CARDINALITY_LIMIT, skip_fields: Optional[Set[str]] = None):
+        self.exact_limit = exact_limit
+        self.skip_fields = skip_fields or set()
+        self.fields: Dict[str, FieldAccumulator] = {}
+        self.row_count = 0
+
+    def _field(self, name: str) -> FieldAccumulator:
+        acc = self.fields.get(name)
+        if acc is None:
+            acc = self.fields[name] = FieldAccumulator(self.exact_limit)
+        return acc
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        pending: Dict[str, List[Any]] = {}
+        buffered = 0
+        for row in rows:
+            self.row_count += 1
+            for k, v in row.items():
+                values = pending.get(k)
+                if values is None:
+                    if k in self.skip_fields:
+                        continue
+                    self._field(k)
+                    values = pending[k] = []
+                if v is not None:
+                    values.append(v)
+                    buffered += 1
+            if buffered >= PROFILE_CHUNK_SIZE:
+                self._flush(pending)
+                buffered = 0
+        self._flush(pending)
+
+    def _flush(self, pending: Dict[str, List[Any]]) -> None:
+        for name, values in pending.items():
+            self.fields[name].add(values)
+            values.clear()
+
+    def add_table(self, table: ColumnTable) -> None:
+        for name in table.field_names:
+            if name in self.skip_fields:
+                continue
+            acc = self._field(name)
+            data = table.data[name]
+            nulls = table.mask[name]
+            kind = table.kinds[name]
+            for start in range(0, table.row_count, PROFILE_CHUNK_SIZE):
+                chunk = data[start : start + PROFILE_CHUNK_SIZE]
+                chunk_nulls = nulls[start : start + PROFILE_CHUNK_SIZE]
+                values = (chunk[~chunk_nulls] if chunk_nulls.any() else chunk).tolist()
+                if kind == "quantitative":
+                    types = {int} if data.dtype.kind == "i" else {float}
+                elif kind == "temporal":
+                    types = {datetime}
+                else:
+                    types = None
+                acc.add(values, types)
+        self.row_count += table.row_count
+
+    def result(self) -> DatasetProfile:
+        if not self.row_count:
+            return {"fields": {}, "row_count": 0}
+        fields = {name: acc.result(self.row_count) for name, acc in self.fields.items()}
+        return {"fields": fields, "row_count": self.row_count}
 
 
 def infer_column_type(values: List[Any]) -> FieldType:
-    if not values:
+    return type_from_types({type(v) for v in values})
+
+
+def type_from_types(types: Set[type]) -> FieldType:
+    if not types:
         return "nominal"
-    types = {type(v) for v in values}
-    if types.issubset({int, float}):
+    if types.issubset(NUMERIC_TYPES):
         return "quantitative"
     if types == {datetime}:
         return "temporal"
     return "nominal"
 
 
+def sniff_column_type(sample: List[str]) -> FieldType:
+    """Guess a column's type from a sample of non-empty raw cells."""
+    if not sample:
+        return "nominal"
+    if all(is_numeric_candidate(c) and is_numeric(c) for c in sample):
+        return "quantitative"
+    if all(not is_numeric_candidate(c) and is_date_candidate(c) and parse_date(c) for c in sample):
+        return "temporal"
+    return "nominal"
+
+
+def cast_column(cells: List[Optional[str]]) -> List[Any]:
+    """Cast a column of raw cells, equivalent to cast_value on every non-empty cell.
+
+    The column type is sniffed from a sample and the whole column is then
+    converted in bulk; cells are only cast one by one when the bulk
+    conversion hits a mismatch. Empty cells become None.
+    """
+    present = [c for c in cells if c]
+    kind = sniff_column_type(present[:TYPE_SNIFF_SAMPLE])
+    converted: Optional[List[Any]] = None
+    if kind == "quantitative":
+        try:
+            converted = [v if math.isfinite(v) else None for v in map(float, present)]
+        except ValueError:
+            converted = None
+    elif kind == "temporal":
+        try:
+            converted = [
+                cast_value(c) if is_numeric_candidate(c) else datetime.fromisoformat(c.replace("Z", "+00:00"))
+                for c in present
+            ]
+        except ValueError:
+            converted = None
+    if converted is None:
+        converted = [cast_value(c) for c in present]
+    if len(present) == len(cells):
+        return converted
+    it = iter(converted)
+    return [next(it) if c else None for c in cells]
+
+
 def cast_value(raw: str) -> Any:
-    if is_numeric(raw):
+    if is_numeric_candidate(raw) and is_numeric(raw):
         v = float(raw)
         if not math.isfinite(v):
             return None
         return v
-    dt = parse_date(raw)
-    if dt is not None:
-        return dt
+    if is_date_candidate(raw):
+        dt = parse_date(raw)
+        if dt is not None:
+            return dt
     return raw
 
 
+def is_numeric_candidate(value: str) -> bool:
+    return NUMERIC_CANDIDATE.fullmatch(value) is not None
+
+
+def is_date_candidate(value: str) -> bool:
+    # ISO 8601 strings always start with the year
+    return value[:1].isdigit()
+
+
 def is_numeric(value: str) -> bool:
     try:
         float(value)
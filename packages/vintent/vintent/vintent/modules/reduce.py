@@ -0,0 +1,201 @@
+"""Server-side data reduction for large Vega-Lite specs.
+
+Rowwise shells embed every row in the spec, so spec size and browser
+render time grow with the dataset. Before compile, a shell may reduce its
+values to a point budget with one of the strategies below:
+
+    bin_2d              Count points on a 2D grid (scatter plots).
+    downsample_lines    Largest-Triangle-Three-Buckets per series (line charts).
+    stratified_sample   Sample rows proportionally per group (strip plots).
+    box_summary         Pre-compute box plot statistics per group.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .process import ValuesType
+from .process.groupby import GroupBy, field_values, finite_values, quantile
+from .table import ColumnTable, RowsType
+
+# Maximum number of marks embedded in a spec before values are reduced
+DEFAULT_POINT_BUDGET = 5000
+
+
+@dataclass
+class Reduction:
+    """Values reduced before compile and the strategy that produced them."""
+
+    strategy: str
+    input_rows: int
+    values: RowsType
+
+    def log(self) -> str:
+        return f"Reduced {self.input_rows} rows to {len(self.values)} for display ({self.strategy})."
+
+
+def bin_2d(values: ValuesType, x: str, y: str, budget: int, color: Optional[str] = None) -> RowsType:
+    """Count points on a grid of at most budget cells (per color).
+
+    Each output row holds the cell center under the x and y field names,
+    the cell bounds as x_start/x_end/y_start/y_end, and the point count.
+    """
+    xs, x_ok = _numeric(values, x)
+    ys, y_ok = _numeric(values, y)
+    valid = x_ok & y_ok
+    if not valid.any():
+        return []
+    groups = GroupBy.from_values(values, [color] if color else [], include=valid)
+    bins = max(1, int(math.sqrt(budget / len(groups))))
+    x_edges = _edges(xs[valid], bins)
+    y_edges = _edges(ys[valid], bins)
+    x_bin = np.clip(np.searchsorted(x_edges, xs, side="right") - 1, 0, bins - 1)
+    y_bin = np.clip(np.searchsorted(y_edges, ys, side="right") - 1, 0, bins - 1)
+    cell = (groups.codes * bins + x_bin) * bins + y_bin
+    cells, counts = np.unique(cell[valid], return_counts=True)
+    out: RowsType = []
+    for c, count in zip(cells.tolist(), counts.tolist()):
+        code, rest = divmod(c, bins * bins)
+        i, j = divmod(rest, bins)
+        row: Dict[str, Any] = {
+            x: float((x_edges[i] + x_edges[i + 1]) / 2),
+            y: float((y_edges[j] + y_edges[j + 1]) / 2),
+            "x_start": float(x_edges[i]),
+            "x_end": float(x_edges[i + 1]),
+            "y_start": float(y_edges[j]),
+            "y_end": float(y_edges[j + 1]),
+            "count": count,
+        }
+        if color:
+            row[color] = groups.keys[code]
+        out.append(row)
+    return out
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: positions of threshold points to keep.
+
+    x must be sorted. The first and last points are always kept; from each
+    bucket in between, the point forming the largest triangle with the
+    previously kept point and the average of the next bucket is kept.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected.append(a)
+    selected.append(n - 1)
+    return np.asarray(selected)
+
+
+def downsample_lines(values: ValuesType, x: str, y: str, budget: int, series: Optional[str] = None) -> RowsType:
+    """Downsample each series with LTTB, sharing the budget by series size.
+
+    Rows without a numeric or datetime x and a finite y are dropped, and
+    the kept rows are returned in x order within each series.
+    """
+    xs, x_ok = _numeric(values, x)
+    ys, y_ok = _numeric(values, y)
+    valid = x_ok & y_ok
+    groups = GroupBy.from_values(values, [series] if series else [], include=valid)
+    rows = np.arange(len(values))
+    total = int(valid.sum())
+    keep: List[np.ndarray] = []
+    for members in groups.split(rows, valid):
+        idx = np.asarray(members, dtype=np.intp)
+        idx = idx[np.argsort(xs[idx], kind="stable")]
+        threshold = max(3, budget * len(idx) // max(total, 1))
+        keep.append(idx[lttb_indices(xs[idx], ys[idx], threshold)])
+    return _take(values, np.concatenate(keep) if keep else np.zeros(0, dtype=np.intp))
+
+
+def stratified_sample(values: ValuesType, by: Optional[str], budget: int, seed: int = 0) -> RowsType:
+    """Sample about budget rows, keeping each group's share and at least one row per group.
+
+    Sampling is seeded, so the same data always yields the same spec, and
+    sampled rows keep their original order.
+    """
+    groups = GroupBy.from_values(values, [by] if by else [])
+    n = len(values)
+    rng = random.Random(seed)
+    keep: List[int] = []
+    for members in groups.split(np.arange(n)):
+        k = max(1, round(budget * len(members) / n))
+        keep.extend(rng.sample(members, min(k, len(members))))
+    return _take(values, np.sort(np.asarray(keep, dtype=np.intp)))
+
+
+def box_summary(values: ValuesType, x: str, y: str, color: Optional[str] = None) -> RowsType:
+    """Box plot statistics per x (and color) group.
+
+    Whiskers extend to the most extreme values within 1.5 IQR of the
+    quartiles, as in the Vega-Lite boxplot mark.
+    """
+    data, finite = finite_values(values, y)
+    groups = GroupBy.from_values(values, [x, color] if color else [x], include=finite)
+    out: RowsType = []
+    for key, group in zip(groups.keys, groups.split(data, finite, sort=True)):
+        q1, median, q3 = (quantile(group, q) for q in (0.25, 0.5, 0.75))
+        iqr = q3 - q1
+        lower = next(v for v in group if v >= q1 - 1.5 * iqr)
+        upper = next(v for v in reversed(group) if v <= q3 + 1.5 * iqr)
+        row: Dict[str, Any] = dict(zip([x, color], key)) if color else {x: key}
+        row.update(
+            {
+                "lower": float(lower),
+                "q1": float(q1),
+                "median": float(median),
+                "q3": float(q3),
+                "upper": float(upper),
+                "count": len(group),
+            }
+        )
+        out.append(row)
+    return out
+
+
+def _numeric(values: ValuesType, name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (float values, valid) for a numeric or datetime field."""
+    if isinstance(values, ColumnTable) and name in values.data and values.data[name].dtype != object:
+        data = values.data[name].astype(np.float64)
+        return data, ~values.mask[name] & np.isfinite(data)
+    column = field_values(values, name)
+    data = np.fromiter((_as_float(v) for v in column), dtype=np.float64, count=len(column))
+    return data, np.isfinite(data)
+
+
+def _as_float(value: Any) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return math.nan
+
+
+def _edges(data: np.ndarray, bins: int) -> np.ndarray:
+    lo, hi = float(data.min()), float(data.max())
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return np.linspace(lo, hi, bins + 1)
+
+
+def _take(values: ValuesType, idx: Sequence[int]) -> RowsType:
+    if isinstance(values, ColumnTable):
+        return values.take(np.asarray(idx, dtype=np.intp)).to_rows()
+    return [values[i] for i in np.asarray(idx).tolist()]
@@ -1,12 +1,15 @@
 import importlib
 import pkgutil
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 import vintent.modules.process.analyze as analyze_pkg
 import vintent.modules.process.extract as extract_pkg
 import vintent.modules.shells as shells_pkg
 from vintent.modules.process import validate_process
-from vintent.modules.shells.base import BaseShell
+from vintent.modules.profiler import DatasetProfile
+from vintent.modules.shells.base import BaseShell, type_histogram
 
 
 def _snake_to_camel(value: str) -> str:
@@ -47,3 +50,54 @@ class PROCESSES:
 
 
 SHELLS = _discover(shells_pkg, kind="shell")
+
+
+def registry_version():
+    """Ids of all registered shells and processes, which change with the registries."""
+    return (tuple(SHELLS), tuple(PROCESSES.ANALYZE), tuple(PROCESSES.EXTRACT))
+
+
+class ShellIndex:
+    """Applicability of all shells to a profile from one type histogram.
+
+    The shells' requirement vectors (see BaseShell.requirements) are
+    stacked into one matrix, so all signatures are checked with a single
+    comparison against the profile's type histogram. Shells that override
+    is_applicable are asked directly.
+    """
+
+    def __init__(self, shells: Dict[str, BaseShell]):
+        self.ids = list(shells)
+        self.custom: List[Tuple[int, BaseShell]] = []
+        vectors: List[np.ndarray] = []
+        owners: List[int] = []
+        for i, shell in enumerate(shells.values()):
+            if type(shell).is_applicable is not BaseShell.is_applicable:
+                self.custom.append((i, shell))
+                continue
+            vectors.append(shell.requirements)
+            owners.extend([i] * len(shell.requirements))
+        self.requirements = np.vstack(vectors) if vectors else np.zeros((0, 0), dtype=np.int64)
+        self.owners = np.array(owners, dtype=np.intp)
+
+    def applicable(self, profile: DatasetProfile) -> List[str]:
+        """Ids of the shells applicable to the profile, in registry order."""
+        ok = np.zeros(len(self.ids), dtype=bool)
+        if len(self.owners):
+            met = (self.requirements <= type_histogram(profile)).all(axis=1)
+            ok[self.owners[met]] = True
+        for i, shell in self.custom:
+            ok[i] = shell.is_applicable(profile)
+        return [self.ids[i] for i in np.flatnonzero(ok)]
+
+
+_SHELL_INDEX: Optional[Tuple[Any, ShellIndex]] = None
+
+
+def shell_index() -> ShellIndex:
+    """Index of the registered shells, rebuilt when the registry changes."""
+    global _SHELL_INDEX
+    version = tuple(SHELLS.items())
+    if _SHELL_INDEX is None or _SHELL_INDEX[0] != version:
+        _SHELL_INDEX = (version, ShellIndex(SHELLS))
+    return _SHELL_INDEX[1]
@@ -0,0 +1,220 @@
+"""Rule-based routing of unambiguous requests.
+
+Requests like "histogram of age" or "scatter plot of height vs weight"
+name a shell and its fields outright. route_request() recognizes them
+without the LLM: the last user message must contain the keywords of
+exactly one shell (see BaseShell.keywords) and mention exactly as many
+dataset fields as the shell requires, of matching types. Fields are
+assigned to the required parameters in the order they are mentioned.
+
+Anything else is left to the LLM pipeline: messages that ask for
+filtering, sorting or aggregation, that contain numbers or values of a
+field, that use words other than field names, shell names and a few
+filler words (so "histogram of age for female patients" or "with log
+scale" is not routed with the qualifier dropped), or that match no or
+several shells.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from .profiler import DatasetProfile
+from .registry import SHELLS
+from .schemas import TranscriptMessageType
+from .tools import applicable_shells
+from .utility import last_user_message, matches_keyword
+
+# Words asking for extraction or aggregation, which only the LLM phases handle
+SCOPE_WORDS = frozenset(
+    [
+        "above",
+        "after",
+        "average",
+        "before",
+        "below",
+        "between",
+        "bottom",
+        "count",
+        "except",
+        "exclude",
+        "excluding",
+        "fewer",
+        "filter",
+        "first",
+        "greater",
+        "last",
+        "less",
+        "limit",
+        "max",
+        "maximum",
+        "mean",
+        "median",
+        "min",
+        "minimum",
+        "more",
+        "not",
+        "only",
+        "sample",
+        "since",
+        "sort",
+        "sorted",
+        "sum",
+        "top",
+        "total",
+        "until",
+        "where",
+        "without",
+    ]
+)
+
+# Words a routed request may contain besides field names and shell names
+FILLER_WORDS = frozenset(
+    [
+        "a",
+        "across",
+        "against",
+        "an",
+        "and",
+        "as",
+        "by",
+        "can",
+        "could",
+        "create",
+        "diagram",
+        "display",
+        "distribution",
+        "draw",
+        "for",
+        "give",
+        "graph",
+        "i",
+        "in",
+        "make",
+        "me",
+        "of",
+        "on",
+        "over",
+        "per",
+        "please",
+        "see",
+        "show",
+        "the",
+        "to",
+        "versus",
+        "visualize",
+        "vs",
+        "want",
+        "with",
+        "you",
+    ]
+)
+
+Route = Tuple[str, Dict[str, Any]]
+
+
+def _tokens(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+SHELL_WORDS = frozenset(t for shell in SHELLS.values() for t in _tokens(shell.name or ""))
+
+
+def _find_fields(tokens: List[str], profile: DatasetProfile) -> Tuple[List[str], List[Optional[str]]]:
+    """Return the fields mentioned in mention order, and the tokens left over.
+
+    Longer field names are matched first, so "age group" is not read as
+    "age". Consumed tokens are replaced by None.
+    """
+    left: List[Optional[str]] = list(tokens)
+    found: List[Tuple[int, str]] = []
+    names = [(name, _tokens(name)) for name in profile.get("fields", {})]
+    for name, parts in sorted(names, key=lambda item: -len(item[1])):
+        n = len(parts)
+        if not n:
+            continue
+        for i in range(len(left) - n + 1):
+            if left[i : i + n] == parts:
+                found.append((i, name))
+                left[i : i + n] = [None] * n
+                break
+    return [name for _, name in sorted(found)], left
+
+
+def _words(left: List[Optional[str]]) -> List[str]:
+    """Leftover tokens plus adjacent pairs joined, so "box plot" matches "boxplot"."""
+    words = [t for t in left if t is not None]
+    for a, b in zip(left, left[1:]):
+        if a is not None and b is not None:
+            words.append(a + b)
+    return words
+
+
+def _is_known(word: str) -> bool:
+    """True for filler words, shell name words and (misspelled) shell keywords."""
+    if word in FILLER_WORDS or word in SHELL_WORDS:
+        return True
+    return any(matches_keyword(word, k) for shell in SHELLS.values() for k in getattr(shell, "keywords", []) or [])
+
+
+def _mentions_value(left: List[Optional[str]], profile: DatasetProfile) -> bool:
+    """True if the leftover tokens contain a listed value of a field, e.g. "berlin"."""
+    for meta in profile.get("fields", {}).values():
+        for value in meta.get("values") or []:
+            parts = _tokens(str(value))
+            n = len(parts)
+            if n and any(left[i : i + n] == parts for i in range(len(left) - n + 1)):
+                return True
+    return False
+
+
+def _assign(shell: Any, fields: List[str], profile: DatasetProfile) -> Optional[Dict[str, Any]]:
+    """Assign mentioned fields to the shell's required parameters, or None."""
+    required = shell.required or {}
+    if len(fields) != len(required):
+        return None
+    types = {name: meta.get("type") or "nominal" for name, meta in profile.get("fields", {}).items()}
+    unused = list(fields)
+    params: Dict[str, Any] = {}
+    for param, spec in required.items():
+        expected = spec.get("type")
+        if not expected:
+            return None
+        match = next((f for f in unused if expected == "any" or types[f] == expected), None)
+        if match is None:
+            return None
+        params[param] = match
+        unused.remove(match)
+    return params
+
+
+def route_request(
+    transcripts: List[TranscriptMessageType],
+    profile: DatasetProfile,
+) -> Optional[Route]:
+    """Return (shell_id, params) if the request is unambiguous, otherwise None."""
+    message = last_user_message(transcripts)
+    if not message or not profile:
+        return None
+
+    fields, left = _find_fields(_tokens(message), profile)
+    words = _words(left)
+    if any(w in SCOPE_WORDS or w.isdigit() for w in words):
+        return None
+    if not all(_is_known(t) for t in left if t is not None) or _mentions_value(left, profile):
+        return None
+
+    applicable = applicable_shells(profile)
+    routes: List[Route] = []
+    for shell_id, shell in SHELLS.items():
+        keywords = getattr(shell, "keywords", []) or []
+        if not any(matches_keyword(w, k) for w in words for k in keywords):
+            continue
+        params = _assign(shell, fields, profile)
+        if params is not None and shell_id in applicable:
+            routes.append((shell_id, params))
+    return routes[0] if len(routes) == 1 else None
+
+
+__all__ = ["FILLER_WORDS", "SCOPE_WORDS", "SHELL_WORDS", "route_request"]
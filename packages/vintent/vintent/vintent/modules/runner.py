@@ -1,12 +1,18 @@
 import logging
 from typing import Any, Dict, List
 
+from vintent.core.client import http
+from vintent.core.response_cache import get_response_cache
+
+from .channel import DATA_CHANNELS
 from .pipeline import (
+    CachingCompletionsProvider,
     DefaultCompletionsProvider,
     PipelineContext,
     RateLimitedCompletionsProvider,
     create_pipeline,
 )
+from .reduce import DEFAULT_POINT_BUDGET
 from .schemas import TranscriptMessageType
 
 logger = logging.getLogger(__name__)
@@ -17,20 +23,53 @@ class Runner:
 
     This class provides a simple interface to run the visualization pipeline.
     For more control over individual phases, use the Pipeline class directly.
+
+    HTTP connections are pooled per process and kept open between runs.
+    Call close() (or use the runner as an async context manager) on
+    shutdown to release them. The pool is shared by every runner in the
+    process, so closing one runner closes it for all of them.
     """
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.provider = self._create_provider(config)
         self.pipeline_combine = config.get("ai_pipeline_combine", False)
+        self.pipeline_parallel = config.get("ai_pipeline_parallel", False)
+        self.fill_candidates = config.get("ai_fill_candidates") or 0
+        self.fast_path = config.get("ai_fast_path", False)
+        self.snapshot_dir = config.get("dataset_snapshot_dir")
+        # Unset means the default budget; 0 disables reduction
+        point_budget = config.get("point_budget")
+        self.point_budget = DEFAULT_POINT_BUDGET if point_budget is None else point_budget or None
+        self.data_channel = config.get("data_channel") or "inline"
+        if self.data_channel not in DATA_CHANNELS:
+            raise ValueError(f"Unknown data channel: {self.data_channel}")
+        http.configure(
+            pool_size=config.get("http_pool_size"),
+            keepalive_timeout=config.get("http_keepalive_timeout"),
+        )
+
+    async def __aenter__(self) -> "Runner":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the process-wide pool of HTTP connections."""
+        await http.close()
 
     def _create_provider(self, config: Dict[str, Any]):
-        """Create the completions provider, optionally with rate limiting."""
+        """Create the completions provider, optionally with rate limiting and a response cache."""
         provider = DefaultCompletionsProvider(config)
         rate_limit = config.get("ai_rate_limit")
         if rate_limit:
             logger.info(f"Rate limiting enabled: {rate_limit} requests/minute")
             provider = RateLimitedCompletionsProvider(provider, rate_limit)
+        cache = get_response_cache(config)
+        if cache is not None:
+            # Outermost, so cache hits skip the rate limiter
+            provider = CachingCompletionsProvider(provider, cache, config.get("ai_model"), config.get("ai_base_url"))
         return provider
 
     async def run(
@@ -49,6 +88,9 @@ class Runner:
                 logs: List of human-readable log messages
                 spec: The compiled visualization spec (or None if compilation failed)
                 errors: List of structured error objects (if any errors occurred)
+                datasets: With the "binary" data channel, columnar buffers
+                    (see vintent.modules.channel) keyed by the data name
+                    the spec refers to
         """
         logger.debug(f"transcripts: {transcripts}")
         logger.debug(f"pipeline_combine: {self.pipeline_combine}")
@@ -58,7 +100,15 @@ class Runner:
             file_name=file_name,
         )
 
-        pipeline = create_pipeline(self.pipeline_combine)
+        pipeline = create_pipeline(
+            self.pipeline_combine,
+            snapshot_dir=self.snapshot_dir,
+            point_budget=self.point_budget,
+            data_channel=self.data_channel,
+            parallel=self.pipeline_parallel,
+            fill_candidates=self.fill_candidates,
+            fast_path=self.fast_path,
+        )
         await pipeline.run(ctx, self.provider)
 
         return ctx.to_result()
@@ -6,6 +6,7 @@ CompletionsMessage = Dict[str, str]
 CompletionsReply = Dict[str, Any]
 
 FieldType = Literal["any", "nominal", "ordinal", "quantitative", "temporal"]
+ProfileEffect = Literal["rows_subset", "columns_subset", "columns_added", "new_table"]
 TranscriptMessageType = Dict[str, Any]
 
 
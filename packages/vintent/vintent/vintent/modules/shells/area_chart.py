@@ -11,6 +11,7 @@ class AreaChartShell(BaseShell):
     name = "Area Chart"
     description = "Filled area chart for showing trends or cumulative values over time."
     goals = ["trend"]
+    keywords = ["area"]
     semantics: Literal["rowwise", "aggregate"] = "rowwise"
 
     signatures: List[List[FieldType]] = [
@@ -22,11 +22,6 @@ class BarCountShell(BaseShell):
         "group_by": {"type": "nominal"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        return any(v.get("type") == "nominal" for v in profile.get("fields", {}).values())
-
     def processes(
         self,
         profile: DatasetProfile,
@@ -14,7 +14,7 @@ class BarSeriesShell(BaseShell):
     semantics: Literal["rowwise", "aggregate"] = "rowwise"
 
     signatures: List[List[FieldType]] = [
-        ["quantitative"],
+        ["quantitative", "quantitative"],
     ]
 
     required = {
@@ -25,12 +25,6 @@ class BarSeriesShell(BaseShell):
         "tooltip": {"type": "any"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        quantitative_fields = [f for f in profile.get("fields", {}).values() if f.get("type") == "quantitative"]
-        return len(quantitative_fields) >= 2
-
     def compile(
         self,
         params: ShellParamsType,
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
+from functools import cached_property
+from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict, Union
+
+import numpy as np
 
 from vintent.core.exceptions import AppError
+from vintent.modules.process import ValuesType
 from vintent.modules.profiler import DatasetProfile
+from vintent.modules.reduce import Reduction
 from vintent.modules.schemas import FieldType, ValidationResult
+from vintent.modules.table import ColumnTable
 
 VEGA_LITE_SCHEMA = "https://vega.github.io/schema/vega-lite/v6.json"
 
@@ -15,6 +21,41 @@ class ShellError(AppError):
     code = "SHELL_ERROR"
 
 
+# Columns of requirement vectors and type histograms; "any" counts all fields
+FIELD_TYPES: Tuple[str, ...] = ("nominal", "ordinal", "quantitative", "temporal", "any")
+_TYPE_INDEX = {t: i for i, t in enumerate(FIELD_TYPES)}
+
+
+def type_histogram(profile: DatasetProfile) -> np.ndarray:
+    """Number of profile fields per type, in FIELD_TYPES order."""
+    counts = np.zeros(len(FIELD_TYPES), dtype=np.int64)
+    fields = profile.get("fields", {})
+    for meta in fields.values():
+        i = _TYPE_INDEX.get(meta.get("type") or "nominal")
+        if i is not None:
+            counts[i] += 1
+    counts[-1] = len(fields)
+    return counts
+
+
+def requirement_vectors(signatures: Optional[List[List[FieldType]]]) -> np.ndarray:
+    """Compile signatures into one row of field counts per signature.
+
+    A profile satisfies a signature if its type histogram is at least the
+    signature's row in every column. No signatures compile to a single row
+    of zeros, which every profile satisfies.
+    """
+    if not signatures:
+        return np.zeros((1, len(FIELD_TYPES)), dtype=np.int64)
+    vectors = np.zeros((len(signatures), len(FIELD_TYPES)), dtype=np.int64)
+    for row, sig in enumerate(signatures):
+        for t in sig:
+            if t not in _TYPE_INDEX:
+                raise ValueError(f"Unknown field type in shell signature: {t}")
+            vectors[row, _TYPE_INDEX[t]] += 1
+    return vectors
+
+
 EncodingMapType = Dict[str, "EncodingSpecType"]
 RendererType = Literal["vega-lite"]
 ShellParamsType = Dict[str, Any]
@@ -35,6 +76,9 @@ class BaseShell:
     # Valid goals: distribution, relationship, comparison, composition, trend, ranking, summary, outliers
     goals: List[str] = []
 
+    # Words that name this shell unambiguously (used by the rule-based router)
+    keywords: List[str] = []
+
     # metadata
     optional: Optional[EncodingMapType] = None
     required: Optional[EncodingMapType] = None
@@ -44,35 +88,57 @@ class BaseShell:
     # processes
     processes = None
 
+    # Whether compile() embeds its values unchanged as the spec's data
+    embeds_values: bool = True
+
+    @cached_property
+    def requirements(self) -> np.ndarray:
+        """Signatures compiled by requirement_vectors()."""
+        return requirement_vectors(self.signatures)
+
     def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not self.signatures:
-            return True
-
-        fields_by_type: Dict[str, List[str]] = {}
-        for name, meta in profile.get("fields", {}).items():
-            t = meta.get("type") or "nominal"
-            fields_by_type.setdefault(t, []).append(name)
-
-        for sig in self.signatures:
-            needed: Dict[str, int] = {}
-            for t in sig:
-                needed[t] = needed.get(t, 0) + 1
-
-            ok = True
-            for t, n in needed.items():
-                if t == "any":
-                    if sum(len(v) for v in fields_by_type.values()) < n:
-                        ok = False
-                        break
-                else:
-                    if len(fields_by_type.get(t, [])) < n:
-                        ok = False
-                        break
-
-            if ok:
-                return True
-
-        return False
+        """Whether the profile has the fields of at least one signature.
+
+        Shells are indexed by their signatures (see registry.ShellIndex);
+        overriding this method opts a shell out of the index.
+        """
+        return bool((self.requirements <= type_histogram(profile)).all(axis=1).any())
+
+    def reduce(self, params: ShellParamsType, values: ValuesType, budget: int) -> Optional[Reduction]:
+        """Reduce values that exceed the point budget before compile.
+
+        Shells that embed one mark per row override this with a strategy
+        from vintent.modules.reduce. Returning None embeds every value.
+        """
+        return None
+
+    def compile_reduced(
+        self,
+        params: ShellParamsType,
+        values: List[Dict[str, Any]],
+        reduction: Reduction,
+        renderer: RendererType,
+    ) -> Dict[str, Any]:
+        """Compile values returned by reduce(); by default they are compiled as rows."""
+        return self.compile(params, values, renderer)
+
+    def compile_reference(
+        self,
+        params: ShellParamsType,
+        values: ColumnTable,
+        name: str,
+        renderer: RendererType,
+    ) -> Dict[str, Any]:
+        """Compile with a named data reference in place of inline values.
+
+        The caller delivers the values under name, so rows are never built:
+        compile() only sees the first row, for shells that inspect it. Only
+        valid for shells that embed their values unchanged.
+        """
+        spec = self.compile(params, values.take(np.arange(min(1, len(values)))).to_rows(), renderer)
+        if spec:
+            spec["data"] = {"name": name}
+        return spec
 
     def validate(self, profile: DatasetProfile, params: ShellParamsType) -> ValidationResult:
         """Validate shell parameters against the dataset profile.
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
 
+from ..process import ValuesType
+from ..reduce import Reduction, box_summary
 from ..schemas import DatasetProfile, FieldType, ValidationResult
 from .base import VEGA_LITE_SCHEMA, BaseShell, RendererType, ShellParamsType
 
@@ -10,6 +12,7 @@ class BoxPlotShell(BaseShell):
     name = "Box Plot"
     description = "Show distribution with quartiles, median, and outliers for a quantitative field grouped by category."
     goals = ["distribution", "comparison", "outliers"]
+    keywords = ["boxplot"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures: List[List[FieldType]] = [
@@ -53,6 +56,21 @@ class BoxPlotShell(BaseShell):
             "mark": {"type": "boxplot"},
         }
 
+    def reduce(self, params: ShellParamsType, values: ValuesType, budget: int) -> Optional[Reduction]:
+        rows = box_summary(values, params.get("x", ""), params.get("y", ""), params.get("color"))
+        return Reduction("box_summary", len(values), rows)
+
+    def compile_reduced(
+        self,
+        params: ShellParamsType,
+        values: List[Dict[str, Any]],
+        reduction: Reduction,
+        renderer: RendererType,
+    ) -> Dict[str, Any]:
+        if renderer != "vega-lite":
+            return {}
+        return compile_box_summary(params.get("x", ""), params.get("y", ""), params.get("color"), values)
+
     def validate(
         self,
         profile: DatasetProfile,
@@ -114,3 +132,34 @@ class BoxPlotShell(BaseShell):
             }
 
         return {"errors": [], "ok": True, "warnings": []}
+
+
+def compile_box_summary(x: str, y: str, color: Optional[str], values: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Draw box plots from pre-computed statistics (see reduce.box_summary)."""
+    box: Dict[str, Any] = {
+        "y": {"field": "q1", "type": "quantitative", "title": y},
+        "y2": {"field": "q3"},
+    }
+    encoding: Dict[str, Any] = {"x": {"field": x, "type": "nominal"}}
+    if color:
+        box["color"] = {"field": color, "type": "nominal"}
+        encoding["xOffset"] = {"field": color, "type": "nominal"}
+    return {
+        "$schema": VEGA_LITE_SCHEMA,
+        "data": {"values": values},
+        "encoding": encoding,
+        "layer": [
+            {
+                "mark": {"type": "rule"},
+                "encoding": {
+                    "y": {"field": "lower", "type": "quantitative", "title": y},
+                    "y2": {"field": "upper"},
+                },
+            },
+            {"mark": {"type": "bar", "size": 14}, "encoding": box},
+            {
+                "mark": {"type": "tick", "color": "white", "size": 14},
+                "encoding": {"y": {"field": "median", "type": "quantitative"}},
+            },
+        ],
+    }
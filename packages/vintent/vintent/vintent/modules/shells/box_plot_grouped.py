@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
 
+from vintent.modules.process import ValuesType
+from vintent.modules.reduce import Reduction, box_summary
 from vintent.modules.schemas import DatasetProfile, FieldType, ValidationResult
 
 from .base import VEGA_LITE_SCHEMA, BaseShell, RendererType, ShellParamsType
+from .box_plot import compile_box_summary
 
 
 class BoxPlotGroupedShell(BaseShell):
@@ -26,14 +29,6 @@ class BoxPlotGroupedShell(BaseShell):
         "color": {"type": "nominal"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        fields = profile.get("fields", {})
-        return any(v.get("type") == "nominal" for v in fields.values()) and any(
-            v.get("type") == "quantitative" for v in fields.values()
-        )
-
     def compile(
         self,
         params: ShellParamsType,
@@ -58,6 +53,21 @@ class BoxPlotGroupedShell(BaseShell):
             "encoding": encoding,
         }
 
+    def reduce(self, params: ShellParamsType, values: ValuesType, budget: int) -> Optional[Reduction]:
+        rows = box_summary(values, params["x"], params["y"], params.get("color"))
+        return Reduction("box_summary", len(values), rows)
+
+    def compile_reduced(
+        self,
+        params: ShellParamsType,
+        values: List[Dict[str, Any]],
+        reduction: Reduction,
+        renderer: RendererType,
+    ) -> Dict[str, Any]:
+        if renderer != "vega-lite":
+            return {}
+        return compile_box_summary(params["x"], params["y"], params.get("color"), values)
+
     def validate(
         self,
         profile: DatasetProfile,
@@ -11,6 +11,7 @@ class BubbleChartShell(BaseShell):
     name = "Bubble Chart"
     description = "Scatter plot with sized bubbles to show three quantitative dimensions."
     goals = ["relationship"]
+    keywords = ["bubble"]
     semantics: Literal["rowwise", "aggregate"] = "rowwise"
 
     signatures: List[List[FieldType]] = [
@@ -28,13 +29,6 @@ class BubbleChartShell(BaseShell):
         "tooltip": {"type": "any"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        fields = profile.get("fields", {})
-        quant_count = sum(1 for v in fields.values() if v.get("type") == "quantitative")
-        return quant_count >= 3
-
     def compile(
         self,
         params: ShellParamsType,
@@ -12,15 +12,13 @@ class CardinalityReportShell(BaseShell):
     name = "Column Cardinality"
     description = "Show the number of unique values per column."
     goals = ["summary"]
+    keywords = ["cardinality"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures = [
-        ["nominal", "quantitative"],
+        ["any"],
     ]
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        return bool(profile.get("fields"))
-
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         return [
             {
@@ -10,6 +10,7 @@ class DensityShell(BaseShell):
     name = "Density Plot"
     description = "Show the probability distribution of a continuous variable as a smooth curve."
     goals = ["distribution"]
+    keywords = ["density", "kde"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures: List[List[FieldType]] = [
@@ -26,14 +26,6 @@ class DivergingBarShell(BaseShell):
         "color": {"type": "nominal"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        fields = profile.get("fields", {})
-        has_nominal = any(v.get("type") == "nominal" for v in fields.values())
-        has_quant = any(v.get("type") == "quantitative" for v in fields.values())
-        return has_nominal and has_quant
-
     def compile(
         self,
         params: ShellParamsType,
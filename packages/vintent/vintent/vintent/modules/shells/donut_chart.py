@@ -12,6 +12,7 @@ class DonutChartShell(BaseShell):
     name = "Donut Chart"
     description = "Show proportions as a ring chart with a hole in the center."
     goals = ["composition"]
+    keywords = ["donut", "doughnut"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures = [
@@ -30,13 +31,6 @@ class DonutChartShell(BaseShell):
         },
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        fields = profile.get("fields", {})
-        has_nominal = any(v.get("type") == "nominal" for v in fields.values())
-        return has_nominal
-
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         op = params.get("op", "count")
         return [
@@ -15,6 +15,7 @@ class EcdfShell(BaseShell):
         "Shows the fraction of observations below a given value."
     )
     goals = ["distribution"]
+    keywords = ["ecdf"]
 
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
@@ -31,9 +32,6 @@ class EcdfShell(BaseShell):
         "group_by": {"type": "nominal"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        return any(v.get("type") == "quantitative" for v in profile.get("fields", {}).values())
-
     def processes(
         self,
         profile: DatasetProfile,
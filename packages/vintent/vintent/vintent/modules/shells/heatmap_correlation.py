@@ -15,17 +15,13 @@ class HeatmapCorrelationShell(BaseShell):
         "Best for high dimensional numeric datasets."
     )
     goals = ["relationship"]
+    keywords = ["correlation"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures: List[List[FieldType]] = [
         ["quantitative", "quantitative"],
     ]
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        return sum(1 for f in profile.get("fields", {}).values() if f.get("type") == "quantitative") >= 2
-
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         return [
             {
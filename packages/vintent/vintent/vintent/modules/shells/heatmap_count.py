@@ -15,6 +15,7 @@ class HeatmapCountShell(BaseShell):
         "Useful for contingency tables and categorical interactions."
     )
     goals = ["relationship", "distribution"]
+    keywords = ["heatmap"]
 
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
@@ -27,10 +28,6 @@ class HeatmapCountShell(BaseShell):
         "y": {"type": "nominal"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        fields = profile.get("fields", {})
-        return sum(v.get("type") == "nominal" for v in fields.values()) >= 2
-
     def processes(
         self,
         profile: DatasetProfile,
@@ -40,7 +37,7 @@ class HeatmapCountShell(BaseShell):
             {
                 "id": group_aggregate_id,
                 "params": {
-                    "group_by": params["x"],
+                    "group_by": [params["x"], params["y"]],
                     "op": "count",
                 },
             }
@@ -61,12 +58,6 @@ class HeatmapCountShell(BaseShell):
         return {
             "$schema": VEGA_LITE_SCHEMA,
             "data": {"values": values},
-            "transform": [
-                {
-                    "aggregate": [{"op": "sum", "field": "count", "as": "count"}],
-                    "groupby": [x, y],
-                }
-            ],
             "mark": {"type": "rect"},
             "encoding": {
                 "x": {"field": x, "type": "nominal"},
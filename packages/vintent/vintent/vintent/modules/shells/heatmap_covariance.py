@@ -12,6 +12,7 @@ class HeatmapCovarianceShell(BaseShell):
     name = "Covariance Heatmap"
     description = "Visualize pairwise covariance between quantitative fields as a heatmap."
     goals = ["relationship"]
+    keywords = ["covariance"]
 
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
@@ -19,11 +20,6 @@ class HeatmapCovarianceShell(BaseShell):
         ["quantitative", "quantitative"],
     ]
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        return sum(1 for f in profile.get("fields", {}).values() if f.get("type") == "quantitative") >= 2
-
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         fields = [k for k, v in profile.get("fields", {}).items() if v.get("type") == "quantitative"]
         return [
@@ -12,6 +12,7 @@ class HistogramShell(BaseShell):
     name = "Histogram"
     description = "Show frequency distribution of a quantitative field using binned bars."
     goals = ["distribution"]
+    keywords = ["histogram"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures: List[List[FieldType]] = [
@@ -26,11 +27,6 @@ class HistogramShell(BaseShell):
         "tooltip": {"type": "any"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        return any(meta.get("type") == "quantitative" for meta in profile.get("fields", {}).values())
-
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         field = params.get("field")
         if not field:
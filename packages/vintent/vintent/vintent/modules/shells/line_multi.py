@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
 
+from vintent.modules.process import ValuesType
+from vintent.modules.reduce import Reduction, downsample_lines
 from vintent.modules.schemas import DatasetProfile, FieldType, ValidationResult
 
 from .base import VEGA_LITE_SCHEMA, BaseShell, RendererType, ShellParamsType
@@ -28,14 +30,6 @@ class LineMultiShell(BaseShell):
         "strokeDash": {"type": "nominal"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        fields = profile.get("fields", {})
-        has_nominal = any(v.get("type") == "nominal" for v in fields.values())
-        has_quant = any(v.get("type") == "quantitative" for v in fields.values())
-        return has_nominal and has_quant
-
     def compile(
         self,
         params: ShellParamsType,
@@ -72,6 +66,10 @@ class LineMultiShell(BaseShell):
             "encoding": encoding,
         }
 
+    def reduce(self, params: ShellParamsType, values: ValuesType, budget: int) -> Optional[Reduction]:
+        rows = downsample_lines(values, params.get("x", ""), params.get("y", ""), budget, params.get("color"))
+        return Reduction("lttb", len(values), rows)
+
     def validate(
         self,
         profile: DatasetProfile,
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
 
+from ..process import ValuesType
+from ..reduce import Reduction, downsample_lines
 from ..schemas import DatasetProfile, FieldType, ValidationResult
 from .base import VEGA_LITE_SCHEMA, BaseShell, RendererType, ShellParamsType
 
@@ -10,6 +12,7 @@ class LineTimeShell(BaseShell):
     name = "Trend Line"
     description = "Line chart showing values over time with a temporal x-axis."
     goals = ["trend"]
+    keywords = ["line"]
     semantics: Literal["rowwise", "aggregate"] = "rowwise"
 
     signatures: List[List[FieldType]] = [
@@ -53,6 +56,10 @@ class LineTimeShell(BaseShell):
             "mark": {"type": "line"},
         }
 
+    def reduce(self, params: ShellParamsType, values: ValuesType, budget: int) -> Optional[Reduction]:
+        rows = downsample_lines(values, params.get("x", ""), params.get("y", ""), budget, params.get("color"))
+        return Reduction("lttb", len(values), rows)
+
     def validate(
         self,
         profile: DatasetProfile,
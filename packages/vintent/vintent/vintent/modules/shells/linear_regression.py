@@ -12,6 +12,7 @@ class LinearRegressionShell(BaseShell):
     name = "Linear Regression"
     description = "Scatter plot with fitted regression line showing the linear relationship between two variables."
     goals = ["relationship"]
+    keywords = ["regression"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures: List[List[FieldType]] = [
@@ -23,9 +24,6 @@ class LinearRegressionShell(BaseShell):
         "y": {"type": "quantitative"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        return sum(1 for f in profile.get("fields", {}).values() if f.get("type") == "quantitative") >= 2
-
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         return [
             {
@@ -31,12 +31,6 @@ class NormalizedStackedBarShell(BaseShell):
         },
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        fields = profile.get("fields", {})
-        nom = sum(v.get("type") == "nominal" for v in fields.values())
-        quant = any(v.get("type") == "quantitative" for v in fields.values())
-        return nom >= 2 and quant
-
     def processes(
         self,
         profile: DatasetProfile,
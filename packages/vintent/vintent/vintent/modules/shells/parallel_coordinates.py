@@ -26,12 +26,8 @@ class ParallelCoordinatesShell(BaseShell):
         "color": {"type": "nominal"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        fields = profile.get("fields", {})
-        quant_count = sum(1 for v in fields.values() if v.get("type") == "quantitative")
-        return quant_count >= 3
+    # compile() adds a row index to every row
+    embeds_values = False
 
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         # Normalize numeric fields for comparable scales
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Literal
 
 from vintent.modules.process.analyze.pca import PROCESS_ID as pca_id
-from vintent.modules.schemas import DatasetProfile, ValidationResult
+from vintent.modules.schemas import DatasetProfile, FieldType, ValidationResult
 
 from .base import VEGA_LITE_SCHEMA, BaseShell, RendererType, ShellParamsType
 
@@ -12,11 +12,12 @@ class PcaShell(BaseShell):
     name = "PCA Scatter"
     description = "Project data into principal component space and visualize PC1 vs PC2."
     goals = ["relationship"]
+    keywords = ["pca"]
     semantics: Literal["rowwise", "aggregate"] = "rowwise"
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        fields = profile.get("fields", {})
-        return sum(1 for v in fields.values() if v.get("type") == "quantitative") >= 2
+    signatures: List[List[FieldType]] = [
+        ["quantitative", "quantitative"],
+    ]
 
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         columns = [k for k, v in profile.get("fields", {}).items() if v.get("type") == "quantitative"]
@@ -12,6 +12,7 @@ class PieChartShell(BaseShell):
     name = "Pie Chart"
     description = "Show proportions of categories as slices of a pie."
     goals = ["composition"]
+    keywords = ["pie"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures = [
@@ -30,13 +31,6 @@ class PieChartShell(BaseShell):
         },
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        fields = profile.get("fields", {})
-        has_nominal = any(v.get("type") == "nominal" for v in fields.values())
-        return has_nominal
-
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         op = params.get("op", "count")
         return [
@@ -12,6 +12,7 @@ class QuantileShell(BaseShell):
     name = "Quantile Plot"
     description = "Visualize quantiles of a quantitative field, optionally grouped by category."
     goals = ["distribution"]
+    keywords = ["quantile"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures: List[List[FieldType]] = [
@@ -27,10 +28,6 @@ class QuantileShell(BaseShell):
         "group_by": {"type": "nominal"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        fields = profile.get("fields", {})
-        return any(v.get("type") == "quantitative" for v in fields.values())
-
     def processes(
         self,
         profile: DatasetProfile,
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
 
+from ..process import ValuesType
+from ..reduce import Reduction, bin_2d
 from ..schemas import DatasetProfile, FieldType, ValidationResult
 from .base import VEGA_LITE_SCHEMA, BaseShell, RendererType, ShellParamsType
 
@@ -10,6 +12,7 @@ class ScatterShell(BaseShell):
     name = "Scatter Plot"
     description = "Scatter plot for exploring relationships between two quantitative fields."
     goals = ["relationship", "outliers"]
+    keywords = ["scatter", "scatterplot"]
 
     semantics: Literal["rowwise", "aggregate"] = "rowwise"
 
@@ -54,6 +57,31 @@ class ScatterShell(BaseShell):
             "mark": {"type": "point"},
         }
 
+    def reduce(self, params: ShellParamsType, values: ValuesType, budget: int) -> Optional[Reduction]:
+        rows = bin_2d(values, params.get("x", ""), params.get("y", ""), budget, params.get("color"))
+        return Reduction("bin_2d", len(values), rows)
+
+    def compile_reduced(
+        self,
+        params: ShellParamsType,
+        values: List[Dict[str, Any]],
+        reduction: Reduction,
+        renderer: RendererType,
+    ) -> Dict[str, Any]:
+        spec = self.compile(params, values, renderer)
+        if spec:
+            # One mark per occupied grid cell, sized by the points it holds
+            spec["mark"] = {"type": "circle"}
+            spec["encoding"]["size"] = {"field": "count", "type": "quantitative", "title": "Points"}
+            spec["encoding"]["tooltip"] = [
+                {"field": "x_start", "type": "quantitative", "title": f"{params.get('x')} from"},
+                {"field": "x_end", "type": "quantitative", "title": f"{params.get('x')} to"},
+                {"field": "y_start", "type": "quantitative", "title": f"{params.get('y')} from"},
+                {"field": "y_end", "type": "quantitative", "title": f"{params.get('y')} to"},
+                {"field": "count", "type": "quantitative", "title": "Points"},
+            ]
+        return spec
+
     def validate(
         self,
         profile: DatasetProfile,
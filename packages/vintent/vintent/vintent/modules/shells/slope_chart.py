@@ -23,14 +23,6 @@ class SlopeChartShell(BaseShell):
         "value": {"type": "quantitative"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        fields = profile.get("fields", {})
-        nominal_count = sum(1 for v in fields.values() if v.get("type") == "nominal")
-        has_quant = any(v.get("type") == "quantitative" for v in fields.values())
-        return nominal_count >= 2 and has_quant
-
     def compile(
         self,
         params: ShellParamsType,
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
 
+from vintent.modules.process import ValuesType
+from vintent.modules.reduce import Reduction, stratified_sample
 from vintent.modules.schemas import DatasetProfile, FieldType, ValidationResult
 
 from .base import VEGA_LITE_SCHEMA, BaseShell, RendererType, ShellParamsType
@@ -14,6 +16,7 @@ class StripPlotShell(BaseShell):
         "optionally grouped by a categorical field. Useful for small to medium datasets."
     )
     goals = ["distribution", "outliers"]
+    keywords = ["stripplot"]
 
     semantics: Literal["rowwise", "aggregate"] = "rowwise"
 
@@ -31,9 +34,6 @@ class StripPlotShell(BaseShell):
         "color": {"type": "nominal"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        return any(v.get("type") == "quantitative" for v in profile.get("fields", {}).values())
-
     def compile(
         self,
         params: ShellParamsType,
@@ -80,6 +80,10 @@ class StripPlotShell(BaseShell):
             "encoding": encoding,
         }
 
+    def reduce(self, params: ShellParamsType, values: ValuesType, budget: int) -> Optional[Reduction]:
+        rows = stratified_sample(values, params.get("group_by") or params.get("color"), budget)
+        return Reduction("stratified_sample", len(values), rows)
+
     def validate(
         self,
         profile: DatasetProfile,
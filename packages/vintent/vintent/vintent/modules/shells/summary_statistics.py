@@ -12,16 +12,13 @@ class SummaryStatisticsShell(BaseShell):
     name = "Summary Statistics"
     description = "Show basic summary statistics for each numeric column."
     goals = ["summary"]
+    keywords = ["summary"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures = [
-        ["nominal", "quantitative"],
+        ["quantitative"],
     ]
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        fields = profile.get("fields", {})
-        return any(v.get("type") == "quantitative" for v in fields.values())
-
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         return [
             {
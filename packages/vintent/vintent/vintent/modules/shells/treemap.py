@@ -168,6 +168,7 @@ class TreemapShell(BaseShell):
     name = "Treemap"
     description = "Show hierarchical data as nested rectangles sized by value."
     goals = ["composition"]
+    keywords = ["treemap"]
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
     signatures = [
@@ -186,12 +187,8 @@ class TreemapShell(BaseShell):
         },
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        if not super().is_applicable(profile):
-            return False
-        fields = profile.get("fields", {})
-        has_nominal = any(v.get("type") == "nominal" for v in fields.values())
-        return has_nominal
+    # compile() lays out one rectangle per row
+    embeds_values = False
 
     def processes(self, profile: DatasetProfile, params: ShellParamsType):
         op = params.get("op", "count")
@@ -12,6 +12,7 @@ class ViolinPlotShell(BaseShell):
     name = "Violin Plot"
     description = "Show the distribution of a quantitative field across categories " "using mirrored density plots."
     goals = ["distribution", "comparison"]
+    keywords = ["violin"]
 
     semantics: Literal["rowwise", "aggregate"] = "aggregate"
 
@@ -28,12 +29,6 @@ class ViolinPlotShell(BaseShell):
         "color": {"type": "nominal"},
     }
 
-    def is_applicable(self, profile: DatasetProfile) -> bool:
-        fields = profile.get("fields", {})
-        return any(v.get("type") == "nominal" for v in fields.values()) and any(
-            v.get("type") == "quantitative" for v in fields.values()
-        )
-
     def processes(
         self,
         profile: DatasetProfile,
@@ -0,0 +1,158 @@
+"""On-disk columnar snapshots of parsed datasets.
+
+A snapshot stores a ColumnTable and its DatasetProfile in one file that
+is memory-mapped on load, so worker processes that share a snapshot
+directory only parse a dataset once. Layout:
+
+    MAGIC (8 bytes) | header length (uint64, little endian) | JSON header
+    | column buffers, each aligned to ALIGNMENT bytes
+
+The header holds the profile, the row count and, per field, its kind,
+encoding and buffer offsets. Quantitative fields are stored as raw int64
+or float64 buffers and loaded without copying. Nominal and temporal fields
+are dictionary-encoded: int32 codes index into a list of distinct values
+kept in the header.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .cache import DatasetKey
+from .schemas import DatasetProfile
+from .table import ColumnTable
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"VCOLSNP1"
+ALIGNMENT = 64
+SNAPSHOT_SUFFIX = ".vcol"
+
+_LENGTH = struct.Struct("<Q")
+
+
+def snapshot_path(snapshot_dir: str, key: DatasetKey) -> str:
+    """Return the snapshot file for a dataset key (path, size, mtime)."""
+    digest = hashlib.sha256("\0".join(str(part) for part in key).encode()).hexdigest()
+    return os.path.join(snapshot_dir, digest + SNAPSHOT_SUFFIX)
+
+
+def write_snapshot(path: str, table: ColumnTable, profile: DatasetProfile) -> None:
+    """Write a snapshot atomically, so concurrent readers never see partial files."""
+    columns: List[Dict[str, Any]] = []
+    buffers: List[np.ndarray] = []
+    for name in table.field_names:
+        arr = table.data[name]
+        column: Dict[str, Any] = {"name": name, "kind": table.kinds[name]}
+        if arr.dtype == object:
+            codes, dictionary = _dictionary_encode(arr, table.mask[name])
+            column.update(encoding="dictionary", dtype="int32", dictionary=dictionary)
+            buffers.append(codes)
+        else:
+            column.update(encoding="plain", dtype=arr.dtype.str)
+            buffers.append(np.ascontiguousarray(arr))
+        buffers.append(np.ascontiguousarray(table.mask[name]))
+        columns.append(column)
+
+    header = {"row_count": table.row_count, "profile": profile, "columns": columns}
+    # Offsets depend on the header length, so size the header with room for the offset digits
+    for column in columns:
+        column["offset"] = column["mask_offset"] = 0
+    start = _align(len(MAGIC) + _LENGTH.size + len(_dumps(header)) + 64 * len(columns))
+    offsets: List[int] = []
+    end = start
+    for buffer in buffers:
+        offsets.append(end)
+        end = _align(end + buffer.nbytes)
+    for i, column in enumerate(columns):
+        column["offset"], column["mask_offset"] = offsets[2 * i], offsets[2 * i + 1]
+    encoded = _dumps(header)
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(_LENGTH.pack(len(encoded)))
+            f.write(encoded)
+            for offset, buffer in zip(offsets, buffers):
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(buffer.tobytes())
+            f.write(b"\0" * (end - f.tell()))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_snapshot(path: str) -> Optional[Tuple[ColumnTable, DatasetProfile]]:
+    """Memory-map a snapshot; returns None if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        if mm[: len(MAGIC)] != MAGIC:
+            raise ValueError("bad magic")
+        (length,) = _LENGTH.unpack_from(mm, len(MAGIC))
+        start = len(MAGIC) + _LENGTH.size
+        header = json.loads(mm[start : start + length], object_hook=_decode_value)
+        row_count = header["row_count"]
+        data: Dict[str, np.ndarray] = {}
+        mask: Dict[str, np.ndarray] = {}
+        kinds = {}
+        for column in header["columns"]:
+            name = column["name"]
+            values = np.frombuffer(mm, dtype=column["dtype"], count=row_count, offset=column["offset"])
+            if column["encoding"] == "dictionary":
+                dictionary = np.empty(len(column["dictionary"]) + 1, dtype=object)
+                dictionary[:-1] = column["dictionary"]
+                values = dictionary[values]
+            data[name] = values
+            mask[name] = np.frombuffer(mm, dtype=bool, count=row_count, offset=column["mask_offset"])
+            kinds[name] = column["kind"]
+    except (ValueError, KeyError, TypeError, IndexError, struct.error) as e:
+        logger.warning(f"Ignoring unreadable dataset snapshot {path}: {e}")
+        return None
+    return ColumnTable(data, mask, kinds, row_count), header["profile"]
+
+
+def _dictionary_encode(arr: np.ndarray, nulls: np.ndarray) -> Tuple[np.ndarray, List[Any]]:
+    # Nulls point one past the end of the dictionary, where the reader puts None
+    index: Dict[Any, int] = {}
+    codes = [-1 if null else index.setdefault(v, len(index)) for v, null in zip(arr.tolist(), nulls.tolist())]
+    encoded = np.array(codes, dtype=np.int32)
+    encoded[encoded == -1] = len(index)
+    return encoded, list(index)
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _dumps(header: Dict[str, Any]) -> bytes:
+    return json.dumps(header, default=_encode_value).encode()
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    raise TypeError(f"Cannot store {type(value).__name__} in a dataset snapshot")
+
+
+def _decode_value(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and "$datetime" in obj:
+        return datetime.fromisoformat(obj["$datetime"])
+    return obj
@@ -0,0 +1,316 @@
+"""Columnar, array-backed table representation.
+
+A ColumnTable stores one NumPy array per field plus a boolean null mask,
+instead of one dict per row. It can be carried through the pipeline in
+place of ``List[Dict[str, Any]]``; row dicts are only materialized at the
+Vega-Lite boundary or for processes that only understand rows.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from vintent.modules.schemas import FieldType
+
+RowsType = List[Dict[str, Any]]
+
+# Number of values sampled per object column when estimating memory use
+NBYTES_SAMPLE = 256
+
+
+class ColumnTable:
+    """Immutable-by-convention columnar table.
+
+    Attributes:
+        data: Field name to value array. Quantitative fields use int64 or
+            float64 arrays, all other fields use object arrays.
+        mask: Field name to boolean array, True where the value is null.
+        kinds: Field name to inferred field type.
+
+    Absent keys in source rows are stored as nulls. Whether a field holds
+    non-finite floats (inf, -inf or NaN outside the null mask) is computed
+    once per field and carried over by take and with_column, so clean
+    tables are never scanned again before compile.
+    """
+
+    def __init__(
+        self,
+        data: Dict[str, np.ndarray],
+        mask: Dict[str, np.ndarray],
+        kinds: Dict[str, FieldType],
+        row_count: int,
+    ):
+        self.data = data
+        self.mask = mask
+        self.kinds = kinds
+        self.row_count = row_count
+        self._nonfinite: Dict[str, bool] = {}
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Sequence[Any]], row_count: Optional[int] = None) -> "ColumnTable":
+        """Build a table from per-field Python value lists (None marks nulls)."""
+        if row_count is None:
+            row_count = max((len(v) for v in columns.values()), default=0)
+        data: Dict[str, np.ndarray] = {}
+        mask: Dict[str, np.ndarray] = {}
+        kinds: Dict[str, FieldType] = {}
+        for name, values in columns.items():
+            values = list(values)
+            if len(values) < row_count:
+                values.extend([None] * (row_count - len(values)))
+            data[name], mask[name], kinds[name] = build_column(values)
+        return cls(data, mask, kinds, row_count)
+
+    @classmethod
+    def from_rows(cls, rows: RowsType) -> "ColumnTable":
+        """Build a table from row dicts, preserving first-seen field order."""
+        names: Dict[str, None] = {}
+        for row in rows:
+            for k in row:
+                if k not in names:
+                    names[k] = None
+        columns = {name: [row.get(name) for row in rows] for name in names}
+        return cls.from_columns(columns, row_count=len(rows))
+
+    @classmethod
+    def concat(cls, tables: Sequence["ColumnTable"]) -> "ColumnTable":
+        """Stack tables with the same fields row-wise.
+
+        Arrays are concatenated directly when every part agrees on kind and
+        dtype; otherwise the field is rebuilt so its kind is re-inferred.
+        """
+        if not tables:
+            return cls({}, {}, {}, 0)
+        if len(tables) == 1:
+            return tables[0]
+        data: Dict[str, np.ndarray] = {}
+        mask: Dict[str, np.ndarray] = {}
+        kinds: Dict[str, FieldType] = {}
+        for name in tables[0].field_names:
+            parts = [t.data[name] for t in tables]
+            same_kind = len({t.kinds[name] for t in tables}) == 1
+            if same_kind and len({p.dtype for p in parts}) == 1:
+                data[name] = np.concatenate(parts)
+                mask[name] = np.concatenate([t.mask[name] for t in tables])
+                kinds[name] = tables[0].kinds[name]
+            else:
+                values: List[Any] = []
+                for t in tables:
+                    values.extend(t.column(name))
+                data[name], mask[name], kinds[name] = build_column(values)
+        return cls(data, mask, kinds, sum(t.row_count for t in tables))
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __repr__(self) -> str:
+        return f"ColumnTable(rows={self.row_count}, fields={list(self.data)})"
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint, including the objects in object arrays."""
+        total = 0
+        for name, arr in self.data.items():
+            total += arr.nbytes + self.mask[name].nbytes
+            if arr.dtype == object and len(arr):
+                sample = arr[:: max(1, len(arr) // NBYTES_SAMPLE)][:NBYTES_SAMPLE]
+                total += int(sum(sys.getsizeof(v) for v in sample) / len(sample) * len(arr))
+        return total
+
+    @property
+    def field_names(self) -> List[str]:
+        return list(self.data.keys())
+
+    def column(self, name: str) -> List[Any]:
+        """Return a field as a Python list with None for nulls."""
+        values = self.data[name].tolist()
+        nulls = self.mask[name]
+        if nulls.any():
+            for i in np.flatnonzero(nulls).tolist():
+                values[i] = None
+        return values
+
+    def valid(self, name: str) -> np.ndarray:
+        """Return the non-null values of a field."""
+        return self.data[name][~self.mask[name]]
+
+    def take(self, indices: Union[np.ndarray, Sequence[int]]) -> "ColumnTable":
+        """Select rows by position (or boolean mask), keeping field order."""
+        idx = np.asarray(indices)
+        if idx.dtype == bool:
+            idx = np.flatnonzero(idx)
+        data = {name: arr[idx] for name, arr in self.data.items()}
+        mask = {name: m[idx] for name, m in self.mask.items()}
+        out = ColumnTable(data, mask, dict(self.kinds), int(len(idx)))
+        # A subset of a clean field is clean
+        out._nonfinite = {name: False for name, flag in self._nonfinite.items() if not flag}
+        return out
+
+    def with_column(
+        self,
+        name: str,
+        values: Union[np.ndarray, Sequence[Any]],
+        nulls: Optional[np.ndarray] = None,
+    ) -> "ColumnTable":
+        """Return a new table with a field added or replaced.
+
+        A float64 array (with an optional null mask) is used as is; any other
+        values are converted like the values passed to from_columns.
+        """
+        data = dict(self.data)
+        mask = dict(self.mask)
+        kinds = dict(self.kinds)
+        if isinstance(values, np.ndarray) and values.dtype == np.float64:
+            if nulls is None:
+                nulls = np.zeros(len(values), dtype=bool)
+            data[name], mask[name] = values, nulls
+            kinds[name] = "nominal" if nulls.all() else "quantitative"
+        else:
+            data[name], mask[name], kinds[name] = build_column(list(values))
+        out = ColumnTable(data, mask, kinds, self.row_count)
+        out._nonfinite = {k: v for k, v in self._nonfinite.items() if k != name}
+        return out
+
+    def has_nonfinite(self, name: str) -> bool:
+        """Return True if a field holds non-null inf or NaN floats."""
+        flag = self._nonfinite.get(name)
+        if flag is None:
+            flag = bool(nonfinite_mask(self.data[name], self.mask[name]).any())
+            self._nonfinite[name] = flag
+        return flag
+
+    def sanitized(self) -> "ColumnTable":
+        """Return the table with non-finite floats masked as nulls.
+
+        Returns self when no field holds non-finite values; otherwise only
+        the masks of affected fields are replaced, data arrays are shared.
+        """
+        dirty = [name for name in self.data if self.has_nonfinite(name)]
+        if not dirty:
+            return self
+        mask = dict(self.mask)
+        for name in dirty:
+            mask[name] = self.mask[name] | nonfinite_mask(self.data[name], self.mask[name])
+        out = ColumnTable(self.data, mask, self.kinds, self.row_count)
+        out._nonfinite = {name: False for name in self.data}
+        return out
+
+    def to_rows(self) -> RowsType:
+        """Materialize row dicts (every field present, None for nulls)."""
+        names = self.field_names
+        if not names:
+            return [{} for _ in range(self.row_count)]
+        columns = [self.column(name) for name in names]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+class TableBuilder:
+    """Stack tables row-wise into growing column buffers.
+
+    Gives the same table as ColumnTable.concat, but each appended table can
+    be released right away, so building from a stream of batches needs
+    about one copy of the data instead of two. Buffers double in capacity
+    as they fill and are trimmed in build().
+    """
+
+    def __init__(self) -> None:
+        self.names: Optional[List[str]] = None
+        self.data: Dict[str, np.ndarray] = {}
+        self.mask: Dict[str, np.ndarray] = {}
+        self.kinds: Dict[str, FieldType] = {}
+        self.row_count = 0
+
+    def append(self, table: ColumnTable) -> None:
+        if self.names is None:
+            self.names = table.field_names
+            for name in self.names:
+                self.data[name] = table.data[name].copy()
+                self.mask[name] = table.mask[name].copy()
+                self.kinds[name] = table.kinds[name]
+            self.row_count = table.row_count
+            return
+        start = self.row_count
+        end = start + table.row_count
+        for name in self.names:
+            part = table.data[name]
+            data = self.data[name]
+            if table.kinds[name] != self.kinds[name] or part.dtype != data.dtype:
+                # Mixed parts: re-infer the kind from every value, as concat does
+                values = self._column(name) + table.column(name)
+                self.data[name], self.mask[name], self.kinds[name] = build_column(values)
+                continue
+            if end > len(data):
+                capacity = max(end, 2 * len(data))
+                data.resize((capacity,), refcheck=False)
+                self.mask[name].resize((capacity,), refcheck=False)
+            data[start:end] = part
+            self.mask[name][start:end] = table.mask[name]
+        self.row_count = end
+
+    def _column(self, name: str) -> List[Any]:
+        values = self.data[name][: self.row_count].tolist()
+        nulls = self.mask[name][: self.row_count]
+        for i in np.flatnonzero(nulls).tolist():
+            values[i] = None
+        return values
+
+    def build(self) -> ColumnTable:
+        """Return the stacked table; the builder must not be used afterwards."""
+        if self.names is None:
+            return ColumnTable({}, {}, {}, 0)
+        for name in self.names:
+            if len(self.data[name]) != self.row_count:
+                self.data[name].resize((self.row_count,), refcheck=False)
+                self.mask[name].resize((self.row_count,), refcheck=False)
+        return ColumnTable(self.data, self.mask, self.kinds, self.row_count)
+
+
+def build_column(values: List[Any]) -> Tuple[np.ndarray, np.ndarray, FieldType]:
+    """Return (data, null mask, kind) for a list of Python values."""
+    nulls = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    types = {type(v) for v in values if v is not None}
+    if types and types.issubset({int, float}):
+        kind: FieldType = "quantitative"
+        dtype = np.int64 if types == {int} else np.float64
+        fill = 0 if dtype is np.int64 else np.nan
+        arr = np.array([fill if v is None else v for v in values], dtype=dtype)
+        return arr, nulls, kind
+    kind = "temporal" if types == {datetime} else "nominal"
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr, nulls, kind
+
+
+def nonfinite_mask(data: np.ndarray, nulls: np.ndarray) -> np.ndarray:
+    """Return True where a non-null value is a non-finite float."""
+    if data.dtype == np.float64:
+        return ~nulls & ~np.isfinite(data)
+    if data.dtype != object:
+        return np.zeros(len(data), dtype=bool)
+    mask = np.fromiter(
+        (isinstance(v, float) and not math.isfinite(v) for v in data.tolist()), dtype=bool, count=len(data)
+    )
+    return mask & ~nulls
+
+
+def is_table(values: Any) -> bool:
+    return isinstance(values, ColumnTable)
+
+
+def as_rows(values: Union[RowsType, ColumnTable]) -> RowsType:
+    """Return row dicts for either representation."""
+    if isinstance(values, ColumnTable):
+        return values.to_rows()
+    return values
+
+
+def as_table(values: Union[RowsType, ColumnTable]) -> ColumnTable:
+    """Return a ColumnTable for either representation."""
+    if isinstance(values, ColumnTable):
+        return values
+    return ColumnTable.from_rows(values)
@@ -1,13 +1,19 @@
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from vintent.core.completions import EncodedTool
 
 from .process import Process
 from .profiler import DatasetProfile
-from .registry import SHELLS
+from .registry import SHELLS, registry_version, shell_index
 
 NO_PROCESS_ID = "none"
 MAX_SHELLS = 50
 MAX_FIELDS_PER_ENCODING = 100
+TOOL_CACHE_SIZE = 256
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +44,49 @@ GOAL_DESCRIPTIONS = {
 CHOOSE_PROCESS_PREFIX = "choose_process_"
 
 
+# Tool definitions only depend on the profile fingerprint, the registries
+# and a few request details, so they are built once per combination and
+# shared as EncodedTool instances that are never modified.
+_TOOL_CACHE: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+_TOOL_CACHE_LOCK = threading.Lock()
+
+
+def profile_fingerprint(profile: DatasetProfile) -> Tuple[Any, ...]:
+    """Hashable summary of the profile parts tool definitions depend on.
+
+    Field names, types and enum values, and the row count (which bounds
+    sampling). Statistics like min and max are not part of any tool.
+    """
+    fields = tuple(
+        (name, meta.get("type"), tuple(meta.get("values") or ()))
+        for name, meta in profile.get("fields", {}).items()
+    )
+    return (fields, profile.get("row_count"))
+
+
+def _memoized(key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+    key = (registry_version(),) + key
+    with _TOOL_CACHE_LOCK:
+        if key in _TOOL_CACHE:
+            _TOOL_CACHE.move_to_end(key)
+            return _TOOL_CACHE[key]
+    value = build()
+    with _TOOL_CACHE_LOCK:
+        _TOOL_CACHE[key] = value
+        while len(_TOOL_CACHE) > TOOL_CACHE_SIZE:
+            _TOOL_CACHE.popitem(last=False)
+    return value
+
+
+def _encoded(tool: Optional[Dict[str, Any]]) -> Optional[EncodedTool]:
+    return EncodedTool(tool) if tool is not None else None
+
+
+def clear_tool_cache() -> None:
+    with _TOOL_CACHE_LOCK:
+        _TOOL_CACHE.clear()
+
+
 def build_choose_process_tools(
     processes: Dict[str, Process],
     profile: DatasetProfile,
@@ -48,7 +97,24 @@ def build_choose_process_tools(
     Avoids JSON Schema `oneOf` at the top level (rejected by Azure OpenAI)
     while preserving rigid per-variant params validation. Each tool is named
     ``choose_process_<id>``; ``get_chosen_process()`` resolves the call.
+
+    Tools are memoized per profile fingerprint, so process schemas must only
+    depend on the fingerprinted parts of the profile; context is passed to
+    them when the tools are first built.
     """
+    key = ("choose_process", tuple(sorted(processes)), profile_fingerprint(profile))
+    tools = _memoized(
+        key,
+        lambda: tuple(_encoded(tool) for tool in _build_choose_process_tools(processes, profile, context)),
+    )
+    return list(tools)
+
+
+def _build_choose_process_tools(
+    processes: Dict[str, Process],
+    profile: DatasetProfile,
+    context: Any = None,
+) -> List[Dict[str, Any]]:
     base_description = (
         "CRITICAL: Choose 'none' for 99% of requests. Only select a preprocessing step "
         "if the user EXPLICITLY uses words like 'top N', 'bottom N', 'filter', 'sort', 'sample', or 'limit'.\n\n"
@@ -141,6 +207,42 @@ def _field_names_by_type(profile: DatasetProfile) -> Dict[str, List[str]]:
     return out
 
 
+def applicable_shells(profile: DatasetProfile) -> Tuple[str, ...]:
+    """Ids of the shells applicable to a profile, in registry order."""
+    return _memoized(
+        ("applicable_shells", profile_fingerprint(profile)),
+        lambda: tuple(shell_index().applicable(profile)),
+    )
+
+
+def candidate_shells(
+    profile: DatasetProfile,
+    parsed_intent: Optional[Dict[str, Any]],
+    count: int,
+) -> List[str]:
+    """Return the ids of up to count shells most likely to be chosen.
+
+    Candidates are applicable shells whose goals include the parsed goal,
+    those listing it earlier first. Without a parsed goal there are none.
+    """
+    target_goal = parsed_intent.get("goal") if parsed_intent else None
+    if not target_goal or count <= 0:
+        return []
+    ranked = []
+    for shell_id, shell in SHELLS.items():
+        goals = getattr(shell, "goals", []) or []
+        if target_goal in goals:
+            ranked.append((goals.index(target_goal), shell_id))
+    applicable = set(applicable_shells(profile))
+    candidates: List[str] = []
+    for _, shell_id in sorted(ranked):
+        if shell_id in applicable:
+            candidates.append(shell_id)
+            if len(candidates) >= count:
+                break
+    return candidates
+
+
 def build_choose_shell_tool(
     profile: DatasetProfile,
     parsed_intent: Optional[Dict[str, Any]] = None,
@@ -151,12 +253,18 @@ def build_choose_shell_tool(
     are listed first with a [RECOMMENDED] tag.
     """
     target_goal = parsed_intent.get("goal") if parsed_intent else None
+    key = ("choose_shell", profile_fingerprint(profile), target_goal)
+    return _memoized(key, lambda: _encoded(_build_choose_shell_tool(profile, target_goal)))
+
+
+def _build_choose_shell_tool(profile: DatasetProfile, target_goal: Optional[str]) -> Optional[Dict[str, Any]]:
     compatible_shells: List[Dict[str, str]] = []
     recommended_shells: List[Dict[str, str]] = []
+    applicable = set(applicable_shells(profile))
 
     for shell_id in sorted(SHELLS.keys()):
         shell = SHELLS[shell_id]
-        if shell.is_applicable(profile):
+        if shell_id in applicable:
             description = (getattr(shell, "description", "") or "").strip()
             goals = getattr(shell, "goals", []) or []
             goals_str = f" [goals: {', '.join(goals)}]" if goals else ""
@@ -212,6 +320,23 @@ def build_fill_shell_params_tool(
     shell: Any,
     profile: DatasetProfile,
     parsed_intent: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    intent = None
+    if parsed_intent:
+        # Only the field lists affect the tool
+        intent = json.dumps(
+            [parsed_intent.get("shell_fields", []), parsed_intent.get("extract_fields", [])],
+            sort_keys=True,
+            default=str,
+        )
+    key = ("fill_shell_params", shell, profile_fingerprint(profile), intent)
+    return _memoized(key, lambda: _encoded(_build_fill_shell_params_tool(shell, profile, parsed_intent)))
+
+
+def _build_fill_shell_params_tool(
+    shell: Any,
+    profile: DatasetProfile,
+    parsed_intent: Optional[Dict[str, Any]] = None,
 ) -> Optional[Dict[str, Any]]:
     properties: Dict[str, Any] = {}
     required: List[str] = []
@@ -309,6 +434,11 @@ def build_parse_intent_tool(profile: DatasetProfile) -> Optional[Dict[str, Any]]
     - Shell fields: fields to plot in the visualization
     - Extract fields: fields for data extraction (filtering, sorting, etc.)
     """
+    key = ("parse_intent", profile_fingerprint(profile))
+    return _memoized(key, lambda: _encoded(_build_parse_intent_tool(profile)))
+
+
+def _build_parse_intent_tool(profile: DatasetProfile) -> Optional[Dict[str, Any]]:
     all_fields = list(profile.get("fields", {}).keys())
 
     if not all_fields:
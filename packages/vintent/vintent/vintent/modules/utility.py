@@ -1,25 +1,31 @@
 def user_asked_for(context, keywords):
-    if not context:
-        return False
-    last = None
-    for t in reversed(context):
-        if t.get("role") == "user" and isinstance(t.get("content"), str):
-            last = t.get("content").lower()
-            break
+    last = last_user_message(context)
     if not last:
         return False
-    words = last.split()
+    words = last.lower().split()
     for w in words:
         for k in keywords:
-            if len(k) <= 5:
-                if w == k:
-                    return True
-            else:
-                if _edit_distance_leq_one(w, k):
-                    return True
+            if matches_keyword(w, k):
+                return True
     return False
 
 
+def last_user_message(context):
+    if not context:
+        return None
+    for t in reversed(context):
+        if t.get("role") == "user" and isinstance(t.get("content"), str):
+            return t.get("content")
+    return None
+
+
+# short keywords must match exactly, longer ones tolerate one typo
+def matches_keyword(word, keyword):
+    if len(keyword) <= 5:
+        return word == keyword
+    return _edit_distance_leq_one(word, keyword)
+
+
 def _edit_distance_leq_one(a, b):
     la = len(a)
     lb = len(b)